@@ -1,6 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 import os
 from celery import Celery
+from celery.schedules import crontab
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "auth_service.settings")
 
@@ -10,4 +11,29 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 app.autodiscover_tasks()
 
-app.conf.broker_connection_retry_on_startup = True
\ No newline at end of file
+app.conf.broker_connection_retry_on_startup = True
+
+app.conf.beat_schedule = {
+    "purge-expired-records": {
+        "task": "users.tasks.purge_expired_records",
+        "schedule": crontab(minute="*/15"),
+    },
+    "relay-outbox-messages": {
+        "task": "users.tasks.relay_outbox_messages",
+        "schedule": 1.0,
+    },
+    # Safety net for batch delivery; dispatchers are normally queued on push.
+    "dispatch-verification-emails": {
+        "task": "users.tasks.dispatch_verification_emails",
+        "schedule": 10.0,
+    },
+    "record-queue-depths": {
+        "task": "users.tasks.record_queue_depths",
+        "schedule": 30.0,
+    },
+    # Creates the next key only once JWT_KEY_ROTATION_INTERVAL has passed.
+    "rotate-signing-keys": {
+        "task": "users.tasks.rotate_signing_keys",
+        "schedule": crontab(minute=0),
+    },
+}
@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from kombu import Queue
 
 load_dotenv()
 
@@ -95,11 +96,28 @@ TEMPLATES = [
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
-    'ALGORITHM': 'HS256',
+    # "RS256" or "EdDSA" sign with the rotating keys in the SigningKey table,
+    # published at /.well-known/jwks.json; "HS256" signs with SIGNING_KEY.
+    'ALGORITHM': os.getenv("JWT_ALGORITHM", "RS256"),
     'SIGNING_KEY': os.getenv("SECRET_KEY", "django-insecure-^@ws^%f(+gq+pyu-r_!_t!j8fdn9!f#n*4y7m_(^)7$3_-"),
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.auth.token.CustomTokenRefreshSerializer',
 }
 
+# How often a new signing key is created.
+JWT_KEY_ROTATION_INTERVAL = timedelta(days=int(os.getenv("JWT_KEY_ROTATION_DAYS", "30")))
+# Cache lifetime of the JWKS response in seconds, and how much longer a
+# stale copy may be served while it is refetched. A new key is published
+# for both before it starts signing, so cached key sets already know it.
+JWKS_CACHE_MAX_AGE = int(os.getenv("JWKS_CACHE_MAX_AGE", "3600"))
+JWKS_STALE_WHILE_REVALIDATE = int(os.getenv("JWKS_STALE_WHILE_REVALIDATE", "3600"))
+# Seconds a process keeps the signing keys cached. Rotations are broadcast
+# over Redis, so this only bounds staleness if Redis is down.
+SIGNING_KEY_CACHE_TTL = int(os.getenv("SIGNING_KEY_CACHE_TTL", "300"))
+# Keep accepting HS256 tokens signed with SIGNING_KEY after switching to
+# asymmetric keys. Turn off once REFRESH_TOKEN_LIFETIME has passed.
+JWT_ACCEPT_HS256_TOKENS = os.getenv("JWT_ACCEPT_HS256_TOKENS", "True") == "True"
+
 WSGI_APPLICATION = 'auth_service.wsgi.application'
 
 
@@ -166,9 +184,19 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# Authentication class for API requests. CachedJWTAuthentication loads
+# request.user from the user cache and rejects inactive users and tokens
+# issued before the last password change;
+# "rest_framework_simplejwt.authentication.JWTAuthentication" loads it from
+# the database on every request.
+JWT_AUTHENTICATION_CLASS = os.getenv(
+	"JWT_AUTHENTICATION_CLASS",
+	"users.authentication.CachedJWTAuthentication"
+)
+
 REST_FRAMEWORK = { 
 	"DEFAULT_AUTHENTICATION_CLASSES": [ 
-		"rest_framework_simplejwt.authentication.JWTAuthentication", 
+		JWT_AUTHENTICATION_CLASS, 
 	], 
 }
 
@@ -177,6 +205,108 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
+# Tasks default to fire-and-forget (see users.tasks.base.FireAndForgetTask);
+# results of tasks that opt in expire after an hour.
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_RESULT_EXPIRES = 3600
+# With late acks each worker process reserves one task at a time, so a
+# slow SMTP send does not hold back tasks another process could run.
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1"))
+# Verification codes expire after 3 minutes, so their tasks get a queue of
+# their own with dedicated workers (see start.sh). Cleanup and other bulk
+# work goes to "bulk", so a backlog there never delays code delivery.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_QUEUES = (
+    Queue("verification"),
+    Queue("default"),
+    Queue("bulk"),
+)
+CELERY_TASK_ROUTES = {
+    "users.tasks.send_verification_email": {"queue": "verification"},
+    "users.tasks.dispatch_verification_emails": {"queue": "verification"},
+    "users.tasks.relay_outbox_messages": {"queue": "verification"},
+    "users.tasks.purge_expired_records": {"queue": "bulk"},
+    "users.tasks.rebuild_token_blacklist": {"queue": "bulk"},
+    "users.tasks.record_queue_depths": {"queue": "default"},
+    "users.tasks.rotate_signing_keys": {"queue": "default"},
+}
+
+# Redis cache (shared by the rate limiter and other Redis-backed services)
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL", "redis://localhost:6379/1"),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SOCKET_CONNECT_TIMEOUT": 1,
+            "SOCKET_TIMEOUT": 1,
+        },
+    }
+}
+
+# Send-code rate limiter backend:
+# "services.auth.message_limiter.RedisMessageLimiter" or
+# "services.auth.message_limiter.DatabaseMessageLimiter"
+MESSAGE_LIMITER_BACKEND = os.getenv(
+    "MESSAGE_LIMITER_BACKEND",
+    "services.auth.message_limiter.RedisMessageLimiter"
+)
+
+# Two-tier user cache behind JWT authentication: each process keeps up to
+# USER_CACHE_LOCAL_SIZE users for USER_CACHE_LOCAL_TTL seconds in memory,
+# backed by Redis entries that expire after USER_CACHE_TTL seconds. Saves
+# and deletes are broadcast, so the TTLs only bound staleness if Redis is down.
+USER_CACHE_LOCAL_SIZE = int(os.getenv("USER_CACHE_LOCAL_SIZE", "1000"))
+USER_CACHE_LOCAL_TTL = int(os.getenv("USER_CACHE_LOCAL_TTL", "30"))
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "300"))
+
+# Seconds a process keeps the DailyMessageLimit row cached. Admin changes
+# are broadcast over Redis, so this only bounds staleness if Redis is down.
+DAILY_MESSAGE_LIMIT_CACHE_TTL = int(os.getenv("DAILY_MESSAGE_LIMIT_CACHE_TTL", "60"))
+
+# Where refresh tokens issued at login are recorded:
+# "services.auth.token_store.DatabaseRefreshTokenStore" (an OutstandingToken
+# row per login), "services.auth.token_store.RedisRefreshTokenStore" (token
+# ids per user in Redis) or "services.auth.token_store.StatelessRefreshTokenStore"
+# (not recorded). Logout blacklists tokens in every mode, and changing the
+# password revokes all of the user's tokens through the token version.
+REFRESH_TOKEN_STORE = os.getenv(
+    "REFRESH_TOKEN_STORE",
+    "services.auth.token_store.RedisRefreshTokenStore"
+)
+
+# Refresh token blacklist lookups:
+# "services.auth.token_blacklist.RedisTokenBlacklist" (revoked JTIs mirrored
+# into Redis) or "services.auth.token_blacklist.DatabaseTokenBlacklist".
+# BlacklistedToken rows are written either way and rebuild the mirror.
+TOKEN_BLACKLIST_BACKEND = os.getenv(
+    "TOKEN_BLACKLIST_BACKEND",
+    "services.auth.token_blacklist.RedisTokenBlacklist"
+)
+# Per-process Bloom filter in front of the Redis mirror. It answers most
+# "not revoked" checks without a round trip, but a missed broadcast hides a
+# revocation from a process until the filter is next rebuilt.
+TOKEN_BLACKLIST_BLOOM_FILTER = os.getenv("TOKEN_BLACKLIST_BLOOM_FILTER", "False") == "True"
+TOKEN_BLACKLIST_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_BLOOM_CAPACITY", "100000"))
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_BLOOM_ERROR_RATE", "0.001"))
+TOKEN_BLACKLIST_BLOOM_REBUILD_INTERVAL = int(os.getenv("TOKEN_BLACKLIST_BLOOM_REBUILD_INTERVAL", "60"))
+
+# Verification code store backend:
+# "services.auth.code_store.RedisCodeStore" or
+# "services.auth.code_store.DatabaseCodeStore"
+VERIFICATION_CODE_STORE = os.getenv(
+    "VERIFICATION_CODE_STORE",
+    "services.auth.code_store.RedisCodeStore"
+)
+VERIFICATION_CODE_MAX_ATTEMPTS = int(os.getenv("VERIFICATION_CODE_MAX_ATTEMPTS", "5"))
+
+# Seconds during which repeated send-code requests for the same email get
+# the first request's response instead of a new code (0 disables)
+SEND_CODE_COALESCE_WINDOW = int(os.getenv("SEND_CODE_COALESCE_WINDOW", "10"))
+
+# Batched purge of expired codes, send-code history and JWT tokens
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "10000"))
+PURGE_BATCH_SLEEP = float(os.getenv("PURGE_BATCH_SLEEP", "0.1"))
 
 # Path and URL of media files
 MEDIA_URL = "/media/" 
@@ -190,6 +320,51 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
+# Locale used for emails when the request's locale has no templates
+EMAIL_DEFAULT_LOCALE = os.getenv("EMAIL_DEFAULT_LOCALE", "en")
+
+# SMTP connection pool used by the Celery email tasks
+EMAIL_POOL_ENABLED = os.getenv("EMAIL_POOL_ENABLED", "True") == "True"
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", "4"))
+EMAIL_POOL_HEALTH_CHECK_INTERVAL = float(os.getenv("EMAIL_POOL_HEALTH_CHECK_INTERVAL", "30"))
+
+# Verification email delivery: "task" (one Celery task per email),
+# "batch" (Redis list drained by dispatch_verification_emails) or
+# "asyncio" (Redis list consumed by the run_email_worker command)
+EMAIL_DELIVERY_MODE = os.getenv("EMAIL_DELIVERY_MODE", "task")
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "100"))
+# Sends kept in flight by one asyncio email worker, and the SMTP
+# connections they share
+EMAIL_ASYNC_CONCURRENCY = int(os.getenv("EMAIL_ASYNC_CONCURRENCY", "200"))
+EMAIL_ASYNC_SMTP_CONNECTIONS = int(os.getenv("EMAIL_ASYNC_SMTP_CONNECTIONS", "10"))
+
+# Outbound email rate limits per provider, shared by all workers through
+# Redis token buckets. Keys: per_second, per_minute, per_hour, per_day.
+EMAIL_PROVIDER = os.getenv("EMAIL_PROVIDER", "gmail")
+EMAIL_RATE_LIMITS = {
+    "gmail": {
+        "per_minute": int(os.getenv("EMAIL_RATE_LIMIT_PER_MINUTE", "60")),
+        "per_day": int(os.getenv("EMAIL_RATE_LIMIT_PER_DAY", "2000")),
+    },
+}
+
+# Retries for failed verification emails: jittered exponential backoff,
+# given up once the code would expire before the next attempt
+EMAIL_MAX_RETRIES = int(os.getenv("EMAIL_MAX_RETRIES", "5"))
+EMAIL_RETRY_BACKOFF_BASE = float(os.getenv("EMAIL_RETRY_BACKOFF_BASE", "2"))
+EMAIL_RETRY_BACKOFF_MAX = float(os.getenv("EMAIL_RETRY_BACKOFF_MAX", "60"))
+
+# Request-path enqueue: broker calls time out after ENQUEUE_TIMEOUT seconds,
+# a circuit breaker fails fast after repeated failures, and emails wait in a
+# bounded in-process buffer until the broker recovers
+ENQUEUE_TIMEOUT = float(os.getenv("ENQUEUE_TIMEOUT", "0.5"))
+ENQUEUE_BREAKER_FAILURE_THRESHOLD = int(os.getenv("ENQUEUE_BREAKER_FAILURE_THRESHOLD", "3"))
+ENQUEUE_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("ENQUEUE_BREAKER_RECOVERY_TIMEOUT", "5"))
+ENQUEUE_BUFFER_SIZE = int(os.getenv("ENQUEUE_BUFFER_SIZE", "1000"))
+
+# Transactional outbox for task calls made on the request path
+EMAIL_OUTBOX_ENABLED = os.getenv("EMAIL_OUTBOX_ENABLED", "True") == "True"
+OUTBOX_RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "500"))
 
 
 # Swagger configuration
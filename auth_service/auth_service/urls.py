@@ -28,6 +28,8 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView
 )
 
+from users.views import JWKSView
+
 
 # Swagger configuration
 schema_view = get_schema_view(
@@ -79,6 +81,13 @@ urlpatterns = [
         TokenVerifyView.as_view(), 
         name="token_verify"
     ),
+
+    # Public keys for verifying tokens in other services
+    path(
+        ".well-known/jwks.json",
+        JWKSView.as_view(),
+        name="jwks"
+    ),
     
     # API paths
     path(
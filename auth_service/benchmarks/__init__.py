@@ -0,0 +1,158 @@
+"""
+Benchmarks for the email, task and authentication hot paths.
+
+Each module is a script run from the ``auth_service`` directory, e.g.::
+
+    python -m benchmarks.render_email
+
+The scripts only need the services they measure (a local SMTP stand-in,
+Redis or Postgres); none of them talk to the real email provider.
+"""
+import os
+import time
+import socket
+import asyncio
+import multiprocessing
+from contextlib import contextmanager
+from typing import Iterator
+
+
+def setup_django() -> None:
+    """
+    Configures Django with the project settings.
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "auth_service.settings")
+    django.setup()
+
+
+def report(label: str, count: int, seconds: float) -> None:
+    """
+    Prints the throughput and mean latency of a run.
+
+    Args:
+        label (str): The name of the run.
+        count (int): The number of operations.
+        seconds (float): The wall-clock duration of the run.
+    """
+    print(
+        f"{label:<28} {count:>8} ops  {seconds:8.3f}s  "
+        f"{count / seconds:12.1f} ops/s  {seconds / count * 1e6:10.1f} µs/op"
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SlowHandler:
+    """
+    aiosmtpd handler that accepts every message after a simulated delay.
+
+    ``handshake_latency`` is added to EHLO to stand in for the STARTTLS and
+    AUTH round trips of a real provider, ``send_latency`` to DATA for the
+    time the provider takes to accept a message.
+    """
+
+    def __init__(self, handshake_latency: float, send_latency: float, received) -> None:
+        self.handshake_latency = handshake_latency
+        self.send_latency = send_latency
+        self.received = received
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        await asyncio.sleep(self.handshake_latency)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.send_latency)
+        with self.received.get_lock():
+            self.received.value += 1
+        return "250 Message accepted for delivery"
+
+
+def _serve_smtp(port: int, handshake_latency: float, send_latency: float, received, ready, stop) -> None:
+    from aiosmtpd.controller import Controller
+
+    controller = Controller(
+        SlowHandler(handshake_latency, send_latency, received),
+        hostname="127.0.0.1",
+        port=port
+    )
+    controller.start()
+    ready.set()
+    stop.wait()
+    controller.stop()
+
+
+class SMTPStandIn:
+    """
+    Handle on a running SMTP stand-in.
+    """
+
+    def __init__(self, received) -> None:
+        self._received = received
+
+    @property
+    def received(self) -> int:
+        return self._received.value
+
+
+@contextmanager
+def smtp_stand_in(handshake_latency: float = 0.05, send_latency: float = 0.01) -> Iterator[SMTPStandIn]:
+    """
+    Runs a local ``aiosmtpd`` server and points the email settings at it.
+
+    The server runs in a process of its own, so it does not compete with
+    the code being measured for the GIL.
+
+    Args:
+        handshake_latency (float): Seconds added to each new connection.
+        send_latency (float): Seconds added to each message.
+
+    Yields:
+        SMTPStandIn: The server, which counts the received messages.
+    """
+    from django.test.utils import override_settings
+
+    context = multiprocessing.get_context("spawn")
+    received = context.Value("i", 0)
+    ready = context.Event()
+    stop = context.Event()
+    port = _free_port()
+    server = context.Process(
+        target=_serve_smtp,
+        args=(port, handshake_latency, send_latency, received, ready, stop),
+        daemon=True
+    )
+    server.start()
+    if not ready.wait(timeout=10):
+        server.terminate()
+        raise RuntimeError("The SMTP stand-in did not start; is aiosmtpd installed?")
+
+    try:
+        with override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=port,
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD=""
+        ):
+            yield SMTPStandIn(received)
+    finally:
+        stop.set()
+        server.join(timeout=10)
+
+
+def timed(function, *args, **kwargs) -> float:
+    """
+    Calls the function and returns how long it took, in seconds.
+    """
+    started = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - started
@@ -0,0 +1,93 @@
+"""
+Emails per second from prefork processes and from the asyncio worker.
+
+Both modes send the same verification emails to a local ``aiosmtpd``
+stand-in that adds ``--send-latency`` to every message (providers take
+around 100ms to accept one):
+
+* prefork: ``--processes`` forked processes, each sending one message at
+  a time over its own pooled connection, like a Celery prefork worker
+  running ``send_verification_email`` with ``--concurrency``;
+* asyncio: one process running ``AsyncEmailWorker`` deliveries with
+  ``--concurrency`` sends in flight over at most ``--smtp-connections``
+  connections.
+
+    python -m benchmarks.async_worker [--messages 1000] [--processes 4]
+
+Needs ``aiosmtpd`` (pip install aiosmtpd).
+"""
+import asyncio
+import argparse
+import multiprocessing
+
+from benchmarks import report, setup_django, smtp_stand_in, timed
+
+
+def _send_prefork(numbers: range) -> None:
+    from services.mail.delivery import build_verification_message
+    from services.mail.smtp_pool import get_smtp_pool, smtp_connection
+
+    for number in numbers:
+        with smtp_connection() as connection:
+            build_verification_message(
+                f"user{number}@example.com",
+                f"{number:06d}",
+                connection
+            ).send(fail_silently=False)
+    get_smtp_pool().close_all()
+
+
+def run_prefork(messages: int, processes: int) -> None:
+    chunks = [range(start, messages, processes) for start in range(processes)]
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        pool.map(_send_prefork, chunks)
+
+
+async def _send_async(messages: int, concurrency: int, smtp_connections: int) -> None:
+    from services.mail.async_worker import AsyncEmailWorker
+    from services.mail.delivery import build_verification_message
+
+    worker = AsyncEmailWorker(concurrency, smtp_connections)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send(number: int) -> None:
+        async with slots:
+            await worker._deliver(build_verification_message(
+                f"user{number}@example.com",
+                f"{number:06d}"
+            ))
+
+    await asyncio.gather(*(send(number) for number in range(messages)))
+    await worker.pool.close()
+
+
+def run_async(messages: int, concurrency: int, smtp_connections: int) -> None:
+    asyncio.run(_send_async(messages, concurrency, smtp_connections))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--smtp-connections", type=int, default=10)
+    parser.add_argument("--handshake-latency", type=float, default=0.05)
+    parser.add_argument("--send-latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    with smtp_stand_in(args.handshake_latency, args.send_latency) as handler, \
+            override_settings(EMAIL_POOL_ENABLED=True):
+        seconds = timed(run_prefork, args.messages, args.processes)
+        report(f"prefork x{args.processes}", args.messages, seconds)
+
+        seconds = timed(run_async, args.messages, args.concurrency, args.smtp_connections)
+        report(f"asyncio x1 ({args.smtp_connections} conns)", args.messages, seconds)
+
+    print(f"stand-in received {handler.received} messages")
+
+
+if __name__ == "__main__":
+    main()
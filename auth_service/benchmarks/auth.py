@@ -0,0 +1,72 @@
+"""
+Requests per second on /api/v1/users/me/ with each authentication class.
+
+Runs the view in-process through the test client against a throwaway test
+database, once with simplejwt's ``JWTAuthentication`` (one user SELECT per
+request) and once with ``CachedJWTAuthentication`` (the user cache). The
+Postgres settings come from the usual ``POSTGRES_*`` variables.
+
+    python -m benchmarks.auth [--requests 5000]
+"""
+import argparse
+from unittest import mock
+
+from benchmarks import report, setup_django, timed
+
+AUTHENTICATION_CLASSES = {
+    "database": "rest_framework_simplejwt.authentication.JWTAuthentication",
+    "user cache": "users.authentication.CachedJWTAuthentication",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import CaptureQueriesContext, setup_test_environment
+    from django.utils.module_loading import import_string
+    from rest_framework.test import APIClient
+
+    from services.auth.tokens import RefreshToken
+    from users.models import CustomUser
+    from users.views import UserProfileView
+
+    setup_test_environment()
+    runner = DiscoverRunner(verbosity=0)
+    old_config = runner.setup_databases()
+    try:
+        user = CustomUser.objects.create_user(
+            email="bench@example.com",
+            username="bench",
+            password="correct-horse-battery"
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+        def get_profile() -> None:
+            response = client.get("/api/v1/users/me/", secure=True)
+            assert response.status_code == 200, response.content
+
+        def run() -> None:
+            for _ in range(args.requests):
+                get_profile()
+
+        for label, path in AUTHENTICATION_CLASSES.items():
+            with mock.patch.object(UserProfileView, "authentication_classes", [import_string(path)]):
+                get_profile()
+                with CaptureQueriesContext(connection) as queries:
+                    get_profile()
+                query_count = len(queries)
+                seconds = timed(run)
+            report(label, args.requests, seconds)
+            print(f"{'':<28} {query_count} queries per request")
+    finally:
+        runner.teardown_databases(old_config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Per-message cost of rendering the verification email.
+
+Measures ``render_email`` (subject, text and HTML bodies from the cached,
+compiled templates) and ``build_verification_message`` (the same plus the
+``EmailMultiAlternatives``) once the template cache is warm. The target is
+below 50µs per rendered message.
+
+    python -m benchmarks.render_email [--messages 20000] [--locale en]
+"""
+import argparse
+
+from benchmarks import report, setup_django, timed
+
+TARGET_MICROSECONDS = 50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--locale", default="en")
+    args = parser.parse_args()
+
+    setup_django()
+    from services.mail.delivery import build_verification_message
+    from services.mail.templates import render_email
+
+    context = {"verification_code": "123456", "lifetime_minutes": "3"}
+    codes = [f"{number:06d}" for number in range(args.messages)]
+
+    def render() -> None:
+        for code in codes:
+            render_email("verification", {**context, "verification_code": code}, args.locale)
+
+    def build() -> None:
+        for code in codes:
+            build_verification_message("user@example.com", code, locale=args.locale)
+
+    # Warm up the template cache, then take the best of a few runs.
+    render()
+    render_seconds = min(timed(render) for _ in range(5))
+    build_seconds = min(timed(build) for _ in range(5))
+
+    report("render_email", args.messages, render_seconds)
+    report("build_verification_message", args.messages, build_seconds)
+
+    per_message = render_seconds / args.messages * 1e6
+    verdict = "OK" if per_message < TARGET_MICROSECONDS else "ABOVE TARGET"
+    print(f"render cost {per_message:.1f}µs per message, target {TARGET_MICROSECONDS}µs: {verdict}")
+
+
+if __name__ == "__main__":
+    main()
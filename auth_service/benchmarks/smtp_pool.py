@@ -0,0 +1,52 @@
+"""
+Emails per second with the SMTP connection pool on and off.
+
+Sends verification emails one after another through ``smtp_connection``,
+the way ``send_verification_email`` does, against a local ``aiosmtpd``
+stand-in. The stand-in adds ``--handshake-latency`` to every new
+connection in place of the STARTTLS and AUTH round trips of a real
+provider, and ``--send-latency`` to every message.
+
+    python -m benchmarks.smtp_pool [--messages 200] [--handshake-latency 0.05]
+
+Needs ``aiosmtpd`` (pip install aiosmtpd).
+"""
+import argparse
+
+from benchmarks import report, setup_django, smtp_stand_in, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--handshake-latency", type=float, default=0.05)
+    parser.add_argument("--send-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    from services.mail.delivery import build_verification_message
+    from services.mail.smtp_pool import get_smtp_pool, smtp_connection
+
+    def send_all() -> None:
+        for number in range(args.messages):
+            with smtp_connection() as connection:
+                build_verification_message(
+                    f"user{number}@example.com",
+                    f"{number:06d}",
+                    connection
+                ).send(fail_silently=False)
+
+    with smtp_stand_in(args.handshake_latency, args.send_latency) as handler:
+        for pooled in (False, True):
+            with override_settings(EMAIL_POOL_ENABLED=pooled):
+                seconds = timed(send_all)
+            report(f"pool {'on' if pooled else 'off'}", args.messages, seconds)
+        get_smtp_pool().close_all()
+
+    print(f"stand-in received {handler.received} messages")
+
+
+if __name__ == "__main__":
+    main()
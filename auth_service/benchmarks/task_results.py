@@ -0,0 +1,86 @@
+"""
+Tasks per second and Redis memory with and without stored task results.
+
+Runs a task shaped like ``send_verification_email`` through Celery's
+worker tracer, which executes it and writes its result the way a worker
+does. The task uses ``FireAndForgetTask`` once as is and once with
+``ignore_result=False``. Results go to the Redis at ``--redis-url``;
+the database is flushed before each run, so point it at a scratch one.
+
+    python -m benchmarks.task_results [--tasks 20000] [--redis-url redis://localhost:6379/15]
+"""
+import uuid
+import argparse
+
+import redis
+
+from benchmarks import report, setup_django, timed
+
+
+def used_memory(client) -> int | None:
+    try:
+        return client.info("memory")["used_memory"]
+    except (KeyError, redis.ResponseError):
+        # Some Redis stand-ins do not report memory and drop the connection.
+        client.connection_pool.disconnect()
+        return None
+
+
+def stored_bytes(client) -> tuple[int, int]:
+    keys = list(client.scan_iter("celery-task-meta-*", count=1000))
+    return len(keys), sum(client.strlen(key) for key in keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    args = parser.parse_args()
+
+    setup_django()
+    from celery import Celery
+    from celery.app.trace import build_tracer
+    from django.conf import settings
+
+    from users.tasks.base import FireAndForgetTask
+
+    app = Celery("benchmark", broker="memory://", backend=args.redis_url)
+    app.conf.result_expires = settings.CELERY_RESULT_EXPIRES
+
+    def send(email: str) -> str:
+        return f"Verification email sent successfully to {email}"
+
+    tasks = {
+        "ignore_result (default)": app.task(send, base=FireAndForgetTask, name="benchmark.send"),
+        "ignore_result=False": app.task(
+            send,
+            base=FireAndForgetTask,
+            name="benchmark.send_stored",
+            ignore_result=False
+        ),
+    }
+    client = redis.Redis.from_url(args.redis_url)
+
+    for label, task in tasks.items():
+        client.flushdb()
+        before = used_memory(client)
+        tracer = build_tracer(task.name, task, app=app)
+
+        def run() -> None:
+            for number in range(args.tasks):
+                task_id = str(uuid.uuid4())
+                tracer(task_id, (f"user{number}@example.com",), {}, {"id": task_id})
+
+        seconds = timed(run)
+        report(label, args.tasks, seconds)
+
+        keys, value_bytes = stored_bytes(client)
+        after = used_memory(client)
+        memory = f", used_memory +{(after - before) / 1024:.0f} KiB" if before is not None else ""
+        print(f"{'':<28} {keys} result keys, {value_bytes / 1024:.0f} KiB of values{memory}")
+
+    client.flushdb()
+
+
+if __name__ == "__main__":
+    main()
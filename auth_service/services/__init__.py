@@ -1 +1,4 @@
-from .auth import *
\ No newline at end of file
+from .auth import *
+from .mail import *
+from .outbox import *
+from .monitoring import *
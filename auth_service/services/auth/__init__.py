@@ -1,3 +1,12 @@
+from .cleanup_service import *
+from .coalesce import *
+from .code_store import *
 from .email_service import *
-from .user_services import *
+from .message_limiter import *
+from .signing_keys import *
+from .token_backend import *
+from .token_blacklist import *
+from .token_store import *
+from .tokens import *
+from .user_cache import *
 from .verification_service import *
\ No newline at end of file
@@ -0,0 +1,119 @@
+import time
+import logging
+from typing import Dict
+
+from django.db import models, transaction
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken
+)
+
+from users.models import (
+    DailyMessage,
+    DailyMessageCounter,
+    VerificationCode
+)
+
+__all__ = ["purge_in_batches", "purge_expired_records"]
+
+logger = logging.getLogger(__name__)
+
+
+def purge_in_batches(
+    queryset: models.QuerySet,
+    batch_size: int,
+    sleep_seconds: float
+) -> Dict[str, float]:
+    """
+    Deletes the rows matched by the queryset in bounded batches.
+
+    Each batch selects at most ``batch_size`` primary keys in primary key
+    order and deletes them in its own short transaction, then sleeps so the
+    cleanup never holds locks on a hot table for long. Rows that expire
+    first are also the oldest, so the primary key index finds them without
+    scanning the rest of the table.
+
+    Args:
+        queryset (QuerySet): The rows to delete.
+        batch_size (int): The maximum number of rows per transaction.
+        sleep_seconds (float): The pause between two batches.
+
+    Returns:
+        dict: The number of rows deleted, the elapsed time and the rate.
+    """
+    model = queryset.model
+    deleted_total = 0
+    started_at = time.monotonic()
+
+    while True:
+        with transaction.atomic():
+            pks = list(
+                queryset.order_by("pk").values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            deleted, _ = model.objects.filter(pk__in=pks).delete()
+            deleted_total += deleted
+
+        if len(pks) < batch_size:
+            break
+        time.sleep(sleep_seconds)
+
+    elapsed = time.monotonic() - started_at
+    rate = deleted_total / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Purged {deleted_total} {model.__name__} row(s) in {elapsed:.2f}s "
+        f"({rate:.0f} rows/s)."
+    )
+    return {
+        "deleted": deleted_total,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rate, 1)
+    }
+
+
+def purge_expired_records(batch_size: int, sleep_seconds: float) -> Dict[str, Dict[str, float]]:
+    """
+    Purges expired verification codes, stale send-code history and expired
+    refresh tokens together with their blacklist entries.
+
+    Args:
+        batch_size (int): The maximum number of rows per transaction.
+        sleep_seconds (float): The pause between two batches.
+
+    Returns:
+        dict: Per-table statistics keyed by model name.
+    """
+    current_time = now()
+    reset_time = DailyMessage.get_limit_info().reset_time
+
+    # The previous counter window is kept because it still counts for the
+    # cooldown between two codes.
+    querysets = [
+        VerificationCode.objects.filter(
+            created_at__lt=current_time - VerificationCode.LIFETIME
+        ),
+        DailyMessage.objects.filter(
+            message_sent_at__lt=current_time - reset_time
+        ),
+        DailyMessageCounter.objects.filter(
+            window_start__lt=current_time - 2 * reset_time
+        ),
+        # Blacklist rows go first so the token delete does not cascade.
+        BlacklistedToken.objects.filter(
+            token__expires_at__lt=current_time
+        ),
+        OutstandingToken.objects.filter(
+            expires_at__lt=current_time
+        ),
+    ]
+
+    results = {}
+    for queryset in querysets:
+        results[queryset.model.__name__] = purge_in_batches(
+            queryset,
+            batch_size,
+            sleep_seconds
+        )
+    return results
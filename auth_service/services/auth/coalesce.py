@@ -0,0 +1,110 @@
+import json
+import time
+import logging
+from typing import Any, Callable, Tuple
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = ["coalesce_request"]
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "coalesce"
+PENDING = b"pending"
+POLL_INTERVAL = 0.05
+# Waiting blocks a worker thread, so a duplicate only waits long enough to
+# pick up a fast first response.
+MAX_WAIT = 0.3
+
+IN_FLIGHT_RESPONSE = ({"message": "A verification code is already being sent."}, 202)
+
+
+def coalesce_request(
+    key: str,
+    handler: Callable[[], Tuple[Any, int]]
+) -> Tuple[Any, int]:
+    """
+    Runs ``handler`` once for identical requests made within the coalescing window.
+
+    The first request claims the key in Redis with ``SET NX`` and runs the
+    handler. Its response is stored under the key until the window
+    ends. Identical requests in the meantime get that response back
+    without running the handler. If it is still in flight they wait up to
+    ``MAX_WAIT`` for it and otherwise answer 202 without sending again.
+    The key lives in Redis, so this holds across all workers.
+
+    If the handler raises, the key is released so a retry is not coalesced
+    with the failure. If Redis is unavailable the handler simply runs.
+
+    Args:
+        key (str): Identifies identical requests, e.g. "send_code:<email>".
+        handler (Callable): Produces ``(data, status_code)`` for the request.
+            The data must be JSON serializable.
+
+    Returns:
+        tuple: The response data and status code.
+    """
+    window = settings.SEND_CODE_COALESCE_WINDOW
+    if window <= 0:
+        return handler()
+
+    redis_key = f"{KEY_PREFIX}:{key}"
+    try:
+        client = get_redis_connection("default")
+        acquired = client.set(redis_key, PENDING, nx=True, ex=window)
+    except RedisError:
+        logger.warning(f"Request coalescing unavailable for key: {key}")
+        return handler()
+
+    if not acquired:
+        logger.info(f"Coalescing duplicate request for key: {key}")
+        return _wait_for_response(client, redis_key, handler)
+
+    try:
+        data, status_code = handler()
+    except Exception:
+        _release(client, redis_key)
+        raise
+
+    try:
+        client.set(
+            redis_key,
+            json.dumps({"data": data, "status": status_code}),
+            xx=True,
+            keepttl=True
+        )
+    except RedisError:
+        logger.warning(f"Failed to store coalesced response for key: {key}")
+
+    return data, status_code
+
+
+def _wait_for_response(
+    client,
+    redis_key: str,
+    handler: Callable[[], Tuple[Any, int]]
+) -> Tuple[Any, int]:
+    deadline = time.monotonic() + MAX_WAIT
+    try:
+        while time.monotonic() < deadline:
+            raw = client.get(redis_key)
+            if raw is None:
+                # The first request failed or the window ended.
+                return handler()
+            if raw != PENDING:
+                response = json.loads(raw)
+                return response["data"], response["status"]
+            time.sleep(POLL_INTERVAL)
+    except RedisError:
+        logger.warning(f"Lost Redis while waiting for coalesced response: {redis_key}")
+
+    return IN_FLIGHT_RESPONSE
+
+
+def _release(client, redis_key: str) -> None:
+    try:
+        client.delete(redis_key)
+    except RedisError:
+        logger.warning(f"Failed to release coalescing key: {redis_key}")
@@ -0,0 +1,237 @@
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from users.models import VerificationCode
+
+__all__ = [
+    "BaseCodeStore",
+    "DatabaseCodeStore",
+    "RedisCodeStore",
+    "get_code_store"
+]
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] - pointer to the email's current code
+# KEYS[2] - key of the new code
+# KEYS[3] - attempt counter for the email
+# ARGV[1] - code key prefix for the email
+# ARGV[2] - the new code
+# ARGV[3] - code lifetime (s)
+SAVE_CODE_SCRIPT = """
+local previous = redis.call("GET", KEYS[1])
+if previous then
+    redis.call("DEL", ARGV[1] .. previous)
+end
+redis.call("SET", KEYS[2], 1, "EX", ARGV[3])
+redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+redis.call("DEL", KEYS[3])
+"""
+
+
+class BaseCodeStore:
+    """
+    Base class for verification code storage backends.
+
+    A store keeps at most one active code per email. Codes expire after
+    ``VerificationCode.LIFETIME`` and can be consumed only once.
+    """
+
+    def save(self, email: str, code: str) -> None:
+        """
+        Stores a new code for the email, replacing any previous unused code.
+
+        Args:
+            email (str): The email address the code is sent to.
+            code (str): The generated verification code.
+        """
+        raise NotImplementedError
+
+    def consume(self, email: str, code: str) -> bool:
+        """
+        Marks the code as used if it is still active.
+
+        Args:
+            email (str): The email address the code was sent to.
+            code (str): The code provided by the user.
+
+        Returns:
+            bool: True if the code was active and is now used.
+        """
+        raise NotImplementedError
+
+    def discard(self, email: str) -> None:
+        """
+        Removes any code stored for the email.
+
+        Args:
+            email (str): The email address.
+        """
+        raise NotImplementedError
+
+
+class DatabaseCodeStore(BaseCodeStore):
+    """
+    Code store backed by the ``VerificationCode`` table.
+    """
+
+    def save(self, email: str, code: str) -> None:
+        deleted_count, _ = VerificationCode.objects.filter(
+            email=email,
+            is_verified=False
+        ).delete()
+        logger.info(
+            f"Deleted {deleted_count} existing verification code(s) for email: {email}."
+        )
+
+        VerificationCode.objects.create(
+            email=email,
+            verification_code=code,
+            is_verified=False
+        )
+
+    def consume(self, email: str, code: str) -> bool:
+        # One UPDATE both validates and marks the code as used, so two
+        # concurrent requests cannot consume the same code.
+        updated_count = VerificationCode.objects.filter(
+            email=email,
+            verification_code=code,
+            is_verified=False,
+            created_at__gt=now() - VerificationCode.LIFETIME
+        ).update(is_verified=True)
+        return updated_count == 1
+
+    def discard(self, email: str) -> None:
+        VerificationCode.objects.filter(email=email).delete()
+
+
+class RedisCodeStore(BaseCodeStore):
+    """
+    Code store that keeps codes in Redis with a native TTL.
+
+    Each code lives under a key that contains the code itself, so consuming it
+    is a single GETDEL: only the first caller gets the value back. A pointer
+    key remembers the current code per email so that a new code replaces the
+    old one in one Lua script, and an attempt counter caps how many guesses
+    an email gets for one code.
+
+    If Redis is unavailable the store falls back to the database backend,
+    so codes created during an outage are checked against the table.
+    """
+    key_prefix = "verification_code"
+
+    def __init__(self) -> None:
+        self.fallback = DatabaseCodeStore()
+        self._script = None
+
+    def get_code_key(self, email: str, code: str) -> str:
+        return f"{self.key_prefix}:{email}:{code}"
+
+    def get_current_key(self, email: str) -> str:
+        return f"{self.key_prefix}:{email}"
+
+    def get_attempts_key(self, email: str) -> str:
+        return f"{self.key_prefix}_attempts:{email}"
+
+    @property
+    def ttl(self) -> int:
+        return int(VerificationCode.LIFETIME.total_seconds())
+
+    def save(self, email: str, code: str) -> None:
+        try:
+            client = get_redis_connection("default")
+            if self._script is None:
+                self._script = client.register_script(SAVE_CODE_SCRIPT)
+            self._script(
+                keys=[
+                    self.get_current_key(email),
+                    self.get_code_key(email, code),
+                    self.get_attempts_key(email),
+                ],
+                args=[self.get_code_key(email, ""), code, self.ttl],
+                client=client
+            )
+        except RedisError:
+            logger.exception(
+                f"Redis code store unavailable, saving the code in the database for email: {email}"
+            )
+            self.fallback.save(email, code)
+
+    def register_attempt(self, email: str) -> bool:
+        """
+        Counts a guess for the email's current code.
+
+        Once ``VERIFICATION_CODE_MAX_ATTEMPTS`` is exceeded the code is
+        discarded, so the user has to request a new one.
+
+        Args:
+            email (str): The email address.
+
+        Returns:
+            bool: True if the attempt is within the allowed number.
+        """
+        client = get_redis_connection("default")
+        attempts_key = self.get_attempts_key(email)
+
+        pipeline = client.pipeline()
+        pipeline.incr(attempts_key)
+        pipeline.expire(attempts_key, self.ttl, nx=True)
+        attempts, _ = pipeline.execute()
+
+        if attempts > settings.VERIFICATION_CODE_MAX_ATTEMPTS:
+            logger.warning(f"Too many verification attempts for email: {email}")
+            self.discard(email)
+            return False
+        return True
+
+    def consume(self, email: str, code: str) -> bool:
+        try:
+            if not self.register_attempt(email):
+                return False
+            client = get_redis_connection("default")
+            if client.getdel(self.get_code_key(email, code)) is None:
+                return False
+            client.delete(
+                self.get_current_key(email),
+                self.get_attempts_key(email)
+            )
+            return True
+        except RedisError:
+            logger.exception(
+                f"Redis code store unavailable, checking the database for email: {email}"
+            )
+            return self.fallback.consume(email, code)
+
+    def discard(self, email: str) -> None:
+        try:
+            client = get_redis_connection("default")
+            current_code = client.get(self.get_current_key(email))
+
+            keys = [self.get_current_key(email), self.get_attempts_key(email)]
+            if current_code:
+                keys.append(self.get_code_key(email, current_code.decode()))
+            client.delete(*keys)
+        except RedisError:
+            logger.exception(
+                f"Redis code store unavailable, discarding the database code for email: {email}"
+            )
+            self.fallback.discard(email)
+
+
+@lru_cache(maxsize=None)
+def get_code_store() -> BaseCodeStore:
+    """
+    Returns the code store configured by ``settings.VERIFICATION_CODE_STORE``.
+
+    Returns:
+        BaseCodeStore: The shared code store instance for this process.
+    """
+    store_class = import_string(settings.VERIFICATION_CODE_STORE)
+    logger.info(f"Using verification code store: {store_class.__name__}")
+    return store_class()
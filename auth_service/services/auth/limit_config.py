@@ -0,0 +1,65 @@
+import time
+import logging
+import threading
+
+from django.conf import settings
+
+from users.models.daily_message_limit import DailyMessageLimit
+from utils.broadcast import ensure_listener, publish, subscribe
+
+__all__ = [
+    "get_daily_message_limit",
+    "invalidate_daily_message_limit"
+]
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_TOPIC = "daily_message_limit"
+
+_cache = {"value": None, "expires_at": 0.0}
+_lock = threading.Lock()
+
+
+def _clear_local(_payload: str = "") -> None:
+    with _lock:
+        _cache["value"] = None
+        _cache["expires_at"] = 0.0
+
+
+subscribe(BROADCAST_TOPIC, _clear_local)
+
+
+def get_daily_message_limit() -> DailyMessageLimit:
+    """
+    Returns the DailyMessageLimit singleton from a per-process cache.
+
+    The row is loaded at most once per ``DAILY_MESSAGE_LIMIT_CACHE_TTL``
+    seconds. Saving the row broadcasts an invalidation, so every process
+    picks up new limits without waiting for the TTL.
+
+    Returns:
+        DailyMessageLimit: The daily message limit settings.
+    """
+    ensure_listener()
+
+    value = _cache["value"]
+    if value is not None and time.monotonic() < _cache["expires_at"]:
+        return value
+
+    with _lock:
+        if _cache["value"] is None or time.monotonic() >= _cache["expires_at"]:
+            limit_obj, _ = DailyMessageLimit.objects.get_or_create(id=1)
+            _cache["value"] = limit_obj
+            _cache["expires_at"] = time.monotonic() + settings.DAILY_MESSAGE_LIMIT_CACHE_TTL
+            logger.debug("Daily message limit loaded from the database.")
+        return _cache["value"]
+
+
+def invalidate_daily_message_limit() -> None:
+    """
+    Drops the cached limit in this process and broadcasts the invalidation
+    to all other web and Celery processes.
+    """
+    _clear_local()
+    publish(BROADCAST_TOPIC)
+    logger.info("Daily message limit cache invalidated.")
@@ -0,0 +1,156 @@
+import uuid
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from users.models.daily_messages import DailyMessage
+from users.models.daily_message_counter import DailyMessageCounter
+
+__all__ = [
+    "BaseMessageLimiter",
+    "DatabaseMessageLimiter",
+    "RedisMessageLimiter",
+    "get_message_limiter"
+]
+
+logger = logging.getLogger(__name__)
+
+
+# Sliding-window limiter for a single email, evaluated atomically on the Redis server.
+#
+# KEYS[1] - sorted set of send timestamps (ms) for the email
+# ARGV[1] - daily message limit
+# ARGV[2] - reset window (ms)
+# ARGV[3] - cooldown between two codes (ms)
+# ARGV[4] - unique member for this send
+#
+# Returns {status, remaining_ms}: 0 = sent, 1 = daily limit reached, 2 = cooldown.
+SEND_MESSAGE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local reset = tonumber(ARGV[2])
+local cooldown = tonumber(ARGV[3])
+
+if limit <= 0 then
+    return {1, reset}
+end
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - reset)
+
+if redis.call("ZCARD", KEYS[1]) >= limit then
+    local first = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    return {1, math.floor(tonumber(first[2]) + reset - now)}
+end
+
+local last = redis.call("ZRANGE", KEYS[1], -1, -1, "WITHSCORES")
+if last[2] and now - tonumber(last[2]) < cooldown then
+    return {2, math.floor(cooldown - (now - tonumber(last[2])))}
+end
+
+redis.call("ZADD", KEYS[1], now, ARGV[4])
+redis.call("PEXPIRE", KEYS[1], reset)
+return {0, 0}
+"""
+
+
+class BaseMessageLimiter:
+    """
+    Base class for send-code rate limiters.
+
+    A limiter enforces the daily message limit and the cooldown between two
+    codes for one email address, and records the send when it is allowed.
+    """
+
+    def send_message(self, email: str) -> str:
+        """
+        Checks the limits for the given email and records a send if allowed.
+
+        Args:
+            email (str): The email address the code is sent to.
+
+        Returns:
+            str: ``DailyMessage.SUCCESS_MESSAGE`` if the send is allowed,
+            otherwise the message explaining why it was rejected.
+        """
+        raise NotImplementedError
+
+
+class DatabaseMessageLimiter(BaseMessageLimiter):
+    """
+    Limiter backed by the ``DailyMessageCounter`` table.
+    """
+
+    def send_message(self, email: str) -> str:
+        return DailyMessageCounter.send_message(email)
+
+
+class RedisMessageLimiter(BaseMessageLimiter):
+    """
+    Limiter that keeps a sliding window of send timestamps per email in Redis.
+
+    The daily cap, the cooldown and the window reset are evaluated by a single
+    Lua script, so every check is one atomic round trip. If Redis is
+    unavailable the limiter falls back to the database backend.
+    """
+    key_prefix = "message_limit"
+
+    def __init__(self) -> None:
+        self.fallback = DatabaseMessageLimiter()
+        self._script = None
+
+    def get_key(self, email: str) -> str:
+        """
+        Returns the Redis key holding the send timestamps for the email.
+        """
+        return f"{self.key_prefix}:{email}"
+
+    def send_message(self, email: str) -> str:
+        limit_obj = DailyMessage.get_limit_info()
+
+        try:
+            client = get_redis_connection("default")
+            if self._script is None:
+                self._script = client.register_script(SEND_MESSAGE_SCRIPT)
+
+            status, remaining_ms = self._script(
+                keys=[self.get_key(email)],
+                args=[
+                    limit_obj.limit,
+                    int(limit_obj.reset_time.total_seconds() * 1000),
+                    int(limit_obj.expiration_time.total_seconds() * 1000),
+                    uuid.uuid4().hex,
+                ],
+                client=client
+            )
+        except RedisError:
+            logger.exception(
+                f"Redis limiter unavailable, falling back to the database for email: {email}"
+            )
+            return self.fallback.send_message(email)
+
+        seconds_remaining = max(int(remaining_ms) // 1000, 0)
+
+        if status == 1:
+            return DailyMessage.limit_reached_message(seconds_remaining)
+        if status == 2:
+            return DailyMessage.cooldown_message(seconds_remaining)
+
+        return DailyMessage.SUCCESS_MESSAGE
+
+
+@lru_cache(maxsize=None)
+def get_message_limiter() -> BaseMessageLimiter:
+    """
+    Returns the limiter configured by ``settings.MESSAGE_LIMITER_BACKEND``.
+
+    Returns:
+        BaseMessageLimiter: The shared limiter instance for this process.
+    """
+    limiter_class = import_string(settings.MESSAGE_LIMITER_BACKEND)
+    logger.info(f"Using message limiter backend: {limiter_class.__name__}")
+    return limiter_class()
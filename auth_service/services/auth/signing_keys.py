@@ -0,0 +1,298 @@
+import time
+import uuid
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.timezone import now
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import SigningKey
+from utils.broadcast import ensure_listener, publish, subscribe
+
+__all__ = [
+    "LoadedKey",
+    "uses_signing_keys",
+    "create_signing_key",
+    "rotate_signing_keys",
+    "get_active_signing_key",
+    "get_verifying_key",
+    "get_jwks",
+    "invalidate_signing_keys"
+]
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_TOPIC = "signing_keys"
+# An unknown kid reloads the keys at most this often, so forged headers
+# cannot turn every request into a query.
+MIN_RELOAD_INTERVAL = 10
+# Postgres advisory lock id held while keys are created, so concurrent
+# rotations or first requests cannot each create a key.
+CREATE_LOCK_ID = 0x6A776B73
+
+
+class LoadedKey(NamedTuple):
+    """
+    A signing key with its PEM data parsed, as kept in the process cache.
+    """
+    kid: str
+    algorithm: str
+    activates_at: datetime
+    expires_at: Optional[datetime]
+    private_key: Any
+    public_key: Any
+    jwk: Dict[str, Any]
+
+
+_cache: Dict[str, Any] = {"keys": None, "expires_at": 0.0, "loaded_at": 0.0}
+_lock = threading.Lock()
+
+
+def _clear_local(_payload: str = "") -> None:
+    with _lock:
+        _cache["keys"] = None
+        _cache["expires_at"] = 0.0
+
+
+subscribe(BROADCAST_TOPIC, _clear_local)
+
+
+def uses_signing_keys() -> bool:
+    """
+    Checks whether tokens are signed with the asymmetric keys in the
+    ``SigningKey`` table rather than the shared ``SIGNING_KEY``.
+
+    Returns:
+        bool: True for RS256 and EdDSA.
+    """
+    return api_settings.ALGORITHM in (SigningKey.RS256, SigningKey.EDDSA)
+
+
+def _generate_key_pair(algorithm: str) -> tuple:
+    if algorithm == SigningKey.EDDSA:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, public_pem
+
+
+def _load_key(signing_key: SigningKey) -> LoadedKey:
+    private_key = serialization.load_pem_private_key(
+        signing_key.private_key.encode(), password=None
+    )
+    public_key = serialization.load_pem_public_key(signing_key.public_key.encode())
+
+    jwk_algorithm = OKPAlgorithm if signing_key.algorithm == SigningKey.EDDSA else RSAAlgorithm
+    jwk = jwk_algorithm.to_jwk(public_key, as_dict=True)
+    jwk.update({"kid": signing_key.kid, "alg": signing_key.algorithm, "use": "sig"})
+
+    return LoadedKey(
+        kid=signing_key.kid,
+        algorithm=signing_key.algorithm,
+        activates_at=signing_key.activates_at,
+        expires_at=signing_key.expires_at,
+        private_key=private_key,
+        public_key=public_key,
+        jwk=jwk
+    )
+
+
+def create_signing_key(
+    algorithm: Optional[str] = None,
+    activates_at: Optional[datetime] = None
+) -> SigningKey:
+    """
+    Generates and stores a new key pair.
+
+    Args:
+        algorithm (Optional[str]): "RS256" or "EdDSA"; defaults to the
+            configured ``SIMPLE_JWT["ALGORITHM"]``.
+        activates_at (Optional[datetime]): When the key starts signing;
+            defaults to now.
+
+    Returns:
+        SigningKey: The stored key.
+    """
+    algorithm = algorithm or api_settings.ALGORITHM
+    private_pem, public_pem = _generate_key_pair(algorithm)
+    signing_key = SigningKey.objects.create(
+        kid=uuid.uuid4().hex,
+        algorithm=algorithm,
+        private_key=private_pem,
+        public_key=public_pem,
+        activates_at=activates_at or now()
+    )
+    logger.info(f"Created {algorithm} signing key {signing_key.kid} active from {signing_key.activates_at}.")
+    return signing_key
+
+
+def _lock_key_creation() -> None:
+    # Released when the surrounding transaction ends.
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CREATE_LOCK_ID])
+
+
+def rotate_signing_keys(force: bool = False) -> Optional[SigningKey]:
+    """
+    Creates the next signing key once the current one is due for rotation.
+
+    The new key is published right away but only signs after
+    ``JWKS_CACHE_MAX_AGE`` plus ``JWKS_STALE_WHILE_REVALIDATE`` seconds, so
+    downstream caches, including ones serving a stale copy, pick it up
+    first. Every older key is then kept for the longest token lifetime
+    after the switch, and keys past that point are deleted.
+
+    Args:
+        force (bool): Rotate even if the current key is younger than
+            ``JWT_KEY_ROTATION_INTERVAL``.
+
+    Returns:
+        Optional[SigningKey]: The new key, or None if no rotation was needed.
+    """
+    if not uses_signing_keys():
+        return None
+
+    with transaction.atomic():
+        _lock_key_creation()
+        current_time = now()
+        SigningKey.objects.filter(expires_at__lte=current_time).delete()
+
+        latest = SigningKey.objects.order_by("-activates_at").first()
+        if latest is not None and latest.activates_at > current_time:
+            logger.info(f"Signing key {latest.kid} is already waiting to activate.")
+            return None
+        if (
+            not force
+            and latest is not None
+            and current_time - latest.activates_at < settings.JWT_KEY_ROTATION_INTERVAL
+        ):
+            return None
+
+        publish_lead = timedelta(0)
+        if latest is not None:
+            publish_lead = timedelta(
+                seconds=settings.JWKS_CACHE_MAX_AGE + settings.JWKS_STALE_WHILE_REVALIDATE
+            )
+        new_key = create_signing_key(activates_at=current_time + publish_lead)
+
+        token_lifetime = max(
+            api_settings.ACCESS_TOKEN_LIFETIME,
+            api_settings.REFRESH_TOKEN_LIFETIME
+        )
+        retired_count = SigningKey.objects.filter(
+            expires_at__isnull=True
+        ).exclude(pk=new_key.pk).update(
+            expires_at=new_key.activates_at + token_lifetime
+        )
+        logger.info(f"Rotated signing keys, {retired_count} key(s) retired.")
+
+    invalidate_signing_keys()
+    return new_key
+
+
+def _get_keys(force_reload: bool = False) -> List[LoadedKey]:
+    ensure_listener()
+
+    keys = _cache["keys"]
+    if keys is not None and not force_reload and time.monotonic() < _cache["expires_at"]:
+        return keys
+
+    with _lock:
+        if (
+            _cache["keys"] is None
+            or time.monotonic() >= _cache["expires_at"]
+            or (force_reload and time.monotonic() - _cache["loaded_at"] >= MIN_RELOAD_INTERVAL)
+        ):
+            current_time = now()
+            _cache["keys"] = [
+                _load_key(signing_key)
+                for signing_key in SigningKey.objects.order_by("-activates_at")
+                if signing_key.expires_at is None or signing_key.expires_at > current_time
+            ]
+            _cache["loaded_at"] = time.monotonic()
+            _cache["expires_at"] = _cache["loaded_at"] + settings.SIGNING_KEY_CACHE_TTL
+            logger.debug(f"Loaded {len(_cache['keys'])} signing key(s).")
+        return _cache["keys"]
+
+
+def get_active_signing_key() -> LoadedKey:
+    """
+    Returns the key new tokens are signed with.
+
+    The first key is created on demand, so a fresh deployment can issue
+    tokens before the rotation task has run. Concurrent first requests are
+    serialized by an advisory lock and all sign with the same key.
+
+    Returns:
+        LoadedKey: The most recently activated key.
+    """
+    current_time = now()
+    for key in _get_keys():
+        if key.activates_at <= current_time:
+            return key
+
+    with transaction.atomic():
+        _lock_key_creation()
+        # Another process may have created the key while this one waited.
+        current_time = now()
+        if not SigningKey.objects.filter(
+            activates_at__lte=current_time
+        ).exclude(expires_at__lte=current_time).exists():
+            create_signing_key()
+    invalidate_signing_keys()
+    return get_active_signing_key()
+
+
+def get_verifying_key(kid: str) -> Optional[LoadedKey]:
+    """
+    Returns the key with the given id if it may still verify tokens.
+
+    Args:
+        kid (str): The key id from the token header.
+
+    Returns:
+        Optional[LoadedKey]: The key, or None if it is unknown or expired.
+    """
+    key = next((key for key in _get_keys() if key.kid == kid), None)
+    if key is None:
+        key = next((key for key in _get_keys(force_reload=True) if key.kid == kid), None)
+    if key is None or (key.expires_at is not None and key.expires_at <= now()):
+        return None
+    return key
+
+
+def get_jwks() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the public keys that may sign or verify tokens as a JWK set.
+
+    Returns:
+        dict: ``{"keys": [...]}``.
+    """
+    return {"keys": [key.jwk for key in _get_keys()]}
+
+
+def invalidate_signing_keys() -> None:
+    """
+    Drops the cached keys in this process and broadcasts the invalidation
+    to all other web and Celery processes.
+    """
+    _clear_local()
+    publish(BROADCAST_TOPIC)
+    logger.info("Signing key cache invalidated.")
@@ -0,0 +1,122 @@
+import logging
+from typing import Any, Dict, Optional
+
+import jwt
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from jwt import ExpiredSignatureError, InvalidAlgorithmError, InvalidTokenError
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError, TokenBackendExpiredToken
+from rest_framework_simplejwt.settings import api_settings
+
+from services.auth.signing_keys import get_active_signing_key, get_verifying_key, uses_signing_keys
+
+__all__ = [
+    "KeyRingTokenBackend",
+    "install_token_backend"
+]
+
+logger = logging.getLogger(__name__)
+
+
+class KeyRingTokenBackend(TokenBackend):
+    """
+    Token backend that signs with the active ``SigningKey`` and verifies
+    with the key named by the token's ``kid`` header.
+
+    Downstream services can verify the same tokens locally with the public
+    keys from ``/.well-known/jwks.json``. Tokens without a ``kid`` were
+    signed with the shared ``SIGNING_KEY`` before the switch; they are
+    accepted only while ``JWT_ACCEPT_HS256_TOKENS`` is on.
+    """
+
+    def __init__(self, *args: Any, accept_hs256: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.hs256_backend = (
+            TokenBackend(
+                "HS256",
+                self.signing_key,
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                json_encoder=self.json_encoder
+            )
+            if accept_hs256 else None
+        )
+
+    def encode(self, payload: Dict[str, Any]) -> str:
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        key = get_active_signing_key()
+        return jwt.encode(
+            jwt_payload,
+            key.private_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid},
+            json_encoder=self.json_encoder
+        )
+
+    def decode(self, token: Any, verify: bool = True) -> Dict[str, Any]:
+        try:
+            kid: Optional[str] = jwt.get_unverified_header(token).get("kid")
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_("Token is invalid")) from ex
+
+        if kid is None and self.hs256_backend is not None:
+            return self.hs256_backend.decode(token, verify=verify)
+
+        key = get_verifying_key(kid) if kid else None
+        if key is None:
+            raise TokenBackendError(_("Token is invalid"))
+
+        try:
+            return jwt.decode(
+                token,
+                key.public_key,
+                algorithms=[key.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    "verify_aud": self.audience is not None,
+                    "verify_signature": verify,
+                },
+            )
+        except InvalidAlgorithmError as ex:
+            raise TokenBackendError(_("Invalid algorithm specified")) from ex
+        except ExpiredSignatureError as ex:
+            raise TokenBackendExpiredToken(_("Token is expired")) from ex
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_("Token is invalid")) from ex
+
+
+def install_token_backend() -> None:
+    """
+    Replaces simplejwt's shared token backend with ``KeyRingTokenBackend``
+    when ``SIMPLE_JWT["ALGORITHM"]`` is RS256 or EdDSA.
+
+    simplejwt looks the backend up in ``rest_framework_simplejwt.state`` for
+    every token it creates or validates, so this covers the obtain, refresh,
+    verify and authentication paths.
+    """
+    if not uses_signing_keys():
+        return
+
+    from rest_framework_simplejwt import state
+
+    state.token_backend = KeyRingTokenBackend(
+        api_settings.ALGORITHM,
+        api_settings.SIGNING_KEY,
+        api_settings.VERIFYING_KEY,
+        api_settings.AUDIENCE,
+        api_settings.ISSUER,
+        None,
+        api_settings.LEEWAY,
+        api_settings.JSON_ENCODER,
+        accept_hs256=settings.JWT_ACCEPT_HS256_TOKENS
+    )
+    logger.debug(f"Signing tokens with {api_settings.ALGORITHM} signing keys.")
@@ -0,0 +1,269 @@
+import time
+import logging
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from services.outbox.publish import PUBLISH_ERRORS, publish_task
+from utils.bloom_filter import BloomFilter
+from utils.broadcast import ensure_listener, publish, subscribe
+
+__all__ = [
+    "BaseTokenBlacklist",
+    "DatabaseTokenBlacklist",
+    "RedisTokenBlacklist",
+    "get_token_blacklist"
+]
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_TOPIC = "token_blacklist"
+REBUILD_LOCK_TIMEOUT = 300
+
+
+class BaseTokenBlacklist:
+    """
+    Base class for refresh token blacklist backends.
+
+    simplejwt's ``BlacklistedToken`` table stays the durable record of every
+    revoked token; a backend decides how revocations are looked up.
+    """
+
+    def is_blacklisted(self, jti: str) -> bool:
+        """
+        Checks whether the token with the given id has been revoked.
+
+        Args:
+            jti (str): The token's JTI claim.
+
+        Returns:
+            bool: True if the token is blacklisted.
+        """
+        raise NotImplementedError
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """
+        Records a revocation after its ``BlacklistedToken`` row was written.
+
+        Args:
+            jti (str): The token's JTI claim.
+            expires_at (datetime): When the token expires.
+        """
+        raise NotImplementedError
+
+
+class DatabaseTokenBlacklist(BaseTokenBlacklist):
+    """
+    Blacklist that queries the ``BlacklistedToken`` table, as simplejwt does.
+    """
+
+    def is_blacklisted(self, jti: str) -> bool:
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        pass
+
+
+class RedisTokenBlacklist(BaseTokenBlacklist):
+    """
+    Blacklist that mirrors revoked JTIs into Redis.
+
+    Each revoked JTI is a key that expires together with the token, so the
+    mirror only ever holds tokens that could still be used. A marker key
+    records that the mirror is complete; without it (a fresh or flushed
+    Redis) lookups fall back to the database and a rebuild from the
+    ``BlacklistedToken`` table is queued.
+
+    With ``TOKEN_BLACKLIST_BLOOM_FILTER`` on, each process also keeps a
+    Bloom filter of the revoked JTIs, so the common "not revoked" answer
+    needs no round trip. The filter is rebuilt from the database every
+    ``TOKEN_BLACKLIST_BLOOM_REBUILD_INTERVAL`` seconds and new revocations
+    are broadcast to it in between; a missed broadcast can hide a revocation
+    from one process until its next rebuild.
+    """
+    key_prefix = "token_blacklist"
+
+    def __init__(self) -> None:
+        self.fallback = DatabaseTokenBlacklist()
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_built_at = 0.0
+        self._pending: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def get_key(self, jti: str) -> str:
+        return f"{self.key_prefix}:{jti}"
+
+    @property
+    def ready_key(self) -> str:
+        return f"{self.key_prefix}:ready"
+
+    @property
+    def rebuild_lock_key(self) -> str:
+        return f"{self.key_prefix}:rebuilding"
+
+    def is_blacklisted(self, jti: str) -> bool:
+        bloom = self._get_bloom()
+        if bloom is not None and jti not in bloom:
+            return False
+
+        try:
+            pipeline = get_redis_connection("default").pipeline(transaction=False)
+            pipeline.exists(self.ready_key)
+            pipeline.exists(self.get_key(jti))
+            ready, exists = pipeline.execute()
+        except RedisError:
+            logger.warning("Redis token blacklist unavailable, checking the database.")
+            return self.fallback.is_blacklisted(jti)
+
+        if not ready:
+            self._schedule_rebuild()
+            return self.fallback.is_blacklisted(jti)
+        return bool(exists)
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        ttl = int((expires_at - now()).total_seconds())
+        if ttl <= 0:
+            return
+
+        try:
+            get_redis_connection("default").set(self.get_key(jti), 1, ex=ttl)
+        except RedisError:
+            logger.error(f"Failed to mirror blacklisted token {jti} into Redis.")
+
+        self.add_local(jti)
+        if settings.TOKEN_BLACKLIST_BLOOM_FILTER:
+            publish(BROADCAST_TOPIC, jti)
+
+    def add_local(self, jti: str) -> None:
+        """
+        Adds a revoked JTI to this process's Bloom filter.
+
+        Args:
+            jti (str): The token's JTI claim.
+        """
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+            if self._pending is not None:
+                self._pending.append(jti)
+
+    def rebuild(self) -> int:
+        """
+        Copies every unexpired ``BlacklistedToken`` into Redis and marks the
+        mirror as complete.
+
+        Returns:
+            int: The number of tokens mirrored.
+        """
+        client = get_redis_connection("default")
+        current_time = now()
+        pipeline = client.pipeline(transaction=False)
+        count = 0
+
+        rows = BlacklistedToken.objects.filter(
+            token__expires_at__gt=current_time
+        ).values_list("token__jti", "token__expires_at")
+
+        for jti, expires_at in rows.iterator(chunk_size=1000):
+            ttl = int((expires_at - current_time).total_seconds())
+            if ttl <= 0:
+                continue
+            pipeline.set(self.get_key(jti), 1, ex=ttl)
+            count += 1
+            if count % 1000 == 0:
+                pipeline.execute()
+        pipeline.set(self.ready_key, 1)
+        pipeline.delete(self.rebuild_lock_key)
+        pipeline.execute()
+
+        logger.info(f"Rebuilt the Redis token blacklist with {count} token(s).")
+        return count
+
+    def _schedule_rebuild(self) -> None:
+        try:
+            client = get_redis_connection("default")
+            if not client.set(self.rebuild_lock_key, 1, nx=True, ex=REBUILD_LOCK_TIMEOUT):
+                return
+            publish_task("users.tasks.rebuild_token_blacklist")
+            logger.warning("Redis token blacklist is incomplete, rebuild queued.")
+        except (RedisError, *PUBLISH_ERRORS):
+            logger.exception("Failed to queue a token blacklist rebuild.")
+
+    def _get_bloom(self) -> Optional[BloomFilter]:
+        if not settings.TOKEN_BLACKLIST_BLOOM_FILTER:
+            return None
+
+        ensure_listener()
+        if (
+            self._bloom is not None
+            and time.monotonic() - self._bloom_built_at < settings.TOKEN_BLACKLIST_BLOOM_REBUILD_INTERVAL
+        ):
+            return self._bloom
+
+        # Threads that find a stale filter keep using it while one of them
+        # rebuilds; only the very first build makes them wait.
+        if not self._build_lock.acquire(blocking=self._bloom is None):
+            return self._bloom
+        try:
+            if (
+                self._bloom is not None
+                and time.monotonic() - self._bloom_built_at < settings.TOKEN_BLACKLIST_BLOOM_REBUILD_INTERVAL
+            ):
+                return self._bloom
+
+            with self._lock:
+                self._pending = []
+            jtis = list(
+                BlacklistedToken.objects.filter(
+                    token__expires_at__gt=now()
+                ).values_list("token__jti", flat=True)
+            )
+            bloom = BloomFilter.from_items(
+                jtis,
+                capacity=max(settings.TOKEN_BLACKLIST_BLOOM_CAPACITY, 2 * len(jtis)),
+                error_rate=settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE
+            )
+
+            with self._lock:
+                # Revocations broadcast while the rows were being read.
+                for jti in self._pending:
+                    bloom.add(jti)
+                self._bloom = bloom
+                self._bloom_built_at = time.monotonic()
+            logger.debug(f"Token blacklist Bloom filter rebuilt with {len(jtis)} token(s).")
+            return bloom
+        finally:
+            with self._lock:
+                self._pending = None
+            self._build_lock.release()
+
+
+@lru_cache(maxsize=None)
+def get_token_blacklist() -> BaseTokenBlacklist:
+    """
+    Returns the blacklist configured by ``settings.TOKEN_BLACKLIST_BACKEND``.
+
+    Returns:
+        BaseTokenBlacklist: The shared blacklist instance for this process.
+    """
+    blacklist_class = import_string(settings.TOKEN_BLACKLIST_BACKEND)
+    logger.info(f"Using token blacklist backend: {blacklist_class.__name__}")
+    return blacklist_class()
+
+
+def _add_to_bloom(jti: str) -> None:
+    blacklist = get_token_blacklist()
+    if isinstance(blacklist, RedisTokenBlacklist):
+        blacklist.add_local(jti)
+
+
+subscribe(BROADCAST_TOPIC, _add_to_bloom)
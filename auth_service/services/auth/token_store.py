@@ -0,0 +1,109 @@
+import time
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+__all__ = [
+    "BaseRefreshTokenStore",
+    "DatabaseRefreshTokenStore",
+    "RedisRefreshTokenStore",
+    "StatelessRefreshTokenStore",
+    "get_refresh_token_store"
+]
+
+logger = logging.getLogger(__name__)
+
+
+class BaseRefreshTokenStore:
+    """
+    Base class for outstanding refresh token stores.
+
+    A store records every refresh token issued at login. Revocation does
+    not depend on it: logging out writes a ``BlacklistedToken`` row (with
+    its ``OutstandingToken``) in every mode, and a password change bumps the
+    user's token version, which invalidates all earlier tokens.
+    """
+
+    def outstand(self, token: Token, user_id: int) -> None:
+        """
+        Records a newly issued refresh token.
+
+        Args:
+            token (Token): The refresh token.
+            user_id (int): The id of the user the token was issued for.
+        """
+        raise NotImplementedError
+
+
+class DatabaseRefreshTokenStore(BaseRefreshTokenStore):
+    """
+    Store that inserts an ``OutstandingToken`` row per token, as simplejwt does.
+    """
+
+    def outstand(self, token: Token, user_id: int) -> None:
+        OutstandingToken.objects.create(
+            user_id=user_id,
+            jti=token[api_settings.JTI_CLAIM],
+            token=str(token),
+            created_at=token.current_time,
+            expires_at=datetime_from_epoch(token["exp"])
+        )
+
+
+class RedisRefreshTokenStore(BaseRefreshTokenStore):
+    """
+    Store that keeps each user's outstanding token ids in a Redis sorted set
+    scored by expiry, so logins make no database writes.
+
+    Expired ids are trimmed on every login and the set expires with the
+    user's last token. Recording is best effort: if Redis is unavailable
+    the login still succeeds.
+    """
+    key_prefix = "refresh_tokens"
+
+    def get_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def outstand(self, token: Token, user_id: int) -> None:
+        key = self.get_key(user_id)
+        exp = int(token["exp"])
+        try:
+            pipeline = get_redis_connection("default").pipeline()
+            pipeline.zremrangebyscore(key, "-inf", int(time.time()))
+            pipeline.zadd(key, {token[api_settings.JTI_CLAIM]: exp})
+            # Every refresh token has the same lifetime, so the newest one
+            # expires last.
+            pipeline.expireat(key, exp)
+            pipeline.execute()
+        except RedisError:
+            logger.warning(f"Failed to record outstanding refresh token for user: {user_id}")
+
+
+class StatelessRefreshTokenStore(BaseRefreshTokenStore):
+    """
+    Store that does not track outstanding tokens at all.
+    """
+
+    def outstand(self, token: Token, user_id: int) -> None:
+        pass
+
+
+@lru_cache(maxsize=None)
+def get_refresh_token_store() -> BaseRefreshTokenStore:
+    """
+    Returns the store configured by ``settings.REFRESH_TOKEN_STORE``.
+
+    Returns:
+        BaseRefreshTokenStore: The shared store instance for this process.
+    """
+    store_class = import_string(settings.REFRESH_TOKEN_STORE)
+    logger.info(f"Using refresh token store: {store_class.__name__}")
+    return store_class()
@@ -0,0 +1,105 @@
+from typing import Any
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken as BaseRefreshToken, Token
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from services.auth.token_blacklist import get_token_blacklist
+from services.auth.token_store import get_refresh_token_store
+from services.auth.user_cache import get_user_cache
+from users.models import CustomUser
+
+__all__ = [
+    "USER_CLAIMS",
+    "TOKEN_VERSION_CLAIM",
+    "RefreshToken",
+    "add_user_claims"
+]
+
+# User fields copied into every issued token, so services that verify our
+# tokens against the JWKS know who the user is without calling us.
+# Refreshed access tokens copy them from the refresh token, so they reflect
+# the user at login time.
+USER_CLAIMS = ("email", "username", "slug", "is_verified")
+TOKEN_VERSION_CLAIM = "ver"
+
+
+def add_user_claims(token: Token, user: Any) -> Token:
+    """
+    Embeds a snapshot of the user in the token.
+
+    Args:
+        token (Token): A refresh or access token issued for the user.
+        user (CustomUser): The user the token is issued for.
+
+    Returns:
+        Token: The same token, for chaining.
+    """
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[TOKEN_VERSION_CLAIM] = user.token_version
+    return token
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token whose blacklist is checked through the configured
+    ``TOKEN_BLACKLIST_BACKEND`` and whose outstanding record is kept by the
+    configured ``REFRESH_TOKEN_STORE``.
+
+    Blacklisting still writes simplejwt's ``BlacklistedToken`` row first, so
+    the database remains the durable record the backend is rebuilt from.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        # Skip BlacklistMixin.for_user, which always inserts an
+        # OutstandingToken row; the store decides where the token goes.
+        token = super(BlacklistMixin, cls).for_user(user)
+        get_refresh_token_store().outstand(token, user.pk)
+        return token
+
+    def outstand(self) -> None:
+        get_refresh_token_store().outstand(
+            self, self.payload.get(api_settings.USER_ID_CLAIM)
+        )
+
+    def verify(self, *args: Any, **kwargs: Any) -> None:
+        super().verify(*args, **kwargs)
+        self.check_version()
+
+    def check_version(self) -> None:
+        """
+        Rejects the token if the user's password changed after it was issued.
+
+        This is what revokes refresh tokens that are not tracked anywhere,
+        see ``StatelessRefreshTokenStore``. Tokens issued before the version
+        claim existed are not checked.
+        """
+        if TOKEN_VERSION_CLAIM not in self.payload:
+            return
+        user_id = self.payload[api_settings.USER_ID_CLAIM]
+        token_version = self.payload[TOKEN_VERSION_CLAIM]
+        try:
+            user = get_user_cache().get(user_id)
+            if user.token_version < token_version:
+                # The cached copy predates the token.
+                user = get_user_cache().get(user_id, refresh=True)
+        except CustomUser.DoesNotExist:
+            raise TokenError(_("User not found"))
+        if user.token_version != token_version:
+            raise TokenError(_("Token is revoked"))
+
+    def check_blacklist(self) -> None:
+        if get_token_blacklist().is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        get_token_blacklist().add(
+            self.payload[api_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload["exp"])
+        )
+        return result
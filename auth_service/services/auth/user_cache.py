@@ -0,0 +1,281 @@
+import copy
+import time
+import pickle
+import logging
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from users.models import CustomUser
+from utils.broadcast import ensure_listener, publish, subscribe
+from utils.metrics import increment
+
+__all__ = [
+    "UserCache",
+    "get_user_cache",
+    "invalidate_cached_user"
+]
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_TOPIC = "user_cache"
+STATS_FLUSH_INTERVAL = 10
+
+# KEYS[1] - cached user entry
+# KEYS[2] - the user's invalidation generation
+# ARGV[1] - generation read before the row was loaded ("" if none)
+# ARGV[2] - pickled user
+# ARGV[3] - entry TTL (s)
+#
+# Only caches the row if no invalidation happened since it was read, so a
+# read racing a save cannot put the old row back. Returns 1 if cached.
+SET_USER_SCRIPT = """
+if (redis.call("GET", KEYS[2]) or "") ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+return 1
+"""
+
+
+class UserCache:
+    """
+    Two-tier cache of ``CustomUser`` rows keyed by user id.
+
+    The first tier is a bounded per-process LRU whose entries expire after
+    ``local_ttl`` seconds. The second tier is shared by every process through
+    Redis. A miss in both tiers loads the row from the database and fills
+    both. Invalidations delete the Redis entry, bump the user's generation
+    so loads that started earlier are not cached, and are broadcast, so
+    every process drops its local copy; the local TTL only bounds staleness
+    if a broadcast is lost. Local fills are guarded the same way: a load
+    that overlaps a local invalidation of the user is returned but not kept.
+
+    Callers get a copy of the cached instance, so changing it cannot leak
+    into other requests. Hit, miss and eviction counts are kept in memory
+    and added to the shared metrics every ``STATS_FLUSH_INTERVAL`` seconds.
+    """
+    key_prefix = "user_cache"
+
+    def __init__(self, local_size: int, local_ttl: float, ttl: int) -> None:
+        self.local_size = local_size
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self._local: "OrderedDict[int, Tuple[CustomUser, float]]" = OrderedDict()
+        # Loads in flight per user: [local invalidations seen, loads running].
+        # Entries only live while a load runs, so the dict stays small.
+        self._loading: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+        self._flushed_at = time.monotonic()
+        self._script = None
+
+    def get_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def get_generation_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}:generation"
+
+    def get(self, user_id: int, refresh: bool = False) -> CustomUser:
+        """
+        Returns the user with the given id.
+
+        Args:
+            user_id (int): The user's primary key.
+            refresh (bool): Skip both tiers and reload the row from the database.
+
+        Returns:
+            CustomUser: A private copy of the cached user.
+
+        Raises:
+            CustomUser.DoesNotExist: If no such user exists.
+        """
+        ensure_listener()
+
+        user = None if refresh else self._get_local(user_id)
+        if user is not None:
+            self._record("local_hit")
+            return copy.copy(user)
+
+        local_generation = self._start_load(user_id)
+        try:
+            user, generation = self._get_shared(user_id)
+            if user is not None and not refresh:
+                self._record("shared_hit")
+            else:
+                self._record("miss")
+                user = CustomUser.objects.get(pk=user_id)
+                self._set_shared(user, generation)
+        except BaseException:
+            with self._lock:
+                self._finish_load(user_id)
+            raise
+
+        self._set_local(user_id, user, local_generation)
+        return copy.copy(user)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drops the user from both tiers and tells every other process to drop
+        its local copy.
+
+        Args:
+            user_id (int): The user's primary key.
+        """
+        self.discard_local(user_id)
+        try:
+            pipeline = get_redis_connection("default").pipeline()
+            pipeline.delete(self.get_key(user_id))
+            pipeline.incr(self.get_generation_key(user_id))
+            pipeline.expire(self.get_generation_key(user_id), self.ttl)
+            pipeline.execute()
+        except RedisError:
+            logger.warning(f"Failed to delete cached user: {user_id}")
+        publish(BROADCAST_TOPIC, str(user_id))
+
+    def discard_local(self, user_id: int) -> None:
+        """
+        Drops the user from this process's tier only.
+
+        Args:
+            user_id (int): The user's primary key.
+        """
+        with self._lock:
+            self._local.pop(user_id, None)
+            loading = self._loading.get(user_id)
+            if loading is not None:
+                loading[0] += 1
+
+    def _start_load(self, user_id: int) -> int:
+        """
+        Registers a load of the user and returns its local generation.
+        """
+        with self._lock:
+            loading = self._loading.setdefault(user_id, [0, 0])
+            loading[1] += 1
+            return loading[0]
+
+    def _finish_load(self, user_id: int) -> int:
+        # Must be called with the lock held.
+        loading = self._loading[user_id]
+        loading[1] -= 1
+        if loading[1] == 0:
+            del self._loading[user_id]
+        return loading[0]
+
+    def _get_local(self, user_id: int) -> Optional[CustomUser]:
+        with self._lock:
+            entry = self._local.get(user_id)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._local[user_id]
+                return None
+            self._local.move_to_end(user_id)
+            return user
+
+    def _set_local(self, user_id: int, user: CustomUser, local_generation: int) -> None:
+        evicted = 0
+        with self._lock:
+            if self._finish_load(user_id) != local_generation:
+                # Invalidated while loading; the row may predate the change.
+                return
+            self._local[user.pk] = (user, time.monotonic() + self.local_ttl)
+            self._local.move_to_end(user.pk)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._record("eviction", evicted)
+
+    def _get_shared(self, user_id: int) -> Tuple[Optional[CustomUser], Optional[bytes]]:
+        """
+        Reads the shared entry together with the user's generation, which
+        ``_set_shared`` needs if the row has to be loaded.
+
+        Returns:
+            Tuple[Optional[CustomUser], Optional[bytes]]: The cached user, if
+            any, and the generation, or None for both if Redis is unavailable.
+        """
+        try:
+            data, generation = get_redis_connection("default").mget(
+                self.get_key(user_id), self.get_generation_key(user_id)
+            )
+        except RedisError:
+            logger.warning(f"Shared user cache unavailable, reading user {user_id} from the database.")
+            return None, None
+        if data is None:
+            return None, generation
+        try:
+            return pickle.loads(data), generation
+        except Exception:
+            # Entries written by an older model definition are just reloaded.
+            logger.warning(f"Discarding unreadable cached user: {user_id}")
+            return None, generation
+
+    def _set_shared(self, user: CustomUser, generation: Optional[bytes]) -> None:
+        try:
+            client = get_redis_connection("default")
+            if self._script is None:
+                self._script = client.register_script(SET_USER_SCRIPT)
+            self._script(
+                keys=[self.get_key(user.pk), self.get_generation_key(user.pk)],
+                args=[
+                    generation or b"",
+                    pickle.dumps(user, pickle.HIGHEST_PROTOCOL),
+                    self.ttl,
+                ],
+                client=client
+            )
+        except RedisError:
+            logger.warning(f"Failed to cache user: {user.pk}")
+
+    def _record(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+            if time.monotonic() - self._flushed_at < STATS_FLUSH_INTERVAL:
+                return
+            stats, self._stats = self._stats, Counter()
+            self._flushed_at = time.monotonic()
+
+        for stat, value in stats.items():
+            increment(f"user_cache.{stat}", value)
+
+
+@lru_cache(maxsize=None)
+def get_user_cache() -> UserCache:
+    """
+    Returns the user cache configured by the ``USER_CACHE_*`` settings.
+
+    Returns:
+        UserCache: The shared user cache instance for this process.
+    """
+    return UserCache(
+        local_size=settings.USER_CACHE_LOCAL_SIZE,
+        local_ttl=settings.USER_CACHE_LOCAL_TTL,
+        ttl=settings.USER_CACHE_TTL
+    )
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drops the user from the cache in every process.
+
+    Args:
+        user_id (int): The user's primary key.
+    """
+    get_user_cache().invalidate(user_id)
+    logger.debug(f"User cache invalidated for user: {user_id}")
+
+
+def _discard_local(payload: str) -> None:
+    get_user_cache().discard_local(int(payload))
+
+
+subscribe(BROADCAST_TOPIC, _discard_local)
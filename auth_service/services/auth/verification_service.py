@@ -1,62 +1,78 @@
 import logging
-from django.utils.timezone import now
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from users.models.daily_message_limit import DailyMessageLimit
-from users.models.daily_messages import DailyMessage
-from users.models import VerificationCode
+from django.db import transaction
 
-from utils.verification_code import generate_verification_code
-from users.tasks import send_verification_email
+from services.auth.code_store import get_code_store
+from services.auth.email_service import create_verification_code
+from services.mail.dispatch import enqueue_verification_email
 
-__all__ = ["reset_password_send_code"]
+__all__ = [
+    "send_verification_code",
+    "reset_password_send_code",
+    "consume_verification_code"
+]
 
 logger = logging.getLogger(__name__)
 
-def reset_password_send_code(email: str) -> Dict[str, Any]:
+
+def consume_verification_code(email: str, verification_code: str) -> None:
+    """
+    Validates the code and marks it as used in a single store operation.
+
+    With the database store this is one conditional ``UPDATE`` on the
+    unverified, unexpired row; with Redis it is a ``GETDEL``. Either way
+    a code can be used only once, even by concurrent requests.
+
+    Args:
+        email (str): The email address the code was sent to.
+        verification_code (str): The code provided by the user.
+
+    Raises:
+        ValueError: If the code is invalid, expired or already used.
+    """
+    if not get_code_store().consume(email, verification_code):
+        logger.warning(f"Invalid or expired verification code for email: {email}")
+        raise ValueError("Invalid or expired verification code.")
+
+    logger.info(f"Verification code for email: {email} consumed.")
+
+
+def send_verification_code(email: str, locale: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Creates a verification code for the email and queues the email with it.
+
+    The code is created exactly once, here, and handed to the email
+    delivery pipeline, which only delivers it. The code and the outbox row
+    for the email are written in one transaction.
+
+    Args:
+        email (str): The email address to which the verification code should be sent.
+        locale (str | None): The locale the email is written in.
+
+    Returns:
+        dict: A dictionary containing the email and a message indicating the status.
+    """
+    with transaction.atomic():
+        verification_code = create_verification_code(email)
+        enqueue_verification_email(email, verification_code, locale)
+
+    return {"email": email, "message": "Verification code sent."}
+
+
+def reset_password_send_code(email: str, locale: Optional[str] = None) -> Dict[str, Any]:
     """
     Sends a verification code to the given email for password reset.
+
+    The daily limit is enforced by the configured message limiter in
+    ``ResetPasswordSendCodeView`` before this function is called.
     
     Args:
         email (str): The email address to which the verification code should be sent.
+        locale (str | None): The locale the email is written in.
     
     Returns:
         dict: A dictionary containing the email and a message indicating the status.
     """
     logger.info(f"Starting password reset process for email: {email}")
-    
-    # Get daily message limit
-    limit_obj = DailyMessage.get_limit_info()
-    reset_time = limit_obj.reset_time
-
-    # Daily limit check
-    limit_message = DailyMessage.check_daily_limit(
-        email, 
-        limit_obj.limit, 
-        reset_time
-    )
-
-    if limit_message:
-        logger.warning(f"Daily limit reached for email: {email}")
-        return {"email": email, "message": limit_message}
-
-    verification_code = generate_verification_code()
-    logger.debug(
-        f"Generated verification code: {verification_code} for email: {email}"
-    )
-    
-    VerificationCode.objects.create(
-        email=email, 
-        verification_code=verification_code
-    )
-    logger.info(
-        f"Verification code for {email} has been saved to the database."
-    )
-    
-    send_verification_email.delay(email)
-    logger.info(f"Verification email sent to {email}.")
-
-    # Add the new message to the database
-    DailyMessage.objects.create(email=email)
-    
-    return {"email": email, "message": "Verification code sent."}
\ No newline at end of file
+    return send_verification_code(email, locale)
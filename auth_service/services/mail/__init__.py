@@ -0,0 +1,8 @@
+from .delivery import *
+from .dispatch import *
+from .email_queue import *
+from .smtp_pool import *
+from .throttle import *
+from .dead_letter import *
+from .templates import *
+from .async_worker import *
@@ -0,0 +1,270 @@
+import json
+import signal
+import asyncio
+import logging
+from typing import Any, Dict, Set
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from services.mail.dead_letter import record_failed_email
+from services.mail.delivery import (
+    build_verification_message,
+    can_retry,
+    retry_delay,
+    throttle_delay,
+    time_left
+)
+from services.mail.email_queue import QUEUE_KEY
+from services.mail.throttle import get_email_throttle
+from utils.metrics import increment
+
+__all__ = [
+    "AsyncSMTPPool",
+    "AsyncEmailWorker"
+]
+
+logger = logging.getLogger(__name__)
+
+POP_TIMEOUT = 1
+
+
+class AsyncSMTPPool:
+    """
+    Open ``aiosmtplib`` connections shared by the sends of one worker.
+
+    An SMTP session carries one message at a time, so a send holds a
+    connection for its duration. At most ``max_connections`` are open at
+    once; further sends wait for one to be released. Connections are
+    opened on demand and kept for reuse, and one that fails at the network
+    level is dropped.
+
+    Args:
+        max_connections (int): The maximum number of open connections.
+    """
+
+    def __init__(self, max_connections: int) -> None:
+        self._idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def acquire(self):
+        await self._slots.acquire()
+        try:
+            try:
+                return self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                return await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _open(self):
+        import aiosmtplib
+
+        client = aiosmtplib.SMTP(
+            hostname=settings.EMAIL_HOST,
+            port=settings.EMAIL_PORT,
+            use_tls=settings.EMAIL_USE_SSL,
+            start_tls=settings.EMAIL_USE_TLS,
+            timeout=settings.EMAIL_TIMEOUT or 30
+        )
+        await client.connect()
+        if settings.EMAIL_HOST_USER and settings.EMAIL_HOST_PASSWORD:
+            await client.login(settings.EMAIL_HOST_USER, settings.EMAIL_HOST_PASSWORD)
+        return client
+
+    def release(self, client, healthy: bool = True) -> None:
+        try:
+            if healthy and client.is_connected:
+                self._idle.put_nowait(client)
+            else:
+                client.close()
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            client = self._idle.get_nowait()
+            try:
+                await client.quit()
+            except Exception:
+                client.close()
+
+
+class AsyncEmailWorker:
+    """
+    Sends verification emails from the Redis list on a single asyncio loop.
+
+    The worker consumes the same list as ``dispatch_verification_emails``
+    with BLPOP and keeps up to ``concurrency`` sends in flight, sharing at
+    most ``smtp_connections`` pooled SMTP connections. Expiry, throttling,
+    retries and the dead-letter table follow the same rules as the Celery
+    tasks; a retry waits for its backoff and then goes back on the list. An
+    email that cannot be put back because Redis is unavailable is recorded
+    as a ``FailedEmail`` row. On SIGINT or SIGTERM the worker stops taking
+    new emails, finishes the in-flight sends and puts pending retries back
+    on the list.
+    """
+
+    def __init__(self, concurrency: int, smtp_connections: int) -> None:
+        self.concurrency = concurrency
+        self.pool = AsyncSMTPPool(smtp_connections)
+        self.throttle = get_email_throttle()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stopping = asyncio.Event()
+        self._sends: Set[asyncio.Task] = set()
+        self._retries: Set[asyncio.Task] = set()
+        self._redis = None
+
+    def stop(self) -> None:
+        logger.info("Stopping the email worker...")
+        self._stopping.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self.stop)
+
+        self._redis = aioredis.from_url(settings.CACHES["default"]["LOCATION"])
+        logger.info(f"Email worker consuming {QUEUE_KEY} with concurrency {self.concurrency}")
+        try:
+            while not self._stopping.is_set():
+                await self._semaphore.acquire()
+                if not await self._take_next():
+                    self._semaphore.release()
+        finally:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+            for task in list(self._retries):
+                task.cancel()
+            await asyncio.gather(*self._retries, return_exceptions=True)
+            await self.pool.close()
+            await self._redis.aclose()
+            logger.info("Email worker stopped.")
+
+    async def _take_next(self) -> bool:
+        """
+        Pops one email and starts sending it.
+
+        Returns:
+            bool: True if a send was started and now holds a semaphore slot.
+        """
+        try:
+            popped = await self._redis.blpop([QUEUE_KEY], timeout=POP_TIMEOUT)
+        except RedisError:
+            logger.exception("Email worker lost Redis, retrying.")
+            await self._pause(POP_TIMEOUT)
+            return False
+        if popped is None:
+            return False
+
+        raw = popped[1]
+        try:
+            item = json.loads(raw)
+        except ValueError:
+            logger.error(f"Dropping malformed email queue item: {raw!r}")
+            return False
+
+        wait = await asyncio.to_thread(self.throttle.acquire)
+        if wait:
+            # The budget is shared, so pause intake instead of this email only.
+            await self._push_back(item, raw, left=True)
+            await asyncio.to_thread(increment, "email.throttled")
+            await self._pause(throttle_delay(wait))
+            return False
+
+        task = asyncio.create_task(self._send(item))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+        return True
+
+    async def _pause(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _send(self, item: Dict[str, Any]) -> None:
+        import aiosmtplib
+
+        email = item["email"]
+        attempt = item.get("attempts", 0)
+        expires_at = item.get("expires_at")
+        try:
+            if time_left(expires_at) <= 0:
+                await self._fail(email, "Code expired before it could be sent.", attempt)
+                return
+
+            message = build_verification_message(
+                email,
+                item["verification_code"],
+                locale=item.get("locale")
+            )
+            try:
+                await self._deliver(message)
+            except (aiosmtplib.SMTPException, OSError) as e:
+                backoff = retry_delay(attempt)
+                if can_retry(e, attempt, backoff, expires_at):
+                    logger.warning(
+                        f"Sending verification email to {email} failed ({e}), "
+                        f"retry {attempt + 1} in {backoff:.1f}s"
+                    )
+                    await asyncio.to_thread(increment, "email.retried")
+                    self._retry_later({**item, "attempts": attempt + 1}, backoff)
+                else:
+                    await self._fail(email, str(e), attempt + 1)
+                return
+
+            await asyncio.to_thread(increment, "email.sent")
+        except Exception:
+            logger.exception(f"Unexpected error while sending verification email to {email}")
+        finally:
+            self._semaphore.release()
+
+    async def _deliver(self, message) -> None:
+        client = await self.pool.acquire()
+        healthy = True
+        try:
+            await client.send_message(
+                message.message(),
+                sender=message.from_email,
+                recipients=message.recipients()
+            )
+        except OSError:
+            healthy = False
+            raise
+        finally:
+            self.pool.release(client, healthy)
+
+    async def _fail(self, email: str, error: str, attempts: int) -> None:
+        await sync_to_async(record_failed_email)(email, error, attempts)
+        await asyncio.to_thread(increment, "email.failed")
+
+    def _retry_later(self, item: Dict[str, Any], delay: float) -> None:
+        task = asyncio.create_task(self._requeue_after(item, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _requeue_after(self, item: Dict[str, Any], delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Runs on shutdown too, so a pending retry is never lost.
+            await self._push_back(item, json.dumps(item))
+
+    async def _push_back(self, item: Dict[str, Any], raw: str, left: bool = False) -> None:
+        """
+        Puts a popped email back on the list, at the head if ``left``.
+
+        If Redis is unavailable the email is recorded as failed instead of
+        being dropped.
+        """
+        try:
+            if left:
+                await self._redis.lpush(QUEUE_KEY, raw)
+            else:
+                await self._redis.rpush(QUEUE_KEY, raw)
+        except RedisError as e:
+            logger.exception(f"Failed to put the verification email to {item['email']} back on the queue.")
+            await self._fail(item["email"], f"Could not requeue: {e}", item.get("attempts", 0))
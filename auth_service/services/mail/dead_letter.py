@@ -0,0 +1,77 @@
+import logging
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.timezone import now
+
+from users.models import FailedEmail
+
+__all__ = [
+    "record_failed_email",
+    "replay_failed_emails"
+]
+
+logger = logging.getLogger(__name__)
+
+
+def record_failed_email(email: str, error: str, attempts: int) -> FailedEmail:
+    """
+    Moves an undeliverable verification email to the dead-letter table.
+
+    Args:
+        email (str): The recipient address.
+        error (str): The last error raised while sending.
+        attempts (int): The number of delivery attempts made.
+
+    Returns:
+        FailedEmail: The stored failure.
+    """
+    logger.error(
+        f"Giving up on verification email to {email} after {attempts} attempt(s): {error}"
+    )
+    return FailedEmail.objects.create(
+        email=email,
+        error=error,
+        attempts=attempts
+    )
+
+
+def replay_failed_emails(
+    queryset: Optional[QuerySet] = None,
+    limit: Optional[int] = None
+) -> int:
+    """
+    Sends a fresh verification code for failures that were not replayed yet.
+
+    The original codes have expired by now, so each address gets a new one
+    through the normal send path. An address with several failures gets a
+    single code, and all of its failures are marked as replayed. Replays are
+    started by staff, so they do not count against the user's daily limit.
+
+    Args:
+        queryset (QuerySet | None): The failures to replay, all by default.
+        limit (int | None): The maximum number of addresses to replay.
+
+    Returns:
+        int: The number of addresses a fresh code was sent to.
+    """
+    from services.auth.verification_service import send_verification_code
+
+    if queryset is None:
+        queryset = FailedEmail.objects.all()
+    pending = queryset.filter(replayed_at__isnull=True)
+
+    emails = pending.order_by("email").values_list("email", flat=True).distinct()
+    if limit is not None:
+        emails = emails[:limit]
+
+    replayed_count = 0
+    for email in list(emails):
+        with transaction.atomic():
+            send_verification_code(email)
+            pending.filter(email=email).update(replayed_at=now())
+        replayed_count += 1
+
+    logger.info(f"Replayed failed verification emails for {replayed_count} address(es).")
+    return replayed_count
@@ -0,0 +1,148 @@
+import os
+import time
+import random
+import smtplib
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+
+from services.mail.templates import build_email
+from users.models import VerificationCode
+
+__all__ = [
+    "MIN_USEFUL_LIFETIME",
+    "build_verification_message",
+    "throttle_delay",
+    "retry_delay",
+    "time_left",
+    "is_transient",
+    "can_retry"
+]
+
+logger = logging.getLogger(__name__)
+
+# A code delivered with less time left than this is of no use to the user.
+MIN_USEFUL_LIFETIME = 30
+
+
+def build_verification_message(
+    email: str,
+    verification_code: str,
+    connection: BaseEmailBackend | None = None,
+    locale: str | None = None
+) -> EmailMultiAlternatives:
+    """
+    Builds the verification email for the given address and code from the
+    cached "verification" templates.
+
+    Args:
+        email (str): The recipient address.
+        verification_code (str): The code to deliver.
+        connection (BaseEmailBackend | None): The connection the message is sent on.
+        locale (str | None): The recipient's locale.
+
+    Returns:
+        EmailMultiAlternatives: The message ready to be sent.
+    """
+    return build_email(
+        "verification",
+        {
+            "verification_code": verification_code,
+            # Passed as text so rendering skips number localization.
+            "lifetime_minutes": str(int(VerificationCode.LIFETIME.total_seconds() // 60)),
+        },
+        [email],
+        locale=locale,
+        from_email=os.getenv("EMAIL_HOST_USER"),
+        connection=connection
+    )
+
+
+def throttle_delay(wait: float) -> float:
+    """
+    Returns the countdown for an email deferred by the send throttle.
+
+    A random second is added so deferred emails do not all wake up at once.
+    """
+    return wait + random.uniform(0, 1)
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Returns the backoff before retry number ``attempt + 1``.
+
+    Exponential backoff with full jitter: a random delay up to
+    ``EMAIL_RETRY_BACKOFF_BASE * 2 ** attempt``, capped at
+    ``EMAIL_RETRY_BACKOFF_MAX``.
+    """
+    ceiling = min(
+        settings.EMAIL_RETRY_BACKOFF_MAX,
+        settings.EMAIL_RETRY_BACKOFF_BASE * 2 ** attempt
+    )
+    return random.uniform(0, ceiling)
+
+
+def time_left(expires_at: float | None) -> float:
+    """
+    Returns the seconds left to deliver a code that is still useful.
+
+    Args:
+        expires_at (float | None): When the code expires, as a Unix timestamp.
+
+    Returns:
+        float: The remaining time, infinite if the expiry is unknown.
+    """
+    if expires_at is None:
+        return float("inf")
+    return expires_at - time.time() - MIN_USEFUL_LIFETIME
+
+
+def _reply_codes(error: Exception) -> list[int]:
+    recipients = getattr(error, "recipients", None)
+    if isinstance(recipients, dict):
+        # smtplib: {address: (code, message)}
+        return [code for code, _ in recipients.values()]
+    if isinstance(recipients, list):
+        # aiosmtplib: [SMTPRecipientRefused]
+        return [recipient.code for recipient in recipients]
+    code = getattr(error, "smtp_code", getattr(error, "code", None))
+    return [code] if isinstance(code, int) else []
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Tells whether a send error is worth retrying.
+
+    4xx replies (421 service unavailable, 451/452/454 temporary failures)
+    and dropped or timed out connections are; 5xx replies and any other
+    error are not. Refused recipients are only retried if every one of them
+    was refused with a 4xx reply. Works for both ``smtplib`` and
+    ``aiosmtplib`` errors.
+    """
+    codes = _reply_codes(error)
+    if codes:
+        return all(400 <= code < 500 for code in codes)
+    return isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError))
+
+
+def can_retry(error: Exception, attempt: int, delay: float, expires_at: float | None) -> bool:
+    """
+    Tells whether a failed send should be retried after ``delay`` seconds.
+
+    Args:
+        error (Exception): The send error.
+        attempt (int): The number of retries made so far.
+        delay (float): The planned backoff.
+        expires_at (float | None): When the code expires, as a Unix timestamp.
+
+    Returns:
+        bool: True if the error is transient, retries are left and the code
+        would still be useful after the delay.
+    """
+    return (
+        is_transient(error)
+        and attempt < settings.EMAIL_MAX_RETRIES
+        and delay < time_left(expires_at)
+    )
@@ -0,0 +1,231 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from services.mail.dead_letter import record_failed_email
+from services.mail.email_queue import push_verification_email
+from services.outbox import PUBLISH_ERRORS, enqueue_task, publish_task
+from users.models import VerificationCode
+from utils.circuit_breaker import CircuitBreaker
+
+__all__ = [
+    "enqueue_verification_email",
+    "deliver_verification_email",
+    "flush_buffered_emails"
+]
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 1
+
+enqueue_breaker = CircuitBreaker(
+    "email_enqueue",
+    failure_threshold=settings.ENQUEUE_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.ENQUEUE_BREAKER_RECOVERY_TIMEOUT
+)
+
+_buffer: Deque[Dict[str, Any]] = deque()
+_flush_lock = threading.Lock()
+_flusher_lock = threading.Lock()
+_flusher_pid: int | None = None
+
+
+def enqueue_verification_email(
+    email: str,
+    verification_code: str,
+    locale: str | None = None
+) -> None:
+    """
+    Schedules a verification email as part of the current transaction.
+
+    In ``task`` mode with ``EMAIL_OUTBOX_ENABLED`` the task call is written
+    to the outbox table and published later by the relay, so the request
+    never talks to the broker. Otherwise the email is handed to the
+    delivery pipeline once the transaction commits.
+
+    The code's expiry travels with the email, so retries stop once a
+    delivered code would be useless.
+
+    Args:
+        email (str): The recipient address.
+        verification_code (str): The code to deliver.
+        locale (str | None): The recipient's locale.
+    """
+    expires_at = (now() + VerificationCode.LIFETIME).timestamp()
+
+    if settings.EMAIL_DELIVERY_MODE == "task" and settings.EMAIL_OUTBOX_ENABLED:
+        enqueue_task(
+            "users.tasks.send_verification_email",
+            email,
+            verification_code,
+            expires_at=expires_at,
+            locale=locale
+        )
+        logger.info(f"Verification email for {email} recorded in the outbox.")
+        return
+
+    transaction.on_commit(
+        lambda: deliver_verification_email(email, verification_code, expires_at, locale)
+    )
+
+
+def deliver_verification_email(
+    email: str,
+    verification_code: str,
+    expires_at: float | None = None,
+    locale: str | None = None
+) -> None:
+    """
+    Hands a verification email to the delivery pipeline selected by
+    ``EMAIL_DELIVERY_MODE``.
+
+    - ``task``: one ``send_verification_email`` Celery task per email.
+    - ``batch``: the email is pushed to a Redis list that
+      ``dispatch_verification_emails`` drains in batches. A dispatcher task
+      is only queued when the list was empty, so a burst of sends costs one
+      task message instead of one per email.
+    - ``asyncio``: the email is pushed to the same Redis list, which the
+      ``run_email_worker`` command consumes.
+
+    Broker and Redis calls use short timeouts behind a circuit breaker. If
+    they fail, or the breaker is open, the email is kept in a bounded
+    in-process buffer that a background thread flushes once the broker
+    recovers, so the request does not wait on an unhealthy broker.
+
+    Args:
+        email (str): The recipient address.
+        verification_code (str): The code to deliver.
+        expires_at (float | None): When the code expires, as a Unix timestamp.
+        locale (str | None): The recipient's locale.
+    """
+    item = {
+        "email": email,
+        "verification_code": verification_code,
+        "expires_at": expires_at,
+        "locale": locale,
+    }
+
+    if not enqueue_breaker.allow():
+        _buffer_email(item)
+        return
+
+    try:
+        _publish(item)
+    except PUBLISH_ERRORS as e:
+        enqueue_breaker.record_failure()
+        logger.warning(f"Failed to queue verification email for {email}: {e}")
+        _buffer_email(item)
+        return
+
+    enqueue_breaker.record_success()
+
+
+def _publish(item: Dict[str, Any]) -> None:
+    email = item["email"]
+    args = (email, item["verification_code"], item["expires_at"], item["locale"])
+
+    if settings.EMAIL_DELIVERY_MODE == "asyncio":
+        push_verification_email(*args)
+        logger.info(f"Verification email for {email} added to the async worker queue.")
+        return
+
+    if settings.EMAIL_DELIVERY_MODE == "batch":
+        if push_verification_email(*args) == 1:
+            try:
+                publish_task("users.tasks.dispatch_verification_emails")
+            except PUBLISH_ERRORS as e:
+                # The email is already on the list, so raising would queue
+                # it twice; the scheduled dispatcher will pick it up.
+                logger.warning(f"Failed to queue a dispatcher for {email}, leaving it to the schedule: {e}")
+        logger.info(f"Verification email for {email} added to the batch queue.")
+        return
+
+    publish_task(
+        "users.tasks.send_verification_email",
+        email,
+        item["verification_code"],
+        expires_at=item["expires_at"],
+        locale=item["locale"]
+    )
+    logger.info(f"Verification email task queued for {email}.")
+
+
+def _buffer_email(item: Dict[str, Any]) -> None:
+    if len(_buffer) >= settings.ENQUEUE_BUFFER_SIZE:
+        dropped = _buffer.popleft()
+        record_failed_email(dropped["email"], "Dropped from the full enqueue buffer.", 0)
+
+    _buffer.append(item)
+    logger.warning(
+        f"Verification email for {item['email']} buffered locally "
+        f"({len(_buffer)} waiting for the broker)."
+    )
+    _ensure_flusher()
+
+
+def flush_buffered_emails() -> int:
+    """
+    Publishes the locally buffered emails while the breaker allows it.
+
+    Emails whose code has expired in the meantime are moved to the
+    dead-letter table instead.
+
+    Returns:
+        int: The number of emails published.
+    """
+    published_count = 0
+    with _flush_lock:
+        while _buffer and enqueue_breaker.allow():
+            item = _buffer.popleft()
+            if item["expires_at"] is not None and item["expires_at"] <= time.time():
+                record_failed_email(item["email"], "Code expired while the broker was down.", 0)
+                continue
+
+            try:
+                _publish(item)
+            except PUBLISH_ERRORS:
+                enqueue_breaker.record_failure()
+                _buffer.appendleft(item)
+                break
+
+            enqueue_breaker.record_success()
+            published_count += 1
+
+    if published_count:
+        logger.info(f"Flushed {published_count} buffered verification email(s).")
+    return published_count
+
+
+def _ensure_flusher() -> None:
+    global _flusher_pid
+
+    if _flusher_pid == os.getpid():
+        return
+
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+        threading.Thread(
+            target=_flush_forever,
+            name="email-buffer-flusher",
+            daemon=True
+        ).start()
+
+
+def _flush_forever() -> None:
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        if not _buffer:
+            continue
+        try:
+            flush_buffered_emails()
+        except Exception:
+            logger.exception("Failed to flush buffered verification emails.")
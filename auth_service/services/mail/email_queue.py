@@ -0,0 +1,88 @@
+import json
+import time
+import logging
+from typing import Any, Dict, List
+
+from django_redis import get_redis_connection
+
+__all__ = [
+    "push_verification_email",
+    "pop_verification_emails",
+    "requeue_verification_emails",
+    "verification_queue_length"
+]
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "email_queue:verification"
+
+
+def push_verification_email(
+    email: str,
+    verification_code: str,
+    expires_at: float | None = None,
+    locale: str | None = None
+) -> int:
+    """
+    Appends a pending verification email to the Redis list.
+
+    Args:
+        email (str): The recipient address.
+        verification_code (str): The code to deliver.
+        expires_at (float | None): When the code expires, as a Unix timestamp.
+        locale (str | None): The recipient's locale.
+
+    Returns:
+        int: The length of the list after the push.
+    """
+    item = json.dumps({
+        "email": email,
+        "verification_code": verification_code,
+        "queued_at": time.time(),
+        "expires_at": expires_at,
+        "locale": locale,
+    })
+    return get_redis_connection("default").rpush(QUEUE_KEY, item)
+
+
+def pop_verification_emails(count: int) -> List[Dict[str, Any]]:
+    """
+    Removes up to ``count`` pending verification emails from the list.
+
+    Args:
+        count (int): The maximum number of items to pop.
+
+    Returns:
+        list: The decoded items, oldest first.
+    """
+    raw_items = get_redis_connection("default").lpop(QUEUE_KEY, count) or []
+
+    items = []
+    for raw in raw_items:
+        try:
+            items.append(json.loads(raw))
+        except ValueError:
+            logger.error(f"Dropping malformed email queue item: {raw!r}")
+    return items
+
+
+def requeue_verification_emails(items: List[Dict[str, Any]]) -> None:
+    """
+    Puts popped items back at the head of the list, keeping their order.
+
+    Args:
+        items (list): Items returned by ``pop_verification_emails``.
+    """
+    if not items:
+        return
+    get_redis_connection("default").lpush(
+        QUEUE_KEY,
+        *[json.dumps(item) for item in reversed(items)]
+    )
+
+
+def verification_queue_length() -> int:
+    """
+    Returns the number of verification emails waiting in the list.
+    """
+    return get_redis_connection("default").llen(QUEUE_KEY)
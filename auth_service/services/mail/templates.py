@@ -0,0 +1,214 @@
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+from django.template import Context, Template, TemplateDoesNotExist
+from django.template.base import TextNode, Variable, VariableNode, render_value_in_context
+from django.template.loader import get_template
+from django.utils.html import escape
+
+__all__ = [
+    "CompiledTemplate",
+    "EmailTemplate",
+    "normalize_locale",
+    "get_email_template",
+    "render_email",
+    "build_email"
+]
+
+logger = logging.getLogger(__name__)
+
+
+_MISSING = object()
+
+
+class CompiledTemplate:
+    """
+    A Django template prepared for rendering many times.
+
+    Email templates are static text with a few plain ``{{ name }}``
+    variables. Such a template is flattened at load time into its literal
+    text and variable names, so rendering it is a single join instead of a
+    walk over the node tree with a new ``Context`` per message. Templates
+    that use tags, filters or dotted lookups are rendered by Django.
+
+    Args:
+        template (Template): The compiled Django template.
+    """
+    __slots__ = ("template", "parts")
+
+    def __init__(self, template: Template) -> None:
+        self.template = template
+        self.parts = self._flatten(template)
+
+    @staticmethod
+    def _flatten(template: Template) -> Optional[tuple]:
+        parts = []
+        for node in template.nodelist:
+            if isinstance(node, TextNode):
+                parts.append((node.s, None))
+                continue
+
+            if not isinstance(node, VariableNode) or node.filter_expression.filters:
+                return None
+            variable = node.filter_expression.var
+            if not isinstance(variable, Variable) or variable.lookups is None or len(variable.lookups) != 1:
+                return None
+            parts.append((None, variable.lookups[0]))
+        return tuple(parts)
+
+    def render(self, context: Dict[str, Any], autoescape: bool = True) -> str:
+        """
+        Renders the template with the given variables.
+
+        Args:
+            context (dict): The template variables.
+            autoescape (bool): Whether to HTML-escape the variables.
+
+        Returns:
+            str: The rendered text.
+        """
+        if self.parts is None:
+            return self.template.render(Context(context, autoescape=autoescape))
+
+        rendered = []
+        for text, name in self.parts:
+            if text is not None:
+                rendered.append(text)
+                continue
+
+            value = context.get(name, _MISSING)
+            if value is _MISSING:
+                # Matches Django's default string_if_invalid.
+                continue
+            if type(value) is str:
+                rendered.append(escape(value) if autoescape else value)
+            else:
+                rendered.append(render_value_in_context(value, Context(autoescape=autoescape)))
+        return "".join(rendered)
+
+
+class EmailTemplate(NamedTuple):
+    """
+    The compiled parts of one email template in one locale.
+    """
+    subject: CompiledTemplate
+    text: CompiledTemplate
+    html: Optional[CompiledTemplate]
+
+
+def normalize_locale(locale: Optional[str]) -> str:
+    """
+    Reduces a language tag such as "az-AZ" or "en_US" to its language code.
+
+    Args:
+        locale (str | None): The requested locale.
+
+    Returns:
+        str: The language code, or ``EMAIL_DEFAULT_LOCALE`` if none was given.
+    """
+    if not locale:
+        return settings.EMAIL_DEFAULT_LOCALE
+    return locale.replace("_", "-").split("-")[0].lower()
+
+
+def _load(path: str) -> CompiledTemplate:
+    # Unwrap the backend template so rendering skips building a new
+    # RequestContext for every message.
+    return CompiledTemplate(get_template(path).template)
+
+
+@lru_cache(maxsize=128)
+def get_email_template(name: str, locale: str) -> EmailTemplate:
+    """
+    Loads and compiles an email template once per process.
+
+    Templates live under ``templates/emails/<name>/<locale>/`` as
+    ``subject.txt``, ``body.txt`` and an optional ``body.html``. A locale
+    without its own templates falls back to ``EMAIL_DEFAULT_LOCALE``.
+
+    Args:
+        name (str): The template name, e.g. "verification".
+        locale (str): The language code.
+
+    Returns:
+        EmailTemplate: The compiled subject, text and HTML templates.
+
+    Raises:
+        TemplateDoesNotExist: If neither the locale nor the default has the template.
+    """
+    prefix = f"emails/{name}/{locale}"
+    try:
+        subject = _load(f"{prefix}/subject.txt")
+        text = _load(f"{prefix}/body.txt")
+    except TemplateDoesNotExist:
+        if locale == settings.EMAIL_DEFAULT_LOCALE:
+            raise
+        logger.info(f"No {locale} templates for email: {name}, using {settings.EMAIL_DEFAULT_LOCALE}")
+        return get_email_template(name, settings.EMAIL_DEFAULT_LOCALE)
+
+    try:
+        html = _load(f"{prefix}/body.html")
+    except TemplateDoesNotExist:
+        html = None
+
+    return EmailTemplate(subject, text, html)
+
+
+def render_email(name: str, context: Dict[str, Any], locale: Optional[str] = None) -> tuple:
+    """
+    Renders the subject, text body and HTML body of an email.
+
+    Args:
+        name (str): The template name.
+        context (dict): The template variables.
+        locale (str | None): The requested locale.
+
+    Returns:
+        tuple: The subject, the text body and the HTML body (or None).
+    """
+    template = get_email_template(name, normalize_locale(locale))
+
+    # Plain-text parts must not be HTML-escaped.
+    subject = " ".join(template.subject.render(context, autoescape=False).split())
+    text = template.text.render(context, autoescape=False)
+    html = template.html.render(context) if template.html else None
+    return subject, text, html
+
+
+def build_email(
+    name: str,
+    context: Dict[str, Any],
+    to: List[str],
+    locale: Optional[str] = None,
+    from_email: Optional[str] = None,
+    connection: Optional[BaseEmailBackend] = None
+) -> EmailMultiAlternatives:
+    """
+    Builds a multipart email with a plain-text body and an HTML alternative.
+
+    Args:
+        name (str): The template name.
+        context (dict): The template variables.
+        to (list): The recipient addresses.
+        locale (str | None): The requested locale.
+        from_email (str | None): The sender, ``DEFAULT_FROM_EMAIL`` by default.
+        connection (BaseEmailBackend | None): The connection the message is sent on.
+
+    Returns:
+        EmailMultiAlternatives: The message ready to be sent.
+    """
+    subject, text, html = render_email(name, context, locale)
+    message = EmailMultiAlternatives(
+        subject,
+        text,
+        from_email,
+        to,
+        connection=connection
+    )
+    if html is not None:
+        message.attach_alternative(html, "text/html")
+    return message
@@ -0,0 +1,134 @@
+import logging
+from functools import lru_cache
+from typing import Dict
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = [
+    "EmailThrottle",
+    "get_email_throttle"
+]
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {
+    "per_second": 1,
+    "per_minute": 60,
+    "per_hour": 3600,
+    "per_day": 86400,
+}
+
+
+# Token buckets for one provider, checked and drawn from atomically.
+#
+# KEYS[i]       - hash {tokens, ts} of the i-th bucket
+# ARGV[1]       - tokens requested
+# ARGV[2i]      - capacity of the i-th bucket
+# ARGV[2i + 1]  - period (ms) in which the i-th bucket refills completely
+#
+# Tokens are drawn only if every bucket has enough of them. Returns 0 when
+# they were drawn, otherwise the number of ms until they would be available.
+ACQUIRE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local requested = tonumber(ARGV[1])
+local wait = 0
+local levels = {}
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local period = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call("HMGET", key, "tokens", "ts")
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - ts) * capacity / period)
+    levels[i] = tokens
+    if tokens < requested then
+        wait = math.max(wait, math.ceil((requested - tokens) * period / capacity))
+    end
+end
+
+if wait > 0 then
+    return wait
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call("HSET", key, "tokens", tostring(levels[i] - requested), "ts", now)
+    redis.call("PEXPIRE", key, tonumber(ARGV[i * 2 + 1]))
+end
+return 0
+"""
+
+
+class EmailThrottle:
+    """
+    Distributed token-bucket throttle for one email provider.
+
+    Every worker draws from the same buckets in Redis, so the provider's
+    per-minute and per-day caps hold no matter how many workers send at
+    once. If Redis is unavailable the throttle lets the send through rather
+    than blocking delivery.
+    """
+    key_prefix = "email_throttle"
+
+    def __init__(self, provider: str, limits: Dict[str, int]) -> None:
+        self.provider = provider
+        self.buckets = [
+            (f"{self.key_prefix}:{provider}:{name}", capacity, PERIODS[name] * 1000)
+            for name, capacity in limits.items()
+        ]
+        self._script = None
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Draws ``tokens`` sends from the provider's budget.
+
+        Args:
+            tokens (int): The number of emails about to be sent.
+
+        Returns:
+            float: 0 if the sends may go out now, otherwise the number of
+            seconds to wait before trying again.
+        """
+        if not self.buckets:
+            return 0
+
+        try:
+            client = get_redis_connection("default")
+            if self._script is None:
+                self._script = client.register_script(ACQUIRE_SCRIPT)
+
+            args = [tokens]
+            for _, capacity, period_ms in self.buckets:
+                args.extend([capacity, period_ms])
+
+            wait_ms = self._script(
+                keys=[key for key, _, _ in self.buckets],
+                args=args,
+                client=client
+            )
+        except RedisError:
+            logger.warning(
+                f"Email throttle unavailable, sending without it for provider: {self.provider}"
+            )
+            return 0
+
+        return int(wait_ms) / 1000
+
+
+@lru_cache(maxsize=None)
+def get_email_throttle() -> EmailThrottle:
+    """
+    Returns the throttle for ``settings.EMAIL_PROVIDER``.
+
+    Returns:
+        EmailThrottle: The shared throttle instance for this process.
+    """
+    provider = settings.EMAIL_PROVIDER
+    limits = settings.EMAIL_RATE_LIMITS.get(provider)
+    if limits is None:
+        logger.warning(f"No email rate limits configured for provider: {provider}")
+        limits = {}
+    return EmailThrottle(provider, limits)
@@ -0,0 +1 @@
+from .queues import *
@@ -0,0 +1,74 @@
+import logging
+from typing import Dict
+
+from celery import current_app
+from kombu.exceptions import OperationalError
+from redis.exceptions import RedisError
+
+from services.mail.email_queue import verification_queue_length
+from utils.metrics import set_gauge
+
+__all__ = ["get_queue_depths", "record_queue_depths"]
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the broker before reporting every queue as unreadable.
+BROKER_CONNECT_TIMEOUT = 1
+
+
+def get_queue_depths() -> Dict[str, int]:
+    """
+    Returns the number of messages waiting in each Celery queue.
+
+    The Redis list used by batch delivery is reported as "email_batch".
+    A queue whose depth cannot be read is reported as -1; if the broker
+    cannot be reached, after one attempt of ``BROKER_CONNECT_TIMEOUT``
+    seconds, that is every queue.
+
+    Returns:
+        dict: The queue name mapped to its depth.
+    """
+    depths = {}
+    queues = current_app.conf.task_queues
+    with current_app.connection_for_read(connect_timeout=BROKER_CONNECT_TIMEOUT) as connection:
+        try:
+            connection.ensure_connection(max_retries=1)
+            channel = connection.default_channel
+        except (OperationalError, *connection.connection_errors):
+            logger.warning("Failed to connect to the broker, queue depths unavailable.")
+            queues = []
+            depths.update((queue.name, -1) for queue in current_app.conf.task_queues)
+
+        for queue in queues:
+            try:
+                depths[queue.name] = channel.queue_declare(
+                    queue=queue.name,
+                    passive=True
+                ).message_count
+            except connection.channel_errors:
+                # Redis deletes empty lists, so an empty queue is not found.
+                depths[queue.name] = 0
+            except (OperationalError, *connection.connection_errors):
+                logger.warning(f"Failed to read depth of queue: {queue.name}")
+                depths[queue.name] = -1
+
+    try:
+        depths["email_batch"] = verification_queue_length()
+    except RedisError:
+        logger.warning("Failed to read depth of the email batch list.")
+        depths["email_batch"] = -1
+
+    return depths
+
+
+def record_queue_depths() -> Dict[str, int]:
+    """
+    Reads the queue depths and stores them as ``queue.<name>.depth`` gauges.
+
+    Returns:
+        dict: The queue name mapped to its depth.
+    """
+    depths = get_queue_depths()
+    for name, depth in depths.items():
+        set_gauge(f"queue.{name}.depth", depth)
+    return depths
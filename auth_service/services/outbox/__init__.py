@@ -0,0 +1,2 @@
+from .outbox import *
+from .publish import *
@@ -0,0 +1,81 @@
+import logging
+from typing import Any
+
+from celery import current_app
+from django.db import transaction
+
+from users.models import OutboxMessage
+
+__all__ = [
+    "enqueue_task",
+    "relay_outbox_messages"
+]
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(task_name: str, *args: Any, **kwargs: Any) -> OutboxMessage:
+    """
+    Records a Celery task call in the outbox table.
+
+    Call this inside the transaction that writes the related rows: the task
+    is published by the relay only if that transaction commits.
+
+    Args:
+        task_name (str): The registered Celery task name.
+        *args: Positional arguments for the task (JSON serializable).
+        **kwargs: Keyword arguments for the task (JSON serializable).
+
+    Returns:
+        OutboxMessage: The recorded message.
+    """
+    return OutboxMessage.objects.create(
+        task_name=task_name,
+        args=list(args),
+        kwargs=kwargs
+    )
+
+
+def relay_outbox_messages(batch_size: int) -> int:
+    """
+    Publishes up to ``batch_size`` committed outbox messages to the broker.
+
+    Rows are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``, so several
+    relays can run side by side without publishing the same row twice.
+    The rows are published over one producer connection and deleted in the
+    same transaction. If publishing fails, the transaction rolls back and the
+    rows are retried on the next run.
+
+    Args:
+        batch_size (int): The maximum number of messages to relay.
+
+    Returns:
+        int: The number of messages published.
+    """
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects
+            .select_for_update(skip_locked=True)
+            .order_by("pk")[:batch_size]
+        )
+        if not messages:
+            return 0
+
+        with current_app.producer_or_acquire() as producer:
+            for message in messages:
+                # send_task does not know the task's options, so results
+                # would otherwise be subscribed to for every message.
+                current_app.send_task(
+                    message.task_name,
+                    args=message.args,
+                    kwargs=message.kwargs,
+                    producer=producer,
+                    ignore_result=True
+                )
+
+        OutboxMessage.objects.filter(
+            pk__in=[message.pk for message in messages]
+        ).delete()
+
+    logger.info(f"Relayed {len(messages)} outbox message(s) to the broker.")
+    return len(messages)
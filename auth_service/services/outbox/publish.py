@@ -0,0 +1,81 @@
+import os
+import logging
+import threading
+from typing import Any
+
+from celery import current_app
+from django.conf import settings
+from kombu.exceptions import OperationalError
+from redis.exceptions import RedisError
+
+__all__ = [
+    "PUBLISH_ERRORS",
+    "publish_task"
+]
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_ERRORS = (OperationalError, RedisError, OSError)
+
+_local = threading.local()
+
+
+def _get_connection():
+    # One producer connection per thread with short timeouts of its own;
+    # the workers keep the default broker options.
+    connection = getattr(_local, "connection", None)
+    if connection is None or _local.pid != os.getpid():
+        timeout = settings.ENQUEUE_TIMEOUT
+        connection = current_app.connection_for_write(
+            connect_timeout=timeout,
+            transport_options={
+                **current_app.conf.broker_transport_options,
+                "socket_timeout": timeout,
+                "socket_connect_timeout": timeout,
+                # Fail on the first refused connect instead of retrying.
+                "max_retries": 0,
+            }
+        )
+        _local.connection = connection
+        _local.pid = os.getpid()
+    return connection
+
+
+def _reset_connection() -> None:
+    connection = getattr(_local, "connection", None)
+    _local.connection = None
+    if connection is not None:
+        try:
+            connection.release()
+        except Exception:
+            pass
+
+
+def publish_task(task_name: str, *args: Any, **kwargs: Any) -> None:
+    """
+    Publishes a Celery task call without blocking on an unhealthy broker.
+
+    Unlike ``delay()``, the publish is not retried and every socket
+    operation times out after ``ENQUEUE_TIMEOUT`` seconds, so a slow or
+    unreachable broker costs a request at most that long.
+
+    Args:
+        task_name (str): The registered Celery task name.
+        *args: Positional arguments for the task.
+        **kwargs: Keyword arguments for the task.
+
+    Raises:
+        OperationalError, RedisError, OSError: If the broker could not be reached.
+    """
+    try:
+        current_app.send_task(
+            task_name,
+            args=args,
+            kwargs=kwargs,
+            connection=_get_connection(),
+            retry=False,
+            ignore_result=True
+        )
+    except PUBLISH_ERRORS:
+        _reset_connection()
+        raise
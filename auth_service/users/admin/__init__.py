@@ -1,4 +1,8 @@
 from .daily_message_limit import DailyMessageLimitAdmin
 from .daily_messages import DailyMessageAdmin
+from .daily_message_counter import DailyMessageCounterAdmin
 from .email_verification import VerificationCodeAdmin
-from .user import CustomUserAdmin
\ No newline at end of file
+from .failed_email import FailedEmailAdmin
+from .outbox import OutboxMessageAdmin
+from .user import CustomUserAdmin
+from .signing_key import SigningKeyAdmin
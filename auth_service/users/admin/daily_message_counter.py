@@ -0,0 +1,56 @@
+from django.contrib import admin
+from django.utils.timezone import localtime
+from ..models import DailyMessageCounter
+
+
+@admin.register(DailyMessageCounter)
+class DailyMessageCounterAdmin(admin.ModelAdmin):
+    """
+    Admin class for DailyMessageCounter model to inspect per-window send counts.
+    """
+
+    list_display = (
+        "email",
+        "count",
+        "local_window_start",
+        "local_last_sent_at"
+    )
+    search_fields = (
+        "email",
+    )
+    readonly_fields = (
+        "email",
+        "window_start",
+        "count",
+        "last_sent_at"
+    )
+
+    def local_window_start(self, obj: DailyMessageCounter) -> str:
+        """
+        Converts the window_start field to the local time zone and formats it as a string.
+
+        Args:
+            obj (DailyMessageCounter): The instance of the DailyMessageCounter model.
+
+        Returns:
+            str: The formatted local time for window_start.
+        """
+        return localtime(obj.window_start).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_window_start.admin_order_field = "window_start"
+    local_window_start.short_description = "Window Start"
+
+    def local_last_sent_at(self, obj: DailyMessageCounter) -> str:
+        """
+        Converts the last_sent_at field to the local time zone and formats it as a string.
+
+        Args:
+            obj (DailyMessageCounter): The instance of the DailyMessageCounter model.
+
+        Returns:
+            str: The formatted local time for last_sent_at.
+        """
+        return localtime(obj.last_sent_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_last_sent_at.admin_order_field = "last_sent_at"
+    local_last_sent_at.short_description = "Last Sent"
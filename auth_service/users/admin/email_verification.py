@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.utils.timezone import localtime, timedelta
+from django.utils.timezone import localtime, now
 from users.models import VerificationCode
 
 
@@ -83,13 +83,14 @@ class VerificationCodeAdmin(admin.ModelAdmin):
     def delete_expired_codes(self, request, queryset):
         """
         Delete expired verification codes based on the 3-minute expiration rule.
+        Expiry is checked in the database, without loading the codes.
         
         Args:
             request: The HTTP request object.
             queryset: The queryset of verification code instances.
         """
         expired_codes = queryset.filter(
-            created_at__lt=localtime() - timedelta(seconds=180)
+            created_at__lt=now() - VerificationCode.LIFETIME
         )
         deleted_count, _ = expired_codes.delete()
         self.message_user(
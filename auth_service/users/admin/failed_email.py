@@ -0,0 +1,83 @@
+from django.contrib import admin
+from django.utils.timezone import localtime
+from ..models import FailedEmail
+from services.mail.dead_letter import replay_failed_emails
+
+
+@admin.register(FailedEmail)
+class FailedEmailAdmin(admin.ModelAdmin):
+    """
+    Admin class for verification emails that could not be delivered.
+    Allows sending fresh codes to the selected addresses.
+    """
+
+    list_display = (
+        "email",
+        "attempts",
+        "local_failed_at",
+        "is_replayed"
+    )
+    list_filter = (
+        "failed_at",
+        "replayed_at"
+    )
+    search_fields = (
+        "email",
+    )
+    readonly_fields = (
+        "email",
+        "error",
+        "attempts",
+        "failed_at",
+        "replayed_at"
+    )
+
+    actions = [
+        "replay_selected"
+    ]
+
+    def local_failed_at(self, obj: FailedEmail) -> str:
+        """
+        Converts the failed_at field to the local time zone and formats it as a string.
+
+        Args:
+            obj (FailedEmail): The instance of the FailedEmail model.
+
+        Returns:
+            str: The formatted local time for failed_at.
+        """
+        return localtime(obj.failed_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_failed_at.admin_order_field = "failed_at"
+    local_failed_at.short_description = "Local Time"
+
+    def is_replayed(self, obj: FailedEmail) -> bool:
+        """
+        Display whether a fresh code has been sent for the failure.
+
+        Args:
+            obj (FailedEmail): The instance of the FailedEmail model.
+
+        Returns:
+            bool: True if the failure was replayed.
+        """
+        return obj.replayed_at is not None
+
+    is_replayed.short_description = "Replayed?"
+    is_replayed.boolean = True
+
+    @admin.action(description="Send fresh codes for selected failures")
+    def replay_selected(self, request, queryset):
+        """
+        Send a fresh verification code to every address among the selected
+        failures that has not been replayed yet.
+
+        Args:
+            request: The HTTP request object.
+            queryset: The queryset of selected failed emails.
+        """
+        replayed_count = replay_failed_emails(queryset)
+        self.message_user(
+            request,
+            f"Fresh verification codes sent to {replayed_count} address(es)."
+        )
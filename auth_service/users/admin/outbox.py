@@ -0,0 +1,39 @@
+from django.contrib import admin
+from django.utils.timezone import localtime
+from ..models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """
+    Admin class for inspecting task calls waiting to be relayed to Celery.
+    """
+
+    list_display = (
+        "task_name",
+        "local_created_at"
+    )
+    list_filter = (
+        "task_name",
+    )
+    readonly_fields = (
+        "task_name",
+        "args",
+        "kwargs",
+        "created_at"
+    )
+
+    def local_created_at(self, obj: OutboxMessage) -> str:
+        """
+        Converts the created_at field to the local time zone and formats it as a string.
+
+        Args:
+            obj (OutboxMessage): The instance of the OutboxMessage model.
+
+        Returns:
+            str: The formatted local time for created_at.
+        """
+        return localtime(obj.created_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_created_at.admin_order_field = "created_at"
+    local_created_at.short_description = "Local Time"
@@ -0,0 +1,70 @@
+from django.contrib import admin
+from django.utils.timezone import localtime
+from ..models import SigningKey
+
+
+@admin.register(SigningKey)
+class SigningKeyAdmin(admin.ModelAdmin):
+    """
+    Admin class for JWT signing keys.
+    Keys are created by the rotation task, so they are read-only here and
+    the private key is never shown.
+    """
+
+    list_display = (
+        "kid",
+        "algorithm",
+        "local_activates_at",
+        "local_expires_at"
+    )
+    list_filter = (
+        "algorithm",
+    )
+    search_fields = (
+        "kid",
+    )
+    fields = (
+        "kid",
+        "algorithm",
+        "public_key",
+        "created_at",
+        "activates_at",
+        "expires_at"
+    )
+    readonly_fields = fields
+
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    def local_activates_at(self, obj: SigningKey) -> str:
+        """
+        Converts the activates_at field to the local time zone and formats it as a string.
+
+        Args:
+            obj (SigningKey): The instance of the SigningKey model.
+
+        Returns:
+            str: The formatted local time for activates_at.
+        """
+        return localtime(obj.activates_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_activates_at.admin_order_field = "activates_at"
+    local_activates_at.short_description = "Activates At"
+
+    def local_expires_at(self, obj: SigningKey) -> str:
+        """
+        Converts the expires_at field to the local time zone and formats it as a string.
+
+        Args:
+            obj (SigningKey): The instance of the SigningKey model.
+
+        Returns:
+            str: The formatted local time for expires_at, or "-" if the key
+            does not expire yet.
+        """
+        if obj.expires_at is None:
+            return "-"
+        return localtime(obj.expires_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    local_expires_at.admin_order_field = "expires_at"
+    local_expires_at.short_description = "Expires At"
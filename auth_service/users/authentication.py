@@ -0,0 +1,73 @@
+import logging
+from typing import Optional
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from services.auth.tokens import TOKEN_VERSION_CLAIM
+from services.auth.user_cache import get_user_cache
+from users.models import CustomUser
+
+__all__ = [
+    "load_user",
+    "CachedJWTAuthentication"
+]
+
+logger = logging.getLogger(__name__)
+
+
+def load_user(user_id: int, token_version: Optional[int] = None) -> CustomUser:
+    """
+    Loads the user a token was issued for through the user cache.
+
+    Args:
+        user_id (int): The user id claim of the token.
+        token_version (Optional[int]): The token version claim, if the token
+            carries one.
+
+    Returns:
+        CustomUser: The user.
+
+    Raises:
+        AuthenticationFailed: If the user no longer exists, is inactive or
+        the token was issued before the last password change.
+    """
+    user_cache = get_user_cache()
+    try:
+        user = user_cache.get(user_id)
+        if token_version is not None and user.token_version < token_version:
+            # The token is newer than the cached copy, so the invalidation
+            # has not reached this process yet.
+            user = user_cache.get(user_id, refresh=True)
+    except CustomUser.DoesNotExist:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+        raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+    if token_version is not None and user.token_version != token_version:
+        logger.warning(f"Rejected outdated token for user: {user_id}")
+        raise AuthenticationFailed(
+            _("The user's password has been changed."), code="password_changed"
+        )
+
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads ``request.user`` through the user cache.
+
+    Tokens carrying a token version are rejected once the password changes.
+    """
+
+    def get_user(self, validated_token: Token) -> CustomUser:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        return load_user(user_id, validated_token.get(TOKEN_VERSION_CLAIM))
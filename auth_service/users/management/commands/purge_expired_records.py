@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.auth.cleanup_service import purge_expired_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Purge expired verification codes, stale send-code history and "
+        "expired JWT outstanding/blacklisted tokens in bounded batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PURGE_BATCH_SIZE,
+            help="Maximum number of rows deleted per transaction."
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=settings.PURGE_BATCH_SLEEP,
+            help="Seconds to pause between two batches."
+        )
+
+    def handle(self, *args, **options):
+        results = purge_expired_records(
+            batch_size=options["batch_size"],
+            sleep_seconds=options["sleep"]
+        )
+
+        for model_name, stats in results.items():
+            self.stdout.write(
+                f"{model_name}: deleted {stats['deleted']} row(s) in "
+                f"{stats['seconds']}s ({stats['rows_per_second']} rows/s)"
+            )
+        self.stdout.write(self.style.SUCCESS("Purge completed."))
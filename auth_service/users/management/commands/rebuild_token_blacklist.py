@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services.auth.token_blacklist import RedisTokenBlacklist, get_token_blacklist
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy every unexpired blacklisted refresh token from the database "
+        "into the Redis token blacklist."
+    )
+
+    def handle(self, *args, **options):
+        blacklist = get_token_blacklist()
+        if not isinstance(blacklist, RedisTokenBlacklist):
+            raise CommandError("TOKEN_BLACKLIST_BACKEND does not mirror tokens into Redis.")
+
+        count = blacklist.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Mirrored {count} blacklisted token(s) into Redis.")
+        )
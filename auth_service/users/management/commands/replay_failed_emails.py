@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from services.mail.dead_letter import replay_failed_emails
+
+
+class Command(BaseCommand):
+    help = (
+        "Send fresh verification codes to addresses whose verification "
+        "email could not be delivered."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of addresses to replay."
+        )
+
+    def handle(self, *args, **options):
+        replayed_count = replay_failed_emails(limit=options["limit"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fresh verification codes sent to {replayed_count} address(es)."
+            )
+        )
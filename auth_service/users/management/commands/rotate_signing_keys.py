@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services.auth.signing_keys import rotate_signing_keys, uses_signing_keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the next JWT signing key. It is published right away and "
+        "starts signing once cached key sets have been refetched "
+        "(JWKS_CACHE_MAX_AGE + JWKS_STALE_WHILE_REVALIDATE seconds)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rotate even if the current key is not due yet."
+        )
+
+    def handle(self, *args, **options):
+        if not uses_signing_keys():
+            raise CommandError("Tokens are signed with HS256; there are no keys to rotate.")
+
+        signing_key = rotate_signing_keys(force=options["force"])
+        if signing_key is None:
+            self.stdout.write("No rotation needed.")
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created signing key {signing_key.kid}, active from {signing_key.activates_at}."
+            )
+        )
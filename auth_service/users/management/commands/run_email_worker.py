@@ -0,0 +1,40 @@
+import asyncio
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.mail.async_worker import AsyncEmailWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the asyncio email worker that sends queued verification emails "
+        "when EMAIL_DELIVERY_MODE is \"asyncio\"."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.EMAIL_ASYNC_CONCURRENCY,
+            help="Maximum number of sends in flight."
+        )
+        parser.add_argument(
+            "--smtp-connections",
+            type=int,
+            default=settings.EMAIL_ASYNC_SMTP_CONNECTIONS,
+            help="Maximum number of open SMTP connections."
+        )
+
+    def handle(self, *args, **options):
+        if settings.EMAIL_DELIVERY_MODE != "asyncio":
+            self.stdout.write(
+                self.style.WARNING(
+                    f"EMAIL_DELIVERY_MODE is \"{settings.EMAIL_DELIVERY_MODE}\", "
+                    "nothing will be queued for this worker."
+                )
+            )
+
+        asyncio.run(
+            AsyncEmailWorker(options["concurrency"], options["smtp_connections"]).run()
+        )
@@ -1,6 +1,8 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.utils.translation import gettext_lazy as _
 
+from utils.email import normalize_email
+
 
 class CustomUserManager(BaseUserManager):
     """
@@ -13,7 +15,7 @@ class CustomUserManager(BaseUserManager):
         """
         if not email:
             raise ValueError(_("The Email must be set"))
-        email = self.normalize_email(email)
+        email = normalize_email(email)
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
         user.save()
@@ -31,4 +33,11 @@ class CustomUserManager(BaseUserManager):
             raise ValueError(_("Superuser must have is_staff=True."))
         if extra_fields.get("is_superuser") is not True:
             raise ValueError(_("Superuser must have is_superuser=True."))
-        return self.create_user(email, password, **extra_fields)
\ No newline at end of file
+        return self.create_user(email, password, **extra_fields)
+
+    def get_by_natural_key(self, email):
+        """
+        Looks the user up by the normalized email, so logins ignore case
+        and still use the unique index on ``email``.
+        """
+        return self.get(email=normalize_email(email))
\ No newline at end of file
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:39
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    Folds the existing DailyMessage rows into one counter row per
+    (email, window_start), using the configured reset time as the window.
+    """
+    DailyMessageLimit = apps.get_model("users", "DailyMessageLimit")
+    limit_obj = DailyMessageLimit.objects.filter(id=1).first()
+    window_seconds = (
+        max(int(limit_obj.reset_time.total_seconds()), 1) if limit_obj else 86400
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO users_dailymessagecounter (email, window_start, count, last_sent_at)
+            SELECT email,
+                   to_timestamp(floor(extract(epoch FROM message_sent_at) / %s) * %s),
+                   count(*),
+                   max(message_sent_at)
+            FROM users_dailymessage
+            GROUP BY 1, 2
+            ON CONFLICT (email, window_start) DO NOTHING
+            """,
+            [window_seconds, window_seconds]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMessageCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('window_start', models.DateTimeField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('last_sent_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('email', 'window_start'), name='unique_daily_message_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:40
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Indexes are built concurrently so the hot tables are not locked.
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_dailymessagecounter'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='dailymessage',
+            index=models.Index(fields=['email', 'message_sent_at'], name='users_dailymsg_email_sent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='verificationcode',
+            index=models.Index(condition=models.Q(('is_verified', False)), fields=['email', 'verification_code'], name='users_vcode_email_code_unv_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='verificationcode',
+            index=models.Index(fields=['email', 'created_at'], name='users_vcode_email_created_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='dailymessage',
+            name='users_daily_email_5b0aac_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='verificationcode',
+            name='users_verif_email_cfa45e_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='verificationcode',
+            name='users_verif_verific_fde8a9_idx',
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_customuser_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SigningKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kid', models.CharField(max_length=64, unique=True)),
+                ('algorithm', models.CharField(choices=[('RS256', 'RS256'), ('EdDSA', 'EdDSA')], max_length=16)),
+                ('private_key', models.TextField()),
+                ('public_key', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('activates_at', models.DateTimeField(db_index=True)),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-activates_at'],
+            },
+        ),
+    ]
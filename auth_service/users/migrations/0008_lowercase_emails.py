@@ -0,0 +1,55 @@
+# Generated by Django 5.1.7 on 2026-10-17 16:05
+
+from django.db import migrations
+
+
+def lowercase_emails(apps, schema_editor):
+    """
+    Lower-cases stored emails, so users are found by an exact match on the
+    normalized address.
+
+    Emails that differ only by case cannot all be lower-cased. In each such
+    group the row that is already lowercase, or else the one that logged in
+    last, gets the lowercase email; the others keep theirs unchanged.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE users_customuser AS u
+            SET email = LOWER(u.email)
+            WHERE u.email <> LOWER(u.email)
+              AND NOT EXISTS (
+                  SELECT 1 FROM users_customuser AS o
+                  WHERE LOWER(o.email) = LOWER(u.email)
+                    AND o.id <> u.id
+              )
+            """
+        )
+        cursor.execute(
+            """
+            UPDATE users_customuser
+            SET email = LOWER(email)
+            WHERE id IN (
+                SELECT DISTINCT ON (LOWER(email)) id
+                FROM users_customuser
+                WHERE LOWER(email) IN (
+                    SELECT LOWER(email)
+                    FROM users_customuser
+                    GROUP BY LOWER(email)
+                    HAVING COUNT(*) > 1 AND bool_and(email <> LOWER(email))
+                )
+                ORDER BY LOWER(email), last_login DESC NULLS LAST, id
+            )
+            """
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_signingkey'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
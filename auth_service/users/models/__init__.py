@@ -1,4 +1,8 @@
 from .user import CustomUser
 from .daily_message_limit import DailyMessageLimit
 from .daily_messages import DailyMessage
-from .email_verification import VerificationCode
\ No newline at end of file
+from .email_verification import VerificationCode
+from .daily_message_counter import DailyMessageCounter
+from .outbox import OutboxMessage
+from .failed_email import FailedEmail
+from .signing_key import SigningKey
@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection, models
+from django.utils.timezone import now
+
+from users.models.daily_messages import DailyMessage
+
+
+class DailyMessageCounter(models.Model):
+    """
+    A compact per-email send counter, one row per email and limit window.
+
+    Replaces one ``DailyMessage`` row per sent code with a single row holding
+    the number of codes sent in the window and the time of the last one.
+    Windows are aligned to multiples of the configured reset time, and sends
+    are recorded with a conditional upsert so concurrent requests cannot
+    exceed the limit.
+
+    Attributes:
+        email (str): The email address the codes are sent to.
+        window_start (datetime): The start of the limit window.
+        count (int): The number of codes sent in the window.
+        last_sent_at (datetime): The timestamp of the last code sent.
+    """
+
+    email = models.EmailField()
+    window_start = models.DateTimeField()
+    count = models.PositiveIntegerField(
+        default=0
+    )
+    last_sent_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email", "window_start"],
+                name="unique_daily_message_counter"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the counter.
+
+        Returns:
+            str: The email, window start and number of messages sent.
+        """
+        return f"{self.count} message(s) sent to {self.email} since {self.window_start}"
+
+    @staticmethod
+    def get_window_start(moment: datetime, reset_time: timedelta) -> datetime:
+        """
+        Returns the start of the limit window that contains the given moment.
+
+        Args:
+            moment (datetime): An aware datetime.
+            reset_time (timedelta): The length of the limit window.
+
+        Returns:
+            datetime: The aligned window start in UTC.
+        """
+        window_seconds = max(int(reset_time.total_seconds()), 1)
+        timestamp = int(moment.timestamp()) // window_seconds * window_seconds
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    @classmethod
+    def try_record_send(
+        cls,
+        email: str,
+        window_start: datetime,
+        sent_at: datetime,
+        limit: int,
+        reset_time: timedelta,
+        expiration_time: timedelta
+    ) -> bool:
+        """
+        Atomically records a send if the limit and the cooldown allow it.
+
+        A single conditional upsert either creates the window row (unless the
+        limit is 0 or the previous window's last send is still inside the
+        cooldown) or increments it while ``count < limit`` and the cooldown
+        has passed.
+        Postgres serializes concurrent upserts on the same row, so N parallel
+        requests for one email record at most ``limit`` sends.
+
+        Args:
+            email (str): The email address the code is sent to.
+            window_start (datetime): The start of the current window.
+            sent_at (datetime): The time of the send.
+            limit (int): The daily message limit.
+            reset_time (timedelta): The length of the limit window.
+            expiration_time (timedelta): The cooldown between two codes.
+
+        Returns:
+            bool: True if the send was recorded, False if it was rejected.
+        """
+        table = cls._meta.db_table
+        params = {
+            "email": email,
+            "window_start": window_start,
+            "previous_window_start": window_start - reset_time,
+            "sent_at": sent_at,
+            "cooldown_since": sent_at - expiration_time,
+            "limit": limit,
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (email, window_start, count, last_sent_at)
+                SELECT %(email)s, %(window_start)s, 1, %(sent_at)s
+                WHERE %(limit)s > 0
+                  AND NOT EXISTS (
+                      SELECT 1 FROM {table}
+                      WHERE email = %(email)s
+                        AND window_start >= %(previous_window_start)s
+                        AND window_start < %(window_start)s
+                        AND last_sent_at > %(cooldown_since)s
+                  )
+                ON CONFLICT (email, window_start) DO UPDATE
+                SET count = {table}.count + 1,
+                    last_sent_at = EXCLUDED.last_sent_at
+                WHERE {table}.count < %(limit)s
+                  AND {table}.last_sent_at <= %(cooldown_since)s
+                RETURNING count
+                """,
+                params
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def send_message(cls, email: str) -> str:
+        """
+        Handles message sending logic while enforcing daily limits.
+
+        The send is attempted first with one conditional upsert. Only when it
+        is rejected is the latest counter row read to build the reason.
+
+        Args:
+            email (str): The email of the user to whom the message is sent.
+
+        Returns:
+            str: A message indicating the result of the operation.
+        """
+        limit_obj = DailyMessage.get_limit_info()
+        reset_time = limit_obj.reset_time
+        current_time = now()
+        window_start = cls.get_window_start(current_time, reset_time)
+
+        if cls.try_record_send(
+            email,
+            window_start,
+            current_time,
+            limit_obj.limit,
+            reset_time,
+            limit_obj.expiration_time
+        ):
+            return DailyMessage.SUCCESS_MESSAGE
+
+        # The latest row may belong to the previous window; it still counts
+        # for the cooldown between two codes.
+        latest = cls.objects.filter(
+            email=email,
+            window_start__gte=window_start - reset_time
+        ).order_by("-window_start").first()
+
+        if limit_obj.limit == 0 or (
+            latest and latest.window_start == window_start and latest.count >= limit_obj.limit
+        ):
+            remaining_time = (window_start + reset_time) - current_time
+            seconds_remaining = max(int(remaining_time.total_seconds()), 0)
+            return DailyMessage.limit_reached_message(seconds_remaining)
+
+        if latest:
+            time_diff = current_time - latest.last_sent_at
+            if time_diff < limit_obj.expiration_time:
+                seconds_remaining = (limit_obj.expiration_time - time_diff).seconds
+                return DailyMessage.cooldown_message(seconds_remaining)
+
+        return "You have reached your daily verification code limit, please try again later."
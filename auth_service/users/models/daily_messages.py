@@ -1,5 +1,7 @@
+from datetime import datetime, time, timedelta
+
 from django.db import models
-from django.utils.timezone import now
+from django.utils.timezone import localdate, make_aware, now
 from users.models.daily_message_limit import DailyMessageLimit  
 
 
@@ -13,13 +15,20 @@ class DailyMessage(models.Model):
         message_sent_at (datetime): The timestamp of when the message was sent.
     """
 
+    SUCCESS_MESSAGE = "Message sent successfully!"
+
     email = models.EmailField()
     message_sent_at = models.DateTimeField(
         auto_now_add=True
     )
 
     class Meta:
-        indexes = [models.Index(fields=["email"])]
+        indexes = [
+            models.Index(
+                fields=["email", "message_sent_at"],
+                name="users_dailymsg_email_sent_idx"
+            )
+        ]
 
     def __str__(self) -> str:
         """
@@ -45,16 +54,59 @@ class DailyMessage(models.Model):
         minutes, seconds = divmod(remainder, 60)
         return f"{hours}:{minutes}:{seconds}"
 
+    @staticmethod
+    def today_range() -> tuple[datetime, datetime]:
+        """
+        Returns the start and end of the current local day as aware datetimes.
+
+        Filtering on this half-open range keeps the column bare, so the
+        (email, message_sent_at) index can be used.
+
+        Returns:
+            tuple[datetime, datetime]: The start (inclusive) and end (exclusive).
+        """
+        today_start = make_aware(datetime.combine(localdate(), time.min))
+        return today_start, today_start + timedelta(days=1)
+
+    @classmethod
+    def limit_reached_message(cls, seconds_remaining: int) -> str:
+        """
+        Builds the message returned when the daily limit has been reached.
+
+        Args:
+            seconds_remaining (int): Seconds until the limit resets.
+
+        Returns:
+            str: The user-facing limit message.
+        """
+        return (
+            "You have reached your daily message limit. "
+            f"Please try again in {cls.format_remaining_time(seconds_remaining)} minutes."
+        )
+
+    @classmethod
+    def cooldown_message(cls, seconds_remaining: int) -> str:
+        """
+        Builds the message returned while the previous code is still valid.
+
+        Args:
+            seconds_remaining (int): Seconds until a new code may be requested.
+
+        Returns:
+            str: The user-facing cooldown message.
+        """
+        return f"Please, try again in {cls.format_remaining_time(seconds_remaining)} seconds."
+
     @classmethod
     def get_limit_info(cls) -> DailyMessageLimit:
         """
-        Retrieves the daily message limit settings.
+        Retrieves the daily message limit settings from the per-process cache.
         
         Returns:
             DailyMessageLimit: The daily message limit settings.
         """
-        limit_obj, _ = DailyMessageLimit.objects.get_or_create(id=1)
-        return limit_obj
+        from services.auth.limit_config import get_daily_message_limit
+        return get_daily_message_limit()
 
     @classmethod
     def clear_old_messages(cls, email: str, reset_time: int) -> None:
@@ -84,23 +136,20 @@ class DailyMessage(models.Model):
         Returns:
             str | None: A message indicating the limit reached or None if within the limit.
         """
-        today_messages_count = cls.objects.filter(
-            email=email, message_sent_at__date=now().date()
-        ).count()
+        today_start, today_end = cls.today_range()
+        today_messages = cls.objects.filter(
+            email=email,
+            message_sent_at__gte=today_start,
+            message_sent_at__lt=today_end
+        )
 
-        if today_messages_count >= limit:
-            first_message_today = cls.objects.filter(
-                email=email, 
-                message_sent_at__date=now().date()
-            ).order_by("message_sent_at").first()
+        if today_messages.count() >= limit:
+            first_message_today = today_messages.order_by("message_sent_at").first()
 
             if first_message_today:
                 remaining_time = (first_message_today.message_sent_at + reset_time) - now()
                 seconds_remaining = max(int(remaining_time.total_seconds()), 0)
-                return (
-                    "You have reached your daily message limit. "
-                    f"Please try again in {cls.format_remaining_time(seconds_remaining)} minutes."
-                )
+                return cls.limit_reached_message(seconds_remaining)
 
             return "You have reached your daily verification code limit, please try again later."
 
@@ -123,7 +172,7 @@ class DailyMessage(models.Model):
             
             if time_diff < expiration_time:
                 seconds_remaining = (expiration_time - time_diff).seconds
-                return f"Please, try again in {cls.format_remaining_time(seconds_remaining)} seconds."
+                return cls.cooldown_message(seconds_remaining)
 
         return None
 
@@ -163,4 +212,4 @@ class DailyMessage(models.Model):
             return expiration_message
 
         cls.objects.create(email=email)
-        return "Message sent successfully!"
\ No newline at end of file
+        return cls.SUCCESS_MESSAGE
\ No newline at end of file
@@ -1,5 +1,5 @@
 from django.db import models
-from django.utils.timezone import now
+from django.utils.timezone import now, timedelta
 
 
 class VerificationCode(models.Model):
@@ -10,6 +10,8 @@ class VerificationCode(models.Model):
     and the timestamp when it was created. It also includes methods to check 
     if the code has expired.
     """
+    LIFETIME = timedelta(seconds=180)
+
     email = models.EmailField()
     verification_code = models.CharField(
         max_length=6
@@ -23,8 +25,15 @@ class VerificationCode(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["email"]),
-            models.Index(fields=["verification_code"]),
+            models.Index(
+                fields=["email", "verification_code"],
+                condition=models.Q(is_verified=False),
+                name="users_vcode_email_code_unv_idx"
+            ),
+            models.Index(
+                fields=["email", "created_at"],
+                name="users_vcode_email_created_idx"
+            ),
         ]
 
     def __str__(self) -> str:
@@ -43,4 +52,4 @@ class VerificationCode(models.Model):
         Returns:
             bool: True if the verification code is expired, otherwise False.
         """
-        return (now() - self.created_at).total_seconds() > 180
\ No newline at end of file
+        return now() - self.created_at > self.LIFETIME
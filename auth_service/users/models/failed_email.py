@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class FailedEmail(models.Model):
+    """
+    A verification email that could not be delivered.
+
+    Emails land here once their retries are used up, the error is permanent,
+    or the code expired before it could be sent. The code itself is not
+    kept; replaying a failure sends the user a fresh one.
+
+    Attributes:
+        email (str): The recipient address.
+        error (str): The last error raised while sending.
+        attempts (int): The number of delivery attempts made.
+        failed_at (datetime): When the email was given up on.
+        replayed_at (datetime): When a fresh code was sent, if it was.
+    """
+    email = models.EmailField()
+    error = models.TextField(
+        blank=True
+    )
+    attempts = models.PositiveIntegerField(
+        default=1
+    )
+    failed_at = models.DateTimeField(
+        auto_now_add=True
+    )
+    replayed_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the failed email.
+
+        Returns:
+            str: The email address and failure time.
+        """
+        return f"Email to {self.email} failed at {self.failed_at}"
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+    """
+    A Celery task call recorded in the same database transaction as the
+    change that caused it.
+
+    The relay publishes committed rows to the broker and deletes them, so a
+    task is enqueued only if its transaction committed, and the request
+    never waits on the broker.
+
+    Attributes:
+        task_name (str): The registered Celery task name.
+        args (list): Positional arguments for the task.
+        kwargs (dict): Keyword arguments for the task.
+        created_at (datetime): When the message was recorded.
+    """
+    task_name = models.CharField(
+        max_length=255
+    )
+    args = models.JSONField(
+        default=list
+    )
+    kwargs = models.JSONField(
+        default=dict
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True
+    )
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the outbox message.
+
+        Returns:
+            str: The task name and creation time.
+        """
+        return f"{self.task_name} recorded at {self.created_at}"
@@ -0,0 +1,61 @@
+from django.db import models
+
+
+class SigningKey(models.Model):
+    """
+    An asymmetric key pair used to sign JWTs.
+
+    Keys are published in the JWKS as soon as they are created, but only
+    start signing at ``activates_at``, which leaves downstream services time
+    to refresh their cached key set first. The newest activated key signs;
+    older keys keep verifying until ``expires_at``, set when the next key is
+    created to outlive every token the old key signed.
+
+    Attributes:
+        kid (str): The key id sent in the token header and in the JWKS.
+        algorithm (str): The JWT algorithm, "RS256" or "EdDSA".
+        private_key (str): The PEM encoded private key.
+        public_key (str): The PEM encoded public key.
+        created_at (datetime): When the key was generated.
+        activates_at (datetime): When the key starts signing tokens.
+        expires_at (datetime): When the key stops verifying tokens, if set.
+    """
+    RS256 = "RS256"
+    EDDSA = "EdDSA"
+    ALGORITHM_CHOICES = [
+        (RS256, "RS256"),
+        (EDDSA, "EdDSA"),
+    ]
+
+    kid = models.CharField(
+        max_length=64,
+        unique=True
+    )
+    algorithm = models.CharField(
+        max_length=16,
+        choices=ALGORITHM_CHOICES
+    )
+    private_key = models.TextField()
+    public_key = models.TextField()
+    created_at = models.DateTimeField(
+        auto_now_add=True
+    )
+    activates_at = models.DateTimeField(
+        db_index=True
+    )
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        ordering = ["-activates_at"]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the signing key.
+
+        Returns:
+            str: The algorithm and key id.
+        """
+        return f"{self.algorithm} key {self.kid}"
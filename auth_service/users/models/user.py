@@ -36,6 +36,11 @@ class CustomUser(AbstractUser):
     is_verified = models.BooleanField(
         default=False
     )
+    # Embedded in issued tokens; bumped by the password change and reset
+    # serializers so tokens carrying an older version can be rejected.
+    token_version = models.PositiveIntegerField(
+        default=0
+    )
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
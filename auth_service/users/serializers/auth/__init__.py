@@ -1,3 +1,3 @@
 from .register import RegisterSerializer
 from .session_serializers import LoginSerializer, LogoutSerializer
-from .token import CustomTokenObtainPairSerializer
\ No newline at end of file
+from .token import CustomTokenObtainPairSerializer, CustomTokenRefreshSerializer
\ No newline at end of file
@@ -1,8 +1,9 @@
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
-from users.models import VerificationCode
-from services.auth import validate_verification_code
+from services.auth import consume_verification_code
+from utils.email import normalize_email
 
 User = get_user_model()
 
@@ -48,48 +49,42 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     def validate_email(self, value):
         """
-        Check if the email is already in use.
+        Check if the email is already in use and normalize it.
         """
+        value = normalize_email(value)
         if User.objects.filter(email=value).exists():
             raise serializers.ValidationError(
                 "This email is already registered."
             )
         return value
 
-    def validate(self, data: dict) -> dict:
+    def create(self, validated_data: dict) -> User:
         """
-        Validates the registration data by checking the verification code.
+        Creates a new user instance with the validated data and consumes
+        the verification code.
+
+        The user is written first and the code consumed last, in one
+        transaction, so the code is only used up if the account exists.
         """
+        email = validated_data["email"]
+        verification_code = validated_data.pop("verification_code")
+
         try:
-            validate_verification_code(
-                data["email"], 
-                data["verification_code"]
-            )
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+                consume_verification_code(email, verification_code)
         except ValueError as e:
             raise serializers.ValidationError(
                 {"verification_code": str(e)}
             )
-
-        return data
-
-    def create(self, validated_data: dict) -> User:
-        """
-        Creates a new user instance with the validated data.
-        """
-        email = validated_data["email"]
-        validated_data.pop("verification_code")
-
-        # Check if email is already registered before creating a new user
-        if User.objects.filter(email=email).exists():
+        except IntegrityError:
+            # A concurrent request registered the same email or username.
+            if User.objects.filter(email=email).exists():
+                raise serializers.ValidationError(
+                    {"email": "This email is already registered."}
+                )
             raise serializers.ValidationError(
-                {"email": "This email is already registered."}
+                {"username": "This username is already taken."}
             )
 
-        # Create a new user
-        user = User.objects.create_user(**validated_data)
-        
-        # Mark the verification code as verified
-        VerificationCode.objects.filter(
-            email=email).update(is_verified=True)
-
         return user
@@ -1,7 +1,8 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 
+from services.auth.tokens import RefreshToken, add_user_claims
+
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -41,7 +42,7 @@ class LoginSerializer(serializers.Serializer):
             )
 
         # Generate and return JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = add_user_claims(RefreshToken.for_user(user), user)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
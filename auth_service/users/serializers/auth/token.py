@@ -1,8 +1,17 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+
+from services.auth.tokens import RefreshToken, add_user_claims
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken
+
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
         token["user_id"] = user.id
+        add_user_claims(token, user)
         return token
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RefreshToken
@@ -68,5 +68,7 @@ class ChangePasswordSerializer(serializers.Serializer):
         """
         user = self.context["request"].user
         user.set_password(validated_data["new_password"])
-        user.save()
+        # Revokes every token issued before the change.
+        user.token_version += 1
+        user.save(update_fields=["password", "token_version"])
         return user
\ No newline at end of file
@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import serializers
 
-from users.models import VerificationCode
+from services.auth import consume_verification_code
+from utils.email import normalize_email
 
 User = get_user_model()
 
@@ -20,10 +22,22 @@ class ResetPasswordSerializer(serializers.Serializer):
         write_only=True
     )
 
+    def validate_email(self, value: str) -> str:
+        """
+        Normalizes the email, so it matches the one the code was sent to.
+
+        Args:
+            value (str): The email address.
+
+        Returns:
+            str: The normalized email address.
+        """
+        return normalize_email(value)
+
     def validate(self, data: dict) -> dict:
         """
-        Validate the provided data to ensure the verification code 
-        is correct and not expired.
+        Validate the provided data, ensuring the user exists. The
+        verification code is consumed in ``create()``.
         
         Args:
             data (dict): The input data containing email, verification_code, 
@@ -33,39 +47,23 @@ class ResetPasswordSerializer(serializers.Serializer):
             dict: The validated data if everything is correct.
         
         Raises:
-            serializers.ValidationError: If the verification code is 
-            invalid or expired.
+            serializers.ValidationError: If the user does not exist.
         """
-        email = data["email"]
-        verification_code = data["verification_code"]
-
         try:
-            user = User.objects.get(email=email)
+            self.user = User.objects.get(email=data["email"])
         except User.DoesNotExist:
             raise serializers.ValidationError(
                 {"email": "User not found."}
             )
 
-        try:
-            record = VerificationCode.objects.get(
-                email=email,
-                verification_code=verification_code
-            )
-        except VerificationCode.DoesNotExist:
-            raise serializers.ValidationError(
-                {"verification_code": "Invalid or expired verification code."}
-            )
-
-        if record.is_verified or record.is_expired():
-            raise serializers.ValidationError(
-                {"verification_code": "Verification code is invalid or expired."}
-            )
-
         return data
 
     def create(self, validated_data: dict) -> User:
         """
         Create a new password for the user after validation.
+
+        The password is saved first and the code consumed last, in one
+        transaction, so the code is only used up if the password changes.
         
         Args:
             validated_data (dict): The validated data containing 
@@ -73,18 +71,26 @@ class ResetPasswordSerializer(serializers.Serializer):
         
         Returns:
             User: The updated user object with the new password set.
+
+        Raises:
+            serializers.ValidationError: If the verification code is
+            invalid or expired.
         """
-        email = validated_data["email"]
-        new_password = validated_data["new_password"]
-        
-        # We find the user by email
-        user = User.objects.get(email=email)
-        user.set_password(new_password)
-        user.save()
+        user = self.user
+        user.set_password(validated_data["new_password"])
+        # Revokes every token issued before the reset.
+        user.token_version += 1
 
-        # Mark the verification code as used
-        VerificationCode.objects.filter(
-            email=email
-        ).update(is_verified=True)
+        try:
+            with transaction.atomic():
+                user.save(update_fields=["password", "token_version"])
+                consume_verification_code(
+                    validated_data["email"],
+                    validated_data["verification_code"]
+                )
+        except ValueError as e:
+            raise serializers.ValidationError(
+                {"verification_code": str(e)}
+            )
 
         return user
\ No newline at end of file
@@ -2,6 +2,7 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 from services.auth import reset_password_send_code
+from utils.email import normalize_email
 
 User = get_user_model()
 
@@ -21,11 +22,12 @@ class ResetPasswordSendCodeSerializer(serializers.Serializer):
             value (str): The email to validate.
 
         Returns:
-            str: The validated email if the user exists.
+            str: The validated email, normalized, if the user exists.
 
         Raises:
             serializers.ValidationError: If the user does not exist.
         """
+        value = normalize_email(value)
         try:
             user = User.objects.get(email=value)
         except User.DoesNotExist:
@@ -41,9 +43,10 @@ class ResetPasswordSendCodeSerializer(serializers.Serializer):
         Creates a password reset request by sending a reset code to the user's email.
 
         Args:
-            validated_data (dict): The validated data, which includes the user information.
+            validated_data (dict): The validated data, which includes the user information
+                and, if passed to ``save()``, the locale of the email.
 
         Returns:
             None: This method triggers the external function to send the reset code.
         """
-        return reset_password_send_code(self.user.email)
\ No newline at end of file
+        return reset_password_send_code(validated_data["email"], validated_data.get("locale"))
\ No newline at end of file
@@ -42,5 +42,7 @@ class UpdateProfileSerializer(serializers.ModelSerializer):
     def update(self, instance: CustomUser, validated_data: Dict[str, Any]) -> CustomUser:
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        # The instance may be a cached copy of the user, so only the
+        # submitted fields are written back.
+        instance.save(update_fields=list(validated_data))
         return instance
@@ -1,8 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from users.models import VerificationCode
-from services.auth import create_verification_code
+from services.auth import send_verification_code
+from utils.email import normalize_email
 
 User = get_user_model()
 
@@ -11,7 +11,7 @@ class SendVerificationCodeSerializer(serializers.Serializer):
     """
     Serializer for sending a verification code to the provided email address.
     
-    Validates the email and creates a verification code.
+    Validates the email, creates a verification code and queues the email.
     """
     email = serializers.EmailField()
 
@@ -20,21 +20,20 @@ class SendVerificationCodeSerializer(serializers.Serializer):
         Validates the email address. 
         
         - If the email is already registered, raise a ValidationError.
-        - If an existing verification code exists for the email, delete it.
         
         Args:
             value (str): The email address to be validated.
 
         Returns:
-            str: The validated email address.
+            str: The validated email address, normalized.
         """
+        value = normalize_email(value)
         if User.objects.filter(email=value).exists():
             raise serializers.ValidationError(
                 "This email is already registered. "
                 "If you've forgotten your password, use the \"Reset Password\" section."
             )
-        
-        VerificationCode.objects.filter(email=value).delete()
+
         return value
 
     def create(self, validated_data: dict) -> dict:
@@ -42,11 +41,13 @@ class SendVerificationCodeSerializer(serializers.Serializer):
         Creates and sends a verification code to the given email address.
         
         Args:
-            validated_data (dict): The validated data containing the email.
+            validated_data (dict): The validated data containing the email and,
+                if passed to ``save()``, the locale of the email.
 
         Returns:
             dict: A dictionary containing the email and a success message.
         """
-        email = validated_data["email"]
-        create_verification_code(email)
-        return {"email": email, "message": "Verification code sent."}
\ No newline at end of file
+        return send_verification_code(
+            validated_data["email"],
+            validated_data.get("locale")
+        )
\ No newline at end of file
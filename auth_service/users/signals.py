@@ -0,0 +1,29 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.models import CustomUser, DailyMessageLimit
+from services.auth.limit_config import invalidate_daily_message_limit
+from services.auth.user_cache import invalidate_cached_user
+
+
+@receiver(post_save, sender=DailyMessageLimit)
+@receiver(post_delete, sender=DailyMessageLimit)
+def daily_message_limit_changed(sender, **kwargs) -> None:
+    """
+    Invalidates the cached daily message limit in every process once the
+    change to the DailyMessageLimit row has been committed.
+    """
+    transaction.on_commit(invalidate_daily_message_limit)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def user_changed(sender, instance: CustomUser, **kwargs) -> None:
+    """
+    Drops the user from the user cache in every process once the change has
+    been committed. Password changes and resets save the user, so they are
+    covered as well.
+    """
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
@@ -0,0 +1,7 @@
+from .base import *
+from .emails import *
+from .cleanup import *
+from .outbox import *
+from .monitoring import *
+from .signing_keys import *
+from .token_blacklist import *
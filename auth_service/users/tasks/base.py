@@ -0,0 +1,19 @@
+from celery import Task
+
+__all__ = ["FireAndForgetTask"]
+
+
+class FireAndForgetTask(Task):
+    """
+    Base class for the tasks of the users app.
+
+    Results are not stored, since nothing reads them, which saves one
+    result-backend write per task. Tasks are acknowledged only after they
+    finish, so the task of a worker that goes down is redelivered instead
+    of lost. A child process that dies while running a task still acks it
+    as failed: a message that crashes its process every time would
+    otherwise be redelivered forever.
+    A task that needs its result opts in with ``ignore_result=False``.
+    """
+    ignore_result = True
+    acks_late = True
@@ -0,0 +1,26 @@
+import logging
+from celery import shared_task
+from django.conf import settings
+
+from users.tasks.base import FireAndForgetTask
+
+from services.auth.cleanup_service import purge_expired_records as purge_records
+
+__all__ = ["purge_expired_records"]
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="users.tasks.purge_expired_records", base=FireAndForgetTask)
+def purge_expired_records() -> dict:
+    """
+    Periodic task that purges expired verification codes, stale send-code
+    history and expired JWT blacklist rows in bounded batches.
+
+    Returns:
+        dict: Per-table statistics of the run.
+    """
+    return purge_records(
+        batch_size=settings.PURGE_BATCH_SIZE,
+        sleep_seconds=settings.PURGE_BATCH_SLEEP
+    )
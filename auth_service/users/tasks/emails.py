@@ -0,0 +1,219 @@
+import smtplib
+import logging
+from typing import Any, Dict, List
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+
+from services.auth.email_service import create_verification_code
+from services.mail.dead_letter import record_failed_email
+from services.mail.delivery import (
+    build_verification_message,
+    can_retry,
+    retry_delay,
+    throttle_delay,
+    time_left
+)
+from services.mail.email_queue import pop_verification_emails, requeue_verification_emails
+from services.mail.smtp_pool import smtp_connection
+from services.mail.throttle import get_email_throttle
+from users.tasks.base import FireAndForgetTask
+from utils.metrics import increment
+
+__all__ = [
+    "send_verification_email",
+    "dispatch_verification_emails"
+]
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="users.tasks.send_verification_email", base=FireAndForgetTask, bind=True)
+def send_verification_email(
+    self,
+    email: str,
+    verification_code: str | None = None,
+    expires_at: float | None = None,
+    locale: str | None = None
+) -> str:
+    """
+    Sends a verification email with an already stored verification code to the given email address.
+
+    The message goes out over a pooled SMTP connection that is reused across
+    tasks in this worker process. If the provider's send budget is used up,
+    the task is queued again with a countdown instead of sending.
+
+    Transient SMTP errors are retried with jittered exponential backoff, at
+    most ``EMAIL_MAX_RETRIES`` times and only while the code would still be
+    usable on arrival. Emails that cannot be delivered are recorded as
+    ``FailedEmail`` rows.
+
+    Args:
+        email (str): The email address to which the verification code will be sent.
+        verification_code (str | None): The code created by the request that queued
+            this task. Messages queued before the code was passed along only
+            carry the email; a code is created for them here.
+        expires_at (float | None): When the code expires, as a Unix timestamp.
+        locale (str | None): The recipient's locale.
+
+    Returns:
+        str: A message saying whether the email was sent, deferred or given up on.
+    """
+    attempt = self.request.retries
+
+    if verification_code is None:
+        # Queued as (email) by the previous release; drop once drained.
+        verification_code = create_verification_code(email)
+
+    if time_left(expires_at) <= 0:
+        record_failed_email(email, "Code expired before it could be sent.", attempt)
+        increment("email.failed")
+        return f"Verification email to {email} expired before sending"
+
+    wait = get_email_throttle().acquire()
+    if wait:
+        if wait >= time_left(expires_at):
+            record_failed_email(email, "Send budget exhausted until the code expires.", attempt)
+            increment("email.failed")
+            return f"Verification email to {email} expired before sending"
+
+        increment("email.throttled")
+        logger.info(f"Email send budget used up, deferring email to {email} by {wait:.1f}s")
+        self.apply_async(
+            args=(email, verification_code),
+            kwargs={"expires_at": expires_at, "locale": locale},
+            countdown=throttle_delay(wait)
+        )
+        return f"Verification email to {email} deferred"
+
+    try:
+        with smtp_connection() as connection:
+            build_verification_message(
+                email,
+                verification_code,
+                connection,
+                locale
+            ).send(fail_silently=False)
+    except (smtplib.SMTPException, OSError) as e:
+        delay = retry_delay(attempt)
+        if can_retry(e, attempt, delay, expires_at):
+            increment("email.retried")
+            logger.warning(
+                f"Sending verification email to {email} failed ({e}), "
+                f"retry {attempt + 1} in {delay:.1f}s"
+            )
+            raise self.retry(exc=e, countdown=delay, max_retries=settings.EMAIL_MAX_RETRIES)
+
+        record_failed_email(email, str(e), attempt + 1)
+        increment("email.failed")
+        return f"Verification email to {email} failed"
+
+    increment("email.sent")
+    return f"Verification email sent successfully to {email}"
+
+
+def _send_on_connection(connection: BaseEmailBackend, message: EmailMultiAlternatives) -> None:
+    try:
+        connection.send_messages([message])
+    except (smtplib.SMTPServerDisconnected, OSError):
+        # The server dropped the session; reconnect once and retry.
+        connection.close()
+        connection.open()
+        connection.send_messages([message])
+
+
+@shared_task(name="users.tasks.dispatch_verification_emails", base=FireAndForgetTask)
+def dispatch_verification_emails(batch_size: int | None = None) -> List[Dict[str, Any]]:
+    """
+    Drains up to ``batch_size`` pending verification emails from the Redis
+    queue and sends them over a single SMTP connection.
+
+    If a full batch was drained, another dispatcher run is queued to pick
+    up the rest. If the provider's send budget runs out, the unsent emails
+    are put back on the queue and the next run is delayed until the budget
+    allows it. Emails that failed with a transient error go back on the
+    queue too, and the next run waits for the backoff of the most retried
+    one; emails that cannot be delivered are recorded as ``FailedEmail`` rows.
+
+    Args:
+        batch_size (int | None): The maximum number of emails to send,
+            ``EMAIL_BATCH_SIZE`` by default.
+
+    Returns:
+        list: One result per email with the address, whether it was sent
+        and the error if it was not.
+    """
+    if settings.EMAIL_DELIVERY_MODE == "asyncio":
+        # The asyncio email worker owns the list in this mode.
+        return []
+
+    batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+    items = pop_verification_emails(batch_size)
+    if not items:
+        return []
+
+    throttle = get_email_throttle()
+    results = []
+    retry_items = []
+    deferred_items = []
+    delay = 0
+    with smtp_connection() as connection:
+        for index, item in enumerate(items):
+            attempt = item.get("attempts", 0)
+            expires_at = item.get("expires_at")
+
+            if time_left(expires_at) <= 0:
+                record_failed_email(item["email"], "Code expired before it could be sent.", attempt)
+                results.append({"email": item["email"], "sent": False, "error": "expired"})
+                continue
+
+            wait = throttle.acquire()
+            if wait:
+                deferred_items = items[index:]
+                delay = max(delay, throttle_delay(wait))
+                increment("email.throttled", len(deferred_items))
+                break
+
+            message = build_verification_message(
+                item["email"],
+                item["verification_code"],
+                connection,
+                item.get("locale")
+            )
+            try:
+                _send_on_connection(connection, message)
+            except (smtplib.SMTPException, OSError) as e:
+                backoff = retry_delay(attempt)
+                if can_retry(e, attempt, backoff, expires_at):
+                    retry_items.append({**item, "attempts": attempt + 1})
+                    delay = max(delay, backoff)
+                else:
+                    record_failed_email(item["email"], str(e), attempt + 1)
+                logger.error(f"Failed to send verification email to {item['email']}: {e}")
+                results.append({"email": item["email"], "sent": False, "error": str(e)})
+            else:
+                results.append({"email": item["email"], "sent": True})
+
+    sent_count = sum(result["sent"] for result in results)
+    failed_count = len(results) - sent_count - len(retry_items)
+    increment("email.sent", sent_count)
+    increment("email.retried", len(retry_items))
+    increment("email.failed", failed_count)
+    logger.info(
+        f"Dispatched verification email batch: {sent_count} sent, "
+        f"{len(retry_items)} to retry, {failed_count} failed, "
+        f"{len(deferred_items)} deferred."
+    )
+
+    requeue_verification_emails(retry_items + deferred_items)
+    if retry_items or deferred_items:
+        dispatch_verification_emails.apply_async(
+            (batch_size,),
+            countdown=delay
+        )
+    elif len(items) == batch_size:
+        dispatch_verification_emails.delay(batch_size)
+
+    return results
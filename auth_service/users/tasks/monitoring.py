@@ -0,0 +1,23 @@
+import logging
+from celery import shared_task
+
+from users.tasks.base import FireAndForgetTask
+
+from services.monitoring.queues import record_queue_depths as record_depths
+
+__all__ = ["record_queue_depths"]
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="users.tasks.record_queue_depths", base=FireAndForgetTask)
+def record_queue_depths() -> dict:
+    """
+    Periodic task that stores the depth of every task queue as a gauge.
+
+    Returns:
+        dict: The queue name mapped to its depth.
+    """
+    depths = record_depths()
+    logger.info(f"Queue depths: {depths}")
+    return depths
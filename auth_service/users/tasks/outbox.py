@@ -0,0 +1,28 @@
+from celery import shared_task
+from django.conf import settings
+
+from users.tasks.base import FireAndForgetTask
+
+from services.outbox import relay_outbox_messages as relay_messages
+
+__all__ = ["relay_outbox_messages"]
+
+
+@shared_task(name="users.tasks.relay_outbox_messages", base=FireAndForgetTask)
+def relay_outbox_messages() -> int:
+    """
+    Periodic task that publishes committed outbox messages to the broker.
+
+    Keeps relaying full batches until the outbox is drained.
+
+    Returns:
+        int: The number of messages published.
+    """
+    batch_size = settings.OUTBOX_RELAY_BATCH_SIZE
+    relayed_total = 0
+
+    while True:
+        relayed = relay_messages(batch_size)
+        relayed_total += relayed
+        if relayed < batch_size:
+            return relayed_total
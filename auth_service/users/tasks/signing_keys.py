@@ -0,0 +1,26 @@
+import logging
+from celery import shared_task
+
+from users.tasks.base import FireAndForgetTask
+
+from services.auth.signing_keys import rotate_signing_keys as rotate_keys
+
+__all__ = ["rotate_signing_keys"]
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="users.tasks.rotate_signing_keys", base=FireAndForgetTask)
+def rotate_signing_keys() -> str | None:
+    """
+    Periodic task that creates the next JWT signing key once the current
+    one is older than ``JWT_KEY_ROTATION_INTERVAL``.
+
+    Returns:
+        str | None: The key id of the new key, if one was created.
+    """
+    signing_key = rotate_keys()
+    if signing_key is None:
+        return None
+    logger.info(f"Signing key {signing_key.kid} activates at {signing_key.activates_at}.")
+    return signing_key.kid
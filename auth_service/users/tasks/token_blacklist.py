@@ -0,0 +1,26 @@
+import logging
+from celery import shared_task
+
+from users.tasks.base import FireAndForgetTask
+
+from services.auth.token_blacklist import RedisTokenBlacklist, get_token_blacklist
+
+__all__ = ["rebuild_token_blacklist"]
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="users.tasks.rebuild_token_blacklist", base=FireAndForgetTask)
+def rebuild_token_blacklist() -> int:
+    """
+    Task that copies the unexpired ``BlacklistedToken`` rows into the Redis
+    blacklist. Queued automatically when the mirror is found incomplete.
+
+    Returns:
+        int: The number of tokens mirrored.
+    """
+    blacklist = get_token_blacklist()
+    if not isinstance(blacklist, RedisTokenBlacklist):
+        logger.info("Token blacklist is not mirrored into Redis, nothing to rebuild.")
+        return 0
+    return blacklist.rebuild()
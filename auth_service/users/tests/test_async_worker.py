@@ -0,0 +1,52 @@
+import asyncio
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from services.mail.async_worker import AsyncEmailWorker, AsyncSMTPPool
+from services.mail.email_queue import QUEUE_KEY
+
+
+class AsyncEmailWorkerTests(SimpleTestCase):
+
+    async def test_throttled_email_is_dead_lettered_if_redis_fails(self) -> None:
+        raw = json.dumps({"email": "erin@example.com", "verification_code": "123456"})
+        worker = AsyncEmailWorker(concurrency=1, smtp_connections=1)
+        worker.throttle = mock.Mock(**{"acquire.return_value": 5.0})
+        worker._redis = mock.AsyncMock()
+        worker._redis.blpop.return_value = (QUEUE_KEY.encode(), raw.encode())
+        worker._redis.lpush.side_effect = RedisConnectionError("Connection reset by peer")
+        worker._pause = mock.AsyncMock()
+
+        with mock.patch("services.mail.async_worker.record_failed_email") as record_failed_email, \
+                mock.patch("services.mail.async_worker.increment"):
+            self.assertFalse(await worker._take_next())
+
+        record_failed_email.assert_called_once()
+        self.assertEqual(record_failed_email.call_args.args[0], "erin@example.com")
+
+
+class AsyncSMTPPoolTests(SimpleTestCase):
+
+    async def test_connections_are_capped_and_reused(self) -> None:
+        pool = AsyncSMTPPool(max_connections=2)
+        opened = []
+
+        async def open_connection():
+            client = mock.Mock(is_connected=True)
+            opened.append(client)
+            return client
+
+        with mock.patch.object(pool, "_open", open_connection):
+            first = await pool.acquire()
+            await pool.acquire()
+            waiting = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0)
+            self.assertFalse(waiting.done())
+
+            pool.release(first)
+            self.assertIs(await asyncio.wait_for(waiting, timeout=1), first)
+
+        self.assertEqual(len(opened), 2)
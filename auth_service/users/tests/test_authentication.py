@@ -0,0 +1,46 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from users.models import CustomUser
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    """
+    ``/me`` is served from the user cache, but deactivating the user must
+    still lock out tokens that were already issued.
+    """
+    password = "correct-horse-battery"
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            email="dave@example.com",
+            username="dave",
+            password=self.password
+        )
+        response = self.client.post(
+            "/api/v1/users/login/",
+            {"email": self.user.email, "password": self.password},
+            secure=True
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+
+    def get_profile(self):
+        return self.client.get("/api/v1/users/me/", secure=True)
+
+    def test_profile_is_served_from_the_cache(self) -> None:
+        self.assertEqual(self.get_profile().status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.get_profile()
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["email"], self.user.email)
+
+    def test_deactivated_user_is_rejected(self) -> None:
+        self.assertEqual(self.get_profile().status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save(update_fields=["is_active"])
+
+        self.assertEqual(self.get_profile().status_code, 401)
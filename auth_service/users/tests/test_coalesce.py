@@ -0,0 +1,44 @@
+import time
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase, override_settings
+
+from services.auth.coalesce import IN_FLIGHT_RESPONSE, MAX_WAIT, coalesce_request
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+@skipIf(fakeredis is None, "fakeredis is not installed")
+@override_settings(SEND_CODE_COALESCE_WINDOW=10)
+class CoalesceRequestTests(SimpleTestCase):
+
+    def setUp(self) -> None:
+        self.client = fakeredis.FakeRedis()
+        patcher = mock.patch(
+            "services.auth.coalesce.get_redis_connection",
+            return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_duplicate_gets_the_stored_response(self) -> None:
+        handler = mock.Mock(return_value=({"message": "sent"}, 200))
+
+        self.assertEqual(coalesce_request("send_code:a", handler), ({"message": "sent"}, 200))
+        self.assertEqual(coalesce_request("send_code:a", handler), ({"message": "sent"}, 200))
+        handler.assert_called_once()
+
+    def test_duplicate_of_a_slow_request_is_not_held(self) -> None:
+        # The first request claimed the key and is still sending.
+        self.client.set("coalesce:send_code:a", b"pending", ex=10)
+        handler = mock.Mock()
+
+        started = time.monotonic()
+        response = coalesce_request("send_code:a", handler)
+
+        self.assertEqual(response, IN_FLIGHT_RESPONSE)
+        self.assertLess(time.monotonic() - started, MAX_WAIT + 0.2)
+        handler.assert_not_called()
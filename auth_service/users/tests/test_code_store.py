@@ -0,0 +1,38 @@
+from unittest import mock
+
+from django.test import TestCase
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from services.auth.code_store import RedisCodeStore
+from users.models import VerificationCode
+
+
+class RedisCodeStoreFallbackTests(TestCase):
+    """
+    While Redis is unavailable, codes are stored and checked in the
+    database instead of failing the request.
+    """
+    email = "frank@example.com"
+
+    def setUp(self) -> None:
+        patcher = mock.patch(
+            "services.auth.code_store.get_redis_connection",
+            side_effect=RedisConnectionError("Connection refused")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = RedisCodeStore()
+
+    def test_save_and_consume(self) -> None:
+        self.store.save(self.email, "123456")
+
+        self.assertTrue(VerificationCode.objects.filter(email=self.email).exists())
+        self.assertFalse(self.store.consume(self.email, "654321"))
+        self.assertTrue(self.store.consume(self.email, "123456"))
+        self.assertFalse(self.store.consume(self.email, "123456"))
+
+    def test_discard(self) -> None:
+        self.store.save(self.email, "123456")
+        self.store.discard(self.email)
+
+        self.assertFalse(VerificationCode.objects.filter(email=self.email).exists())
@@ -0,0 +1,60 @@
+import threading
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils.timezone import now
+
+from users.models import DailyMessageCounter
+
+
+class TryRecordSendTests(TransactionTestCase):
+    """
+    ``try_record_send`` must never record more than ``limit`` sends per
+    window, even when many requests for one email race each other.
+    """
+    email = "carol@example.com"
+    reset_time = timedelta(days=1)
+
+    def record_send(self, limit: int, sent_at=None) -> bool:
+        sent_at = sent_at or now()
+        return DailyMessageCounter.try_record_send(
+            self.email,
+            DailyMessageCounter.get_window_start(sent_at, self.reset_time),
+            sent_at,
+            limit,
+            self.reset_time,
+            timedelta(0)
+        )
+
+    def test_concurrent_sends_stop_at_the_limit(self) -> None:
+        limit = 5
+        threads = 20
+        sent_at = now()
+        barrier = threading.Barrier(threads)
+        results = []
+        errors = []
+
+        def send() -> None:
+            try:
+                barrier.wait()
+                results.append(self.record_send(limit, sent_at))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=send) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results.count(True), limit)
+        counter = DailyMessageCounter.objects.get(email=self.email)
+        self.assertEqual(counter.count, limit)
+
+    def test_zero_limit_records_nothing(self) -> None:
+        self.assertFalse(self.record_send(limit=0))
+        self.assertFalse(DailyMessageCounter.objects.filter(email=self.email).exists())
@@ -0,0 +1,41 @@
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from services.mail.templates import CompiledTemplate, get_email_template
+
+
+class CompiledTemplateTests(SimpleTestCase):
+    """
+    Flattened templates must render exactly what Django would.
+    """
+    contexts = [
+        {"verification_code": "123456", "lifetime_minutes": "3"},
+        {"verification_code": "<b>&'\"", "lifetime_minutes": None},
+        {"verification_code": 1234567},
+        {},
+    ]
+
+    def test_email_templates_are_flattened(self) -> None:
+        for locale in ("en", "az"):
+            template = get_email_template("verification", locale)
+            for part in template:
+                self.assertIsNotNone(part.parts)
+
+    def test_flattened_render_matches_django(self) -> None:
+        template = Template("Code: {{ verification_code }} ({{ lifetime_minutes }} min)")
+        compiled = CompiledTemplate(template)
+
+        for context in self.contexts:
+            for autoescape in (True, False):
+                with self.subTest(context=context, autoescape=autoescape):
+                    self.assertEqual(
+                        compiled.render(context, autoescape=autoescape),
+                        template.render(Context(context, autoescape=autoescape))
+                    )
+
+    def test_filters_and_tags_use_django(self) -> None:
+        for source in ("{{ code|upper }}", "{% if code %}{{ code }}{% endif %}", "{{ user.code }}"):
+            template = Template(source)
+            compiled = CompiledTemplate(template)
+            self.assertIsNone(compiled.parts)
+            self.assertEqual(compiled.render({"code": "ab"}), template.render(Context({"code": "ab"})))
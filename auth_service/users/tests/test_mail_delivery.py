@@ -0,0 +1,95 @@
+import smtplib
+import socket
+from unittest import mock
+
+import aiosmtplib
+from django.test import SimpleTestCase, override_settings
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from services.mail import dispatch
+from services.mail.delivery import is_transient
+
+
+class IsTransientTests(SimpleTestCase):
+    """
+    ``smtplib`` and ``aiosmtplib`` report the same failures with different
+    exceptions; both must be classified the same way.
+    """
+
+    def test_reply_codes(self) -> None:
+        for error, transient in (
+            (smtplib.SMTPResponseException(421, b"Service not available"), True),
+            (smtplib.SMTPSenderRefused(451, b"Try again later", "from@example.com"), True),
+            (smtplib.SMTPDataError(554, b"Rejected"), False),
+            (aiosmtplib.SMTPResponseException(421, "Service not available"), True),
+            (aiosmtplib.SMTPSenderRefused(451, "Try again later", "from@example.com"), True),
+            (aiosmtplib.SMTPDataError(554, "Rejected"), False),
+        ):
+            with self.subTest(error=error):
+                self.assertIs(is_transient(error), transient)
+
+    def test_smtplib_refused_recipients(self) -> None:
+        permanent = smtplib.SMTPRecipientsRefused({"a@example.com": (550, b"No such user")})
+        temporary = smtplib.SMTPRecipientsRefused({"a@example.com": (452, b"Mailbox full")})
+        mixed = smtplib.SMTPRecipientsRefused({
+            "a@example.com": (452, b"Mailbox full"),
+            "b@example.com": (550, b"No such user"),
+        })
+        self.assertFalse(is_transient(permanent))
+        self.assertTrue(is_transient(temporary))
+        self.assertFalse(is_transient(mixed))
+
+    def test_aiosmtplib_refused_recipients(self) -> None:
+        permanent = aiosmtplib.SMTPRecipientsRefused([
+            aiosmtplib.SMTPRecipientRefused(550, "No such user", "a@example.com"),
+        ])
+        temporary = aiosmtplib.SMTPRecipientsRefused([
+            aiosmtplib.SMTPRecipientRefused(452, "Mailbox full", "a@example.com"),
+        ])
+        mixed = aiosmtplib.SMTPRecipientsRefused([
+            aiosmtplib.SMTPRecipientRefused(452, "Mailbox full", "a@example.com"),
+            aiosmtplib.SMTPRecipientRefused(550, "No such user", "b@example.com"),
+        ])
+        self.assertFalse(is_transient(permanent))
+        self.assertTrue(is_transient(temporary))
+        self.assertFalse(is_transient(mixed))
+
+    def test_connection_errors(self) -> None:
+        for error in (
+            smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+            aiosmtplib.SMTPServerDisconnected("Connection lost"),
+            aiosmtplib.SMTPReadTimeoutError("Timed out"),
+            ConnectionRefusedError(111, "Connection refused"),
+            socket.timeout("timed out"),
+        ):
+            with self.subTest(error=error):
+                self.assertTrue(is_transient(error))
+
+    def test_other_errors(self) -> None:
+        for error in (
+            smtplib.SMTPNotSupportedError("STARTTLS extension not supported"),
+            aiosmtplib.SMTPNotSupported("STARTTLS extension not supported"),
+            socket.gaierror(-2, "Name or service not known"),
+            ValueError("Invalid address"),
+        ):
+            with self.subTest(error=error):
+                self.assertFalse(is_transient(error))
+
+
+@override_settings(EMAIL_DELIVERY_MODE="batch")
+class BatchDeliveryTests(SimpleTestCase):
+    """
+    Once an email is on the batch list it must not be buffered again,
+    even if queueing the dispatcher fails.
+    """
+
+    def test_failed_dispatcher_publish_does_not_buffer_the_email(self) -> None:
+        self.addCleanup(dispatch._buffer.clear)
+
+        with mock.patch.object(dispatch, "push_verification_email", return_value=1) as push, \
+                mock.patch.object(dispatch, "publish_task", side_effect=RedisConnectionError("Connection refused")), \
+                mock.patch.object(dispatch.enqueue_breaker, "allow", return_value=True):
+            dispatch.deliver_verification_email("frank@example.com", "123456")
+
+        push.assert_called_once()
+        self.assertEqual(len(dispatch._buffer), 0)
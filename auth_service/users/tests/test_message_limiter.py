@@ -0,0 +1,49 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase
+
+from services.auth.message_limiter import RedisMessageLimiter
+from users.models import DailyMessage
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+@skipIf(fakeredis is None, "fakeredis is not installed")
+class RedisMessageLimiterTests(SimpleTestCase):
+
+    def setUp(self) -> None:
+        patcher = mock.patch(
+            "services.auth.message_limiter.get_redis_connection",
+            return_value=fakeredis.FakeRedis()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = RedisMessageLimiter()
+        self.limiter.fallback = mock.Mock()
+
+    def send(self, limit: int) -> str:
+        limit_obj = SimpleNamespace(
+            limit=limit,
+            reset_time=timedelta(days=1),
+            expiration_time=timedelta(0)
+        )
+        with mock.patch.object(DailyMessage, "get_limit_info", return_value=limit_obj):
+            return self.limiter.send_message("ivan@example.com")
+
+    def test_zero_limit_rejects_without_falling_back(self) -> None:
+        response = self.send(limit=0)
+
+        self.assertNotEqual(response, DailyMessage.SUCCESS_MESSAGE)
+        self.limiter.fallback.send_message.assert_not_called()
+
+    def test_sends_stop_at_the_limit(self) -> None:
+        responses = [self.send(limit=2) for _ in range(3)]
+
+        self.assertEqual(responses[:2], [DailyMessage.SUCCESS_MESSAGE] * 2)
+        self.assertNotEqual(responses[2], DailyMessage.SUCCESS_MESSAGE)
+        self.limiter.fallback.send_message.assert_not_called()
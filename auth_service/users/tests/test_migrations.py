@@ -0,0 +1,43 @@
+import importlib
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.db import connection
+from django.test import TestCase
+from django.utils.timezone import now
+
+from users.models import CustomUser
+
+lowercase_emails = importlib.import_module("users.migrations.0008_lowercase_emails").lowercase_emails
+
+
+class LowercaseEmailsMigrationTests(TestCase):
+
+    def create(self, email: str, **fields) -> CustomUser:
+        # Bypasses create_user(), which now normalizes the email.
+        user = CustomUser(email=email, username=email, **fields)
+        user.save()
+        return user
+
+    def test_lowercases_emails_and_keeps_one_per_duplicate_group(self) -> None:
+        single = self.create("Alice@Example.com")
+        stale = self.create("Bob@Example.com", last_login=now() - timedelta(days=1))
+        recent = self.create("BOB@example.com", last_login=now())
+        lower = self.create("carol@example.com")
+        upper = self.create("Carol@example.com", last_login=now())
+
+        lowercase_emails(None, SimpleNamespace(connection=connection))
+
+        emails = {
+            user.pk: user.email
+            for user in CustomUser.objects.filter(pk__in=[
+                single.pk, stale.pk, recent.pk, lower.pk, upper.pk
+            ])
+        }
+        self.assertEqual(emails, {
+            single.pk: "alice@example.com",
+            stale.pk: "Bob@Example.com",
+            recent.pk: "bob@example.com",
+            lower.pk: "carol@example.com",
+            upper.pk: "Carol@example.com",
+        })
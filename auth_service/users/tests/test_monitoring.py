@@ -0,0 +1,19 @@
+from functools import partial
+from unittest import mock
+
+from celery import current_app
+from django.test import SimpleTestCase
+
+from services.monitoring.queues import get_queue_depths
+
+
+class QueueDepthTests(SimpleTestCase):
+
+    def test_unreachable_broker_reports_every_queue(self) -> None:
+        # Nothing listens on port 1, so every connection attempt is refused.
+        connection_for_read = partial(current_app.connection_for_read, "redis://127.0.0.1:1/0")
+        with mock.patch.object(current_app, "connection_for_read", connection_for_read):
+            depths = get_queue_depths()
+
+        for queue in current_app.conf.task_queues:
+            self.assertEqual(depths[queue.name], -1)
@@ -0,0 +1,81 @@
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from services.auth.tokens import TOKEN_VERSION_CLAIM, RefreshToken
+from users.models import CustomUser
+
+
+class PasswordTokenVersionTests(TestCase):
+    """
+    The token version must only change when the password is changed or
+    reset, and the new value must reach the database.
+    """
+    password = "correct-horse-battery"
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            email="alice@example.com",
+            username="alice",
+            password=self.password
+        )
+
+    def login(self, password: str = None) -> dict:
+        response = self.client.post(
+            "/api/v1/users/login/",
+            {"email": self.user.email, "password": password or self.password},
+            secure=True
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_hash_upgrade_during_login_keeps_tokens_valid(self) -> None:
+        # A hash from a non-default hasher is upgraded by check_password(),
+        # which calls set_password() and saves only the password.
+        CustomUser.objects.filter(pk=self.user.pk).update(
+            password=make_password(self.password, hasher="pbkdf2_sha1")
+        )
+
+        tokens = self.login()
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+        self.assertEqual(AccessToken(tokens["access"])[TOKEN_VERSION_CLAIM], self.user.token_version)
+        RefreshToken(tokens["refresh"]).verify()
+
+        response = self.client.get(
+            "/api/v1/users/me/",
+            HTTP_AUTHORIZATION=f"Bearer {tokens['access']}",
+            secure=True
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def test_change_password_revokes_earlier_tokens(self) -> None:
+        tokens = self.login()
+
+        # The cached user is invalidated once the change commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/users/change-password/",
+                {
+                    "old_password": self.password,
+                    "new_password": "new-password-123",
+                    "confirm_password": "new-password-123"
+                },
+                HTTP_AUTHORIZATION=f"Bearer {tokens['access']}",
+                secure=True
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+        self.assertTrue(self.user.check_password("new-password-123"))
+
+        response = self.client.get(
+            "/api/v1/users/me/",
+            HTTP_AUTHORIZATION=f"Bearer {tokens['access']}",
+            secure=True
+        )
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,53 @@
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from users.models import CustomUser
+
+
+class UpdateProfileTests(TestCase):
+    """
+    ``request.user`` can be a cached copy of the user, so updating the
+    profile must not write back columns it did not change.
+    """
+    password = "correct-horse-battery"
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            email="bob@example.com",
+            username="bob",
+            password=self.password
+        )
+        response = self.client.post(
+            "/api/v1/users/login/",
+            {"email": self.user.email, "password": self.password},
+            secure=True
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+
+    def test_update_keeps_concurrent_changes(self) -> None:
+        # Loads the user into the cache.
+        response = self.client.get("/api/v1/users/me/", secure=True)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        # Changed behind the cache's back, as by a concurrent request whose
+        # invalidation has not arrived yet.
+        new_password = make_password("another-password")
+        CustomUser.objects.filter(pk=self.user.pk).update(
+            password=new_password,
+            is_verified=True
+        )
+
+        response = self.client.put(
+            "/api/v1/update-profile/",
+            {"bio": "Hello"},
+            format="multipart",
+            secure=True
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bio, "Hello")
+        self.assertEqual(self.user.password, new_password)
+        self.assertTrue(self.user.is_verified)
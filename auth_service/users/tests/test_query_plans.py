@@ -0,0 +1,68 @@
+from django.db import connection
+from django.test import TestCase
+from django.utils.timezone import now
+
+from users.models import DailyMessage, VerificationCode
+
+
+class QueryPlanTests(TestCase):
+    """
+    The send-limit and code lookups must be answered from the composite
+    indexes, not by scanning the tables.
+
+    The tables are seeded with enough rows for the planner to prefer an
+    index and then analyzed, so the plans match what a large table gets.
+    """
+    rows = 200_000
+    emails = 20_000
+    email = "user42@example.com"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {DailyMessage._meta.db_table} (email, message_sent_at)
+                SELECT 'user' || (g %% %s) || '@example.com',
+                       now() - (g %% 2880) * interval '1 minute'
+                FROM generate_series(1, %s) AS g
+                """,
+                [cls.emails, cls.rows]
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {VerificationCode._meta.db_table}
+                    (email, verification_code, is_verified, created_at)
+                SELECT 'user' || (g %% %s) || '@example.com',
+                       lpad((g %% 1000000)::text, 6, '0'),
+                       g %% 10 <> 0,
+                       now() - (g %% 2880) * interval '1 minute'
+                FROM generate_series(1, %s) AS g
+                """,
+                [cls.emails, cls.rows]
+            )
+            cursor.execute(f"ANALYZE {DailyMessage._meta.db_table}")
+            cursor.execute(f"ANALYZE {VerificationCode._meta.db_table}")
+
+    def assertUsesIndex(self, queryset, index_name: str) -> None:
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("Seq Scan", plan)
+
+    def test_daily_limit_uses_email_sent_index(self) -> None:
+        today_start, today_end = DailyMessage.today_range()
+        queryset = DailyMessage.objects.filter(
+            email=self.email,
+            message_sent_at__gte=today_start,
+            message_sent_at__lt=today_end
+        )
+        self.assertUsesIndex(queryset, "users_dailymsg_email_sent_idx")
+
+    def test_code_lookup_uses_partial_index(self) -> None:
+        queryset = VerificationCode.objects.filter(
+            email=self.email,
+            verification_code="000042",
+            is_verified=False,
+            created_at__gt=now() - VerificationCode.LIFETIME
+        )
+        self.assertUsesIndex(queryset, "users_vcode_email_code_unv_idx")
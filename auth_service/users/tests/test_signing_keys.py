@@ -0,0 +1,61 @@
+import threading
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils.timezone import now
+
+from services.auth.signing_keys import (
+    create_signing_key,
+    get_active_signing_key,
+    invalidate_signing_keys,
+    rotate_signing_keys
+)
+from users.models import SigningKey
+
+
+@override_settings(JWKS_CACHE_MAX_AGE=600, JWKS_STALE_WHILE_REVALIDATE=300)
+class RotateSigningKeysTests(TestCase):
+
+    def test_new_key_waits_for_stale_key_sets(self) -> None:
+        create_signing_key(activates_at=now() - timedelta(days=1))
+
+        new_key = rotate_signing_keys(force=True)
+
+        # Key sets can be cached for max-age and then served stale for
+        # stale-while-revalidate, so the key only signs after both.
+        lead = new_key.activates_at - now()
+        self.assertGreater(lead, timedelta(seconds=890))
+        self.assertLessEqual(lead, timedelta(seconds=900))
+
+
+class ActiveSigningKeyTests(TransactionTestCase):
+
+    def setUp(self) -> None:
+        invalidate_signing_keys()
+        self.addCleanup(invalidate_signing_keys)
+
+    def test_concurrent_first_requests_create_one_key(self) -> None:
+        threads = 8
+        barrier = threading.Barrier(threads)
+        kids = []
+        errors = []
+
+        def sign() -> None:
+            try:
+                barrier.wait()
+                kids.append(get_active_signing_key().kid)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=sign) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(SigningKey.objects.count(), 1)
+        self.assertEqual(set(kids), {SigningKey.objects.get().kid})
@@ -0,0 +1,46 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from services.auth.user_cache import UserCache
+from users.models import CustomUser
+
+
+class UserCacheLocalTierTests(TestCase):
+    """
+    A row loaded before an invalidation must not be put back into the
+    per-process tier after it.
+    """
+
+    def setUp(self) -> None:
+        self.cache = UserCache(local_size=10, local_ttl=30, ttl=60)
+        self.user = CustomUser.objects.create_user(
+            email="grace@example.com",
+            username="grace",
+            password="correct-horse-battery"
+        )
+
+    def test_load_is_cached_locally(self) -> None:
+        self.cache.get(self.user.pk)
+        self.assertIsNotNone(self.cache._get_local(self.user.pk))
+        self.assertEqual(self.cache._loading, {})
+
+    def test_load_racing_an_invalidation_is_not_cached_locally(self) -> None:
+        stale = CustomUser.objects.get(pk=self.user.pk)
+
+        def read_then_invalidate(user_id):
+            # The broadcast for a concurrent save arrives while the old row
+            # is on its way back.
+            self.cache.discard_local(user_id)
+            return stale, None
+
+        with mock.patch.object(self.cache, "_get_shared", side_effect=read_then_invalidate):
+            self.assertEqual(self.cache.get(self.user.pk).pk, self.user.pk)
+
+        self.assertIsNone(self.cache._get_local(self.user.pk))
+        self.assertEqual(self.cache._loading, {})
+
+    def test_failed_load_is_forgotten(self) -> None:
+        with self.assertRaises(CustomUser.DoesNotExist):
+            self.cache.get(self.user.pk + 1000)
+        self.assertEqual(self.cache._loading, {})
@@ -0,0 +1,198 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from django.core import mail
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from services.auth import reset_password_send_code
+from services.auth.code_store import get_code_store
+from services.auth.message_limiter import get_message_limiter
+from users.models import CustomUser, OutboxMessage, VerificationCode
+from users.tasks import send_verification_email
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+@override_settings(
+    VERIFICATION_CODE_STORE="services.auth.code_store.DatabaseCodeStore",
+    EMAIL_DELIVERY_MODE="task",
+    EMAIL_OUTBOX_ENABLED=True
+)
+class SendCodeTests(TestCase):
+    """
+    A send-code request creates its code exactly once and hands it to the
+    email task, which only delivers it.
+    """
+    email = "dave@example.com"
+
+    def setUp(self) -> None:
+        get_code_store.cache_clear()
+        self.addCleanup(get_code_store.cache_clear)
+
+    def test_reset_writes(self) -> None:
+        VerificationCode.objects.create(email=self.email, verification_code="111111")
+
+        with CaptureQueriesContext(connection) as queries:
+            reset_password_send_code(self.email)
+
+        writes = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith(WRITE_STATEMENTS)
+        ]
+        # The previous code is deleted, the new one inserted and the email
+        # task recorded in the outbox, inside one savepoint.
+        self.assertEqual(len(writes), 3, writes)
+        self.assertEqual(len(queries), 5, [query["sql"] for query in queries.captured_queries])
+
+        code = VerificationCode.objects.get(email=self.email)
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.args, [self.email, code.verification_code])
+
+    def test_task_queued_without_a_code_creates_one(self) -> None:
+        @contextmanager
+        def smtp_connection():
+            yield mail.get_connection("django.core.mail.backends.locmem.EmailBackend")
+
+        throttle = mock.Mock(**{"acquire.return_value": 0})
+        with mock.patch("users.tasks.emails.smtp_connection", smtp_connection), \
+                mock.patch("users.tasks.emails.get_email_throttle", return_value=throttle):
+            send_verification_email.apply(args=(self.email,))
+
+        code = VerificationCode.objects.get(email=self.email)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(code.verification_code, mail.outbox[0].body)
+
+
+@override_settings(
+    VERIFICATION_CODE_STORE="services.auth.code_store.DatabaseCodeStore",
+    MESSAGE_LIMITER_BACKEND="services.auth.message_limiter.DatabaseMessageLimiter",
+    EMAIL_DELIVERY_MODE="task",
+    EMAIL_OUTBOX_ENABLED=True
+)
+class EmailCaseTests(TestCase):
+    """
+    Codes, send limits and coalescing are keyed by the normalized email, so
+    the case the address is typed in does not matter.
+    """
+
+    def setUp(self) -> None:
+        get_code_store.cache_clear()
+        get_message_limiter.cache_clear()
+        self.addCleanup(get_code_store.cache_clear)
+        self.addCleanup(get_message_limiter.cache_clear)
+        self.client = APIClient()
+
+    def send_code(self, email: str):
+        return self.client.post(
+            "/api/v1/users/send-verification-code/",
+            {"email": email},
+            secure=True
+        )
+
+    def test_case_variants_share_one_code_and_quota(self) -> None:
+        with mock.patch("users.views.verfication.send_verification_code.coalesce_request",
+                        side_effect=lambda key, send: send()) as coalesce_request:
+            self.assertEqual(self.send_code("Grace@Example.com").status_code, 200)
+            response = self.send_code("grace@example.com")
+
+        # The second request is inside the cooldown of the first.
+        self.assertEqual(response.status_code, 429, response.content)
+        self.assertEqual(
+            [call.args[0] for call in coalesce_request.call_args_list],
+            ["send_verification_code:grace@example.com"] * 2
+        )
+        self.assertEqual(
+            list(VerificationCode.objects.values_list("email", flat=True)),
+            ["grace@example.com"]
+        )
+
+    def test_register_and_login_ignore_case(self) -> None:
+        VerificationCode.objects.create(email="grace@example.com", verification_code="123456")
+
+        response = self.client.post(
+            "/api/v1/users/register/",
+            {
+                "email": "Grace@Example.com",
+                "verification_code": "123456",
+                "username": "grace",
+                "password": "correct-horse-battery"
+            },
+            secure=True
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(CustomUser.objects.filter(email="grace@example.com").exists())
+
+        response = self.client.post(
+            "/api/v1/users/login/",
+            {"email": "GRACE@example.com", "password": "correct-horse-battery"},
+            secure=True
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+
+@override_settings(VERIFICATION_CODE_STORE="services.auth.code_store.DatabaseCodeStore")
+class ConsumeCodeTests(TestCase):
+    """
+    The one-time code is only used up together with the write it
+    authorizes.
+    """
+    email = "heidi@example.com"
+
+    def setUp(self) -> None:
+        get_code_store.cache_clear()
+        self.addCleanup(get_code_store.cache_clear)
+        self.client = APIClient()
+        VerificationCode.objects.create(email=self.email, verification_code="123456")
+
+    def register(self, verification_code: str = "123456"):
+        return self.client.post(
+            "/api/v1/users/register/",
+            {
+                "email": self.email,
+                "verification_code": verification_code,
+                "username": "heidi",
+                "password": "correct-horse-battery"
+            },
+            secure=True
+        )
+
+    def test_failed_register_keeps_the_code(self) -> None:
+        with mock.patch.object(
+            CustomUser.objects, "create_user", side_effect=IntegrityError("duplicate key")
+        ):
+            response = self.register()
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertFalse(VerificationCode.objects.get(email=self.email).is_verified)
+
+        self.assertEqual(self.register().status_code, 201)
+        self.assertTrue(VerificationCode.objects.get(email=self.email).is_verified)
+
+    def test_wrong_code_creates_no_user(self) -> None:
+        response = self.register(verification_code="654321")
+
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertIn("verification_code", response.json())
+        self.assertFalse(CustomUser.objects.filter(email=self.email).exists())
+
+    def test_wrong_code_keeps_the_password(self) -> None:
+        user = CustomUser.objects.create_user(
+            email=self.email, username="heidi", password="correct-horse-battery"
+        )
+
+        response = self.client.post(
+            "/api/v1/users/reset-password/",
+            {
+                "email": self.email,
+                "verification_code": "654321",
+                "new_password": "new-password-123"
+            },
+            secure=True
+        )
+
+        self.assertEqual(response.status_code, 400, response.content)
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("correct-horse-battery"))
+        self.assertEqual(user.token_version, 0)
@@ -4,5 +4,6 @@ urlpatterns = [
     path("", include("users.urls.auth")),
     path("", include("users.urls.password")),
     path("", include("users.urls.verfication")),
-    path("", include("users.urls.user"))
+    path("", include("users.urls.user")),
+    path("", include("users.urls.monitoring"))
 ]
\ No newline at end of file
@@ -0,0 +1,11 @@
+from django.urls import path
+from users.views import *
+
+urlpatterns = [
+    # Monitoring endpoints
+    path(
+        "metrics/",
+        MetricsView.as_view(),
+        name="metrics"
+    ),
+]
@@ -2,3 +2,4 @@ from .auth import *
 from .password import *
 from .verfication import *
 from .user import *
+from .monitoring import *
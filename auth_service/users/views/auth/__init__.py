@@ -2,4 +2,5 @@ from .register import *
 from .login import *
 from .logout import *
 from .token_view import *
-from .token import *
\ No newline at end of file
+from .token import *
+from .jwks import *
\ No newline at end of file
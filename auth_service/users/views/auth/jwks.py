@@ -0,0 +1,49 @@
+import logging
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView, Response, status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from services.auth.signing_keys import get_jwks, uses_signing_keys
+
+__all__ = ["JWKSView"]
+
+logger = logging.getLogger(__name__)
+
+
+class JWKSView(APIView):
+    """
+    API view that publishes the public signing keys as a JSON Web Key Set.
+
+    Other services verify access tokens locally with these keys, picking the
+    key by the token's ``kid`` header. The response may be cached for
+    ``JWKS_CACHE_MAX_AGE`` seconds and served stale for another
+    ``JWKS_STALE_WHILE_REVALIDATE``: new keys are published that long before
+    they start signing.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        tags=["Authentication"],
+        operation_summary="Get the token signing keys",
+        operation_description=(
+            "Returns the public keys used to sign JWTs in JWKS format. "
+            "The key set is empty when tokens are signed with HS256."
+        ),
+        responses={
+            200: openapi.Response(description="Key set retrieved successfully."),
+        }
+    )
+    def get(self, request, *args, **kwargs):
+        jwks = get_jwks() if uses_signing_keys() else {"keys": []}
+        response = Response(jwks, status=status.HTTP_200_OK)
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.JWKS_CACHE_MAX_AGE,
+            stale_while_revalidate=settings.JWKS_STALE_WHILE_REVALIDATE
+        )
+        return response
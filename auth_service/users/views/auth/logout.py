@@ -1,10 +1,10 @@
 import logging
 from rest_framework.views import APIView, Response, status
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from services.auth.tokens import RefreshToken
 from users.serializers.auth import LogoutSerializer
 
 __all__ = ["LogoutView"]
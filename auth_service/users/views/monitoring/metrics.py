@@ -0,0 +1,42 @@
+import logging
+from rest_framework.views import APIView, Response, status
+from rest_framework.permissions import IsAdminUser
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from services.monitoring.queues import get_queue_depths
+from utils.circuit_breaker import get_breaker_states
+from utils.metrics import get_metrics
+
+__all__ = ["MetricsView"]
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsView(APIView):
+    """
+    API view that reports the current task queue depths, the counters and
+    gauges recorded by the service, and the circuit breaker states of the
+    process serving the request.
+
+    Only staff users can access this view.
+    """
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        tags=["Monitoring"],
+        operation_summary="Get service metrics",
+        operation_description=(
+            "Returns the number of tasks waiting in each Celery queue, "
+            "together with the recorded counters and gauges."
+        ),
+        responses={
+            200: openapi.Response(description="Metrics retrieved successfully."),
+            403: openapi.Response(description="Only staff users can view metrics."),
+        }
+    )
+    def get(self, request, *args, **kwargs):
+        metrics = get_metrics()
+        metrics["queues"] = get_queue_depths()
+        metrics["circuit_breakers"] = get_breaker_states()
+        return Response(metrics, status=status.HTTP_200_OK)
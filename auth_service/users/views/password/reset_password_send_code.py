@@ -1,10 +1,13 @@
 import logging
+from django.utils.translation import get_language_from_request
 from rest_framework.views import APIView, Response, status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from users.serializers.password import ResetPasswordSendCodeSerializer
 from users.models import DailyMessage
+from services.auth.message_limiter import get_message_limiter
+from services.auth.coalesce import coalesce_request
 
 __all__ = ["ResetPasswordSendCodeView"]
 
@@ -14,6 +17,8 @@ logger = logging.getLogger(__name__)
 class ResetPasswordSendCodeView(APIView):
     """
     View to handle password reset requests by sending a reset code to the user's email.
+    Repeated requests for the same email within ``SEND_CODE_COALESCE_WINDOW``
+    seconds get the first request's response.
     """
 
     @swagger_auto_schema(
@@ -23,7 +28,9 @@ class ResetPasswordSendCodeView(APIView):
         operation_description="Sends a verification code to the user's email address to initiate the password reset process.",
         responses={
             200: openapi.Response(description="Password reset code sent successfully."),
+            202: openapi.Response(description="A code for this email is already being sent."),
             400: openapi.Response(description="Invalid email or validation error."),
+            429: openapi.Response(description="Too many requests. Daily limit reached."),
         },
     )
     def post(self, request) -> Response:
@@ -38,22 +45,35 @@ class ResetPasswordSendCodeView(APIView):
         """
         logger.info("Password reset request received for email: %s", request.data.get("email"))
 
-        email = request.data.get("email")
-
         serializer = ResetPasswordSendCodeSerializer(data=request.data)
 
         if serializer.is_valid():
-            message_response = DailyMessage.send_message(email)
-
-            if message_response != "Message sent successfully!":
-                return Response(
-                    {"error": message_response},
-                    status=status.HTTP_429_TOO_MANY_REQUESTS
-                )
-
-            response_data = serializer.save()
-            logger.info("Password reset code sent successfully to email: %s", request.data.get("email"))
-            return Response(response_data, status=status.HTTP_200_OK)
+            email = serializer.validated_data["email"]
+            data, status_code = coalesce_request(
+                f"reset_password_send_code:{email}",
+                lambda: self.send_code(serializer, email)
+            )
+            return Response(data, status=status_code)
 
         logger.warning("Password reset failed: %s", serializer.errors)   
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def send_code(self, serializer: ResetPasswordSendCodeSerializer, email: str) -> tuple:
+        """
+        Checks the daily limit and sends a new password reset code.
+
+        Args:
+            serializer (ResetPasswordSendCodeSerializer): The validated serializer.
+            email (str): The validated email address.
+
+        Returns:
+            tuple: The response data and status code.
+        """
+        message_response = get_message_limiter().send_message(email)
+
+        if message_response != DailyMessage.SUCCESS_MESSAGE:
+            return {"error": message_response}, status.HTTP_429_TOO_MANY_REQUESTS
+
+        response_data = serializer.save(locale=get_language_from_request(self.request))
+        logger.info("Password reset code sent successfully to email: %s", email)
+        return response_data, status.HTTP_200_OK
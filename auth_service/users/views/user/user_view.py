@@ -42,8 +42,7 @@ class UserProfileView(APIView):
         }
     )
     def get(self, request, *args, **kwargs):
-        user = request.user
-        serializer = UserSerializer(user)
+        serializer = UserSerializer(request.user)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
 
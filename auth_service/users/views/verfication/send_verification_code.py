@@ -1,11 +1,13 @@
 import logging
+from django.utils.translation import get_language_from_request
 from rest_framework.views import APIView, Response, status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from users.serializers.verification import SendVerificationCodeSerializer
 from users.models import DailyMessage
-from users.tasks import send_verification_email
+from services.auth.message_limiter import get_message_limiter
+from services.auth.coalesce import coalesce_request
 
 __all__ = ["SendVerificationCodeView"]
 
@@ -18,7 +20,8 @@ class SendVerificationCodeView(APIView):
 
     This view receives a POST request with an email address and sends a verification code
     to that email. It also ensures the number of requests is limited based on the daily
-    message sending constraints.
+    message sending constraints. Repeated requests for the same email within
+    ``SEND_CODE_COALESCE_WINDOW`` seconds get the first request's response.
     """
 
     @swagger_auto_schema(
@@ -31,6 +34,7 @@ class SendVerificationCodeView(APIView):
         ),
         responses={
             200: openapi.Response(description="Verification code sent successfully."),
+            202: openapi.Response(description="A code for this email is already being sent."),
             400: openapi.Response(description="Invalid input data."),
             429: openapi.Response(description="Too many requests. Daily limit reached."),
         },
@@ -56,27 +60,11 @@ class SendVerificationCodeView(APIView):
             email = serializer.validated_data["email"]
             logger.info("Email validated: %s", email)
 
-            message_response = DailyMessage.send_message(email)
-
-            if message_response != "Message sent successfully!":
-                logger.warning(
-                    "Too many requests for email: %s. Response: %s", 
-                    email,
-                    message_response
-                )
-
-                return Response(
-                    {"error": message_response},
-                    status=status.HTTP_429_TOO_MANY_REQUESTS
-                )
-
-            send_verification_email.delay(email)
-            logger.info("Verification code sent to email: %s", email)
-
-            return Response(
-                {"message": "Verification code sent."},
-                status=status.HTTP_200_OK
+            data, status_code = coalesce_request(
+                f"send_verification_code:{email}",
+                lambda: self.send_code(serializer, email)
             )
+            return Response(data, status=status_code)
 
         logger.error(
             "Invalid data provided: %s",
@@ -86,4 +74,30 @@ class SendVerificationCodeView(APIView):
         return Response(
             serializer.errors,
             status=status.HTTP_400_BAD_REQUEST
-        )
\ No newline at end of file
+        )
+
+    def send_code(self, serializer: SendVerificationCodeSerializer, email: str) -> tuple:
+        """
+        Checks the daily limit and sends a new verification code.
+
+        Args:
+            serializer (SendVerificationCodeSerializer): The validated serializer.
+            email (str): The validated email address.
+
+        Returns:
+            tuple: The response data and status code.
+        """
+        message_response = get_message_limiter().send_message(email)
+
+        if message_response != DailyMessage.SUCCESS_MESSAGE:
+            logger.warning(
+                "Too many requests for email: %s. Response: %s", 
+                email,
+                message_response
+            )
+            return {"error": message_response}, status.HTTP_429_TOO_MANY_REQUESTS
+
+        serializer.save(locale=get_language_from_request(self.request))
+        logger.info("Verification code sent to email: %s", email)
+
+        return {"message": "Verification code sent."}, status.HTTP_200_OK
@@ -1 +1,4 @@
-from .verification_code import *
\ No newline at end of file
+from .verification_code import *
+from .metrics import *
+from .circuit_breaker import *
+from .bloom_filter import *
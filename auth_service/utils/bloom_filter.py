@@ -0,0 +1,73 @@
+import math
+import hashlib
+import threading
+from typing import Iterable, Iterator
+
+__all__ = ["BloomFilter"]
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter for strings.
+
+    Membership tests never give false negatives: if ``item in bloom`` is
+    False, the item was never added. They may give false positives at about
+    ``error_rate`` once ``capacity`` items have been added.
+
+    Args:
+        capacity (int): The number of items the filter is sized for.
+        error_rate (float): The false positive rate at full capacity.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], capacity: int, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Builds a filter containing the given items.
+
+        Args:
+            items (Iterable[str]): The items to add.
+            capacity (int): The number of items the filter is sized for.
+            error_rate (float): The false positive rate at full capacity.
+
+        Returns:
+            BloomFilter: The filled filter.
+        """
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: two 64-bit halves of one digest generate every index.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """
+        Adds the item to the filter.
+
+        Args:
+            item (str): The item to add.
+        """
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = ["publish", "subscribe", "ensure_listener"]
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "auth_service:broadcast"
+RECONNECT_DELAY = 1
+
+_handlers: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+_lock = threading.Lock()
+_listener_pid: int | None = None
+
+
+def publish(topic: str, payload: str = "") -> None:
+    """
+    Broadcasts a message on the given topic to every process subscribed to it.
+
+    Publishing is best effort: if Redis is unavailable the error is logged
+    and subscribers rely on their own expiry instead.
+
+    Args:
+        topic (str): The topic name, e.g. "daily_message_limit".
+        payload (str): An optional payload passed to the handlers.
+    """
+    message = json.dumps({"topic": topic, "payload": payload})
+    try:
+        get_redis_connection("default").publish(CHANNEL, message)
+    except RedisError:
+        logger.exception(f"Failed to publish broadcast for topic: {topic}")
+
+
+def subscribe(topic: str, handler: Callable[[str], None]) -> None:
+    """
+    Registers a handler for the topic.
+
+    Handlers run on the listener thread, so they must be quick and thread-safe.
+    Call ``ensure_listener`` from the code path that relies on the broadcasts.
+
+    Args:
+        topic (str): The topic name.
+        handler (Callable[[str], None]): Called with the payload of each message.
+    """
+    with _lock:
+        if handler not in _handlers[topic]:
+            _handlers[topic].append(handler)
+
+
+def ensure_listener() -> None:
+    """
+    Starts the listener thread for the current process if it is not running.
+
+    The process id is tracked so that forked workers (gunicorn, Celery prefork)
+    start their own listener instead of relying on the parent's thread.
+    """
+    global _listener_pid
+
+    if _listener_pid == os.getpid():
+        return
+
+    with _lock:
+        if _listener_pid == os.getpid():
+            return
+        _listener_pid = os.getpid()
+        thread = threading.Thread(
+            target=_listen,
+            name="broadcast-listener",
+            daemon=True
+        )
+        thread.start()
+
+
+def _dispatch(raw: bytes) -> None:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        logger.warning("Ignoring malformed broadcast message.")
+        return
+
+    for handler in list(_handlers.get(message.get("topic"), ())):
+        try:
+            handler(message.get("payload", ""))
+        except Exception:
+            logger.exception(f"Broadcast handler failed for topic: {message.get('topic')}")
+
+
+def _listen() -> None:
+    while True:
+        try:
+            pubsub = get_redis_connection("default").pubsub(
+                ignore_subscribe_messages=True
+            )
+            pubsub.subscribe(CHANNEL)
+            logger.info(f"Listening for broadcasts on channel: {CHANNEL}")
+
+            while True:
+                message = pubsub.get_message(timeout=RECONNECT_DELAY)
+                if message and message["type"] == "message":
+                    _dispatch(message["data"])
+        except RedisError:
+            logger.warning(
+                f"Broadcast listener disconnected, retrying in {RECONNECT_DELAY}s."
+            )
+            time.sleep(RECONNECT_DELAY)
@@ -0,0 +1,111 @@
+import time
+import logging
+import threading
+from typing import Dict
+
+from utils.metrics import set_gauge
+
+__all__ = ["CircuitBreaker", "get_breaker_states"]
+
+logger = logging.getLogger(__name__)
+
+_breakers: Dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitBreaker:
+    """
+    A per-process circuit breaker for calls to an unreliable dependency.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects calls without trying them. After ``recovery_timeout`` seconds
+    it lets a single probe call through (half-open): a success closes it,
+    a failure opens it again. State changes are logged and recorded as the
+    ``circuit_breaker.<name>.state`` gauge (0 closed, 1 half-open, 2 open).
+
+    Usage::
+
+        if breaker.allow():
+            try:
+                call()
+            except SomeError:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+    """
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        _breakers[name] = self
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Tells whether a call may be attempted now.
+
+        Returns:
+            bool: True if the breaker is closed, or if it is time for a probe.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            # Let one probe through; others keep failing fast until it reports.
+            self._opened_at = time.monotonic()
+            self._transition(self.HALF_OPEN)
+            return True
+
+    def record_success(self) -> None:
+        """
+        Records a successful call and closes the breaker.
+        """
+        with self._lock:
+            self._failures = 0
+            if self._state != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """
+        Records a failed call and opens the breaker once the threshold is reached.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                if self._state != self.OPEN:
+                    self._transition(self.OPEN)
+
+    def _transition(self, state: str) -> None:
+        logger.warning(f"Circuit breaker {self.name}: {self._state} -> {state}")
+        self._state = state
+        # The dependency guarded by the breaker may be Redis itself, so the
+        # gauge is written off the caller's thread.
+        threading.Thread(
+            target=set_gauge,
+            args=(f"circuit_breaker.{self.name}.state", self.STATE_VALUES[state]),
+            daemon=True
+        ).start()
+
+
+def get_breaker_states() -> Dict[str, str]:
+    """
+    Returns the state of every circuit breaker in this process.
+
+    Returns:
+        dict: The breaker name mapped to its state.
+    """
+    return {name: breaker.state for name, breaker in _breakers.items()}
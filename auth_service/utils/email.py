@@ -0,0 +1,17 @@
+__all__ = ["normalize_email"]
+
+
+def normalize_email(email: str) -> str:
+    """
+    Returns the canonical form of an email address.
+
+    Verification codes, send limits and request coalescing are keyed by this
+    form, so "A@x.com" and "a@x.com" share one code and one quota.
+
+    Args:
+        email (str): The email address as entered.
+
+    Returns:
+        str: The lowercased email address.
+    """
+    return email.strip().lower()
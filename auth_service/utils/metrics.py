@@ -0,0 +1,67 @@
+import logging
+from typing import Dict
+
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+__all__ = ["increment", "set_gauge", "get_metrics"]
+
+logger = logging.getLogger(__name__)
+
+COUNTERS_KEY = "metrics:counters"
+GAUGES_KEY = "metrics:gauges"
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """
+    Adds ``amount`` to the counter with the given name.
+
+    Counters are shared by every process through Redis. Recording is best
+    effort: if Redis is unavailable the error is logged and the sample is lost.
+
+    Args:
+        name (str): The counter name, e.g. "email.sent".
+        amount (int): The value to add.
+    """
+    if not amount:
+        return
+    try:
+        get_redis_connection("default").hincrby(COUNTERS_KEY, name, amount)
+    except RedisError:
+        logger.warning(f"Failed to record metric counter: {name}")
+
+
+def set_gauge(name: str, value: float) -> None:
+    """
+    Sets the gauge with the given name to its latest value.
+
+    Args:
+        name (str): The gauge name, e.g. "queue.verification.depth".
+        value (float): The current value.
+    """
+    try:
+        get_redis_connection("default").hset(GAUGES_KEY, name, value)
+    except RedisError:
+        logger.warning(f"Failed to record metric gauge: {name}")
+
+
+def get_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    Returns every recorded counter and gauge.
+
+    Returns:
+        dict: ``{"counters": {...}, "gauges": {...}}``, empty if Redis is
+        unavailable.
+    """
+    try:
+        client = get_redis_connection("default")
+        counters = client.hgetall(COUNTERS_KEY)
+        gauges = client.hgetall(GAUGES_KEY)
+    except RedisError:
+        logger.warning("Failed to read metrics from Redis.")
+        return {"counters": {}, "gauges": {}}
+
+    return {
+        "counters": {name.decode(): int(value) for name, value in counters.items()},
+        "gauges": {name.decode(): float(value) for name, value in gauges.items()},
+    }
@@ -9,8 +9,20 @@ python manage.py migrate --noinput
 echo "👤 Creating superuser if not exists..."
 python create_superuser.py
 
-echo "🚀 Starting Celery worker in background..."
-celery -A auth_service worker --loglevel=info &
+echo "🚀 Starting Celery workers in background..."
+# Verification codes have dedicated workers so bulk work never delays them
+celery -A auth_service worker -Q verification -n verification@%h \
+    --concurrency="${CELERY_VERIFICATION_CONCURRENCY:-4}" --loglevel=info &
+celery -A auth_service worker -Q default,bulk -n bulk@%h \
+    --concurrency="${CELERY_BULK_CONCURRENCY:-1}" --loglevel=info &
+
+if [ "$EMAIL_DELIVERY_MODE" = "asyncio" ]; then
+    echo "📨 Starting asyncio email worker in background..."
+    python manage.py run_email_worker &
+fi
+
+echo "⏰ Starting Celery beat in background..."
+celery -A auth_service beat --loglevel=info &
 
 echo "🌐 Starting Django server..."
 python manage.py runserver 0.0.0.0:8000